@@ -11,6 +11,7 @@ for module_name in [
     "ownership_disclosure_tools",
     "periodic_report_tools",
     "securities_filing_tools",
+    "watchlist_tools",
 ]:
     importlib.import_module(f"mcp_opendart.tools.{module_name}")
 
@@ -7,6 +7,8 @@ import zipfile
 import io
 
 from ..config import opendart_config, OpenDartConfig
+from ..utils.rate_limiter import get_rate_limiter
+from ..utils.response_cache import cache_key, get_response_cache
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -21,6 +23,9 @@ class OpenDartClient:
         
         if not self.api_key:
             raise ValueError("OpenDART API 키가 설정되지 않았습니다.")
+
+        self.rate_limiter = get_rate_limiter(self.config)
+        self.response_cache = get_response_cache(self.config)
     
     def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None, method: str = "GET") -> Dict[str, Any]:
         """API 요청을 보내고 응답을 반환합니다."""
@@ -39,6 +44,7 @@ class OpenDartClient:
         logger.debug(f"Parameters: {params}")
         logger.debug("====================")
         
+        self.rate_limiter.acquire()
         try:
             if method.upper() == "GET":
                 response = requests.get(url, params=params)
@@ -98,6 +104,20 @@ class OpenDartClient:
         """GET 요청을 수행합니다."""
         return self._make_request(endpoint, params, "GET")
     
+    def get_cached(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        응답 캐시를 거치는 GET 요청 (CACHE_TTL_HOURS, CACHE_MAX_SIZE)
+
+        정상(000)과 데이터 없음(013) 응답만 저장하며, 오류 응답은 저장하지 않습니다.
+        """
+        key = cache_key(endpoint, params)
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            return cached
+        response = self.get(endpoint, params)
+        self.response_cache.put(key, response)
+        return response
+
     def post(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """POST 요청을 수행합니다."""
         return self._make_request(endpoint, params, "POST")
@@ -121,6 +141,7 @@ class OpenDartClient:
         
         url = urljoin(self.base_url, endpoint)
         
+        self.rate_limiter.acquire()
         try:
             response = requests.get(url, params=params)
             response.raise_for_status()
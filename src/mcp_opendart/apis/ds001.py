@@ -1,6 +1,16 @@
-from typing import Dict, Any, Optional, List
+import asyncio
+import logging
+import math
+from datetime import date
+from typing import Dict, Any, Optional, List, Iterator, Callable, Generator
 
 from ..apis.client import OpenDartClient
+from ..utils.concurrency import bounded_map
+
+logger = logging.getLogger(__name__)
+
+# 공시검색 API의 페이지당 최대 건수
+MAX_PAGE_COUNT = 100
 
 
 class DisclosureAPI:
@@ -13,11 +23,10 @@ class DisclosureAPI:
         """
         기업명으로 고유번호 검색
         """
-        from ..utils.corp_code_search import read_local_xml, parse_corp_code_xml, search_corporations
+        from ..utils.corp_code_search import load_corporations, search_corporations
         
         try:
-            xml_content = read_local_xml()
-            corporations = parse_corp_code_xml(xml_content)
+            corporations = load_corporations()
             results = search_corporations(corporations, corp_name)
             
             return {
@@ -73,6 +82,414 @@ class DisclosureAPI:
         
         return self.client.get(endpoint, params)
 
+    def iter_disclosure_pages(
+        self,
+        page_count: int = MAX_PAGE_COUNT,
+        max_pages: Optional[int] = None,
+        **filters: Any
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        공시검색 결과를 페이지 단위 응답으로 순서대로 내보냅니다.
+
+        1페이지로 total_page를 확인한 뒤 나머지 페이지는 max_concurrency만큼 동시에 요청합니다.
+        오류 응답을 받으면 그 응답을 내보내고 중단합니다.
+
+        Args:
+            page_count (int): 페이지당 건수 (최대 100)
+            max_pages (int, optional): 최대 페이지 수. 이후 페이지는 미리 요청하지도 않음
+            **filters: get_disclosure_list의 검색 조건 (corp_code, bgn_de, end_de 등)
+        """
+        first = self.get_disclosure_list(page_no=1, page_count=page_count, **filters)
+        yield first
+        if first.get("status") != "000":
+            return
+
+        total_page = int(first.get("total_page") or 1)
+        if max_pages is not None:
+            total_page = min(total_page, max_pages)
+        pages = bounded_map(
+            lambda page_no: self.get_disclosure_list(page_no=page_no, page_count=page_count, **filters),
+            range(2, total_page + 1),
+            self.client.config.max_concurrency
+        )
+        for page_no, page in enumerate(pages, start=2):
+            yield page
+            if page.get("status") != "000":
+                logger.warning(f"공시검색 {page_no}페이지 조회 실패: {page.get('message') or page.get('error')}")
+                return
+
+    def iter_disclosure_list(self, **filters: Any) -> Iterator[Dict[str, Any]]:
+        """공시검색 결과 전체를 한 건씩 순서대로 내보냅니다. (페이지 자동 순회)"""
+        for page in self.iter_disclosure_pages(**filters):
+            if page.get("status") != "000":
+                return
+            yield from page.get("list", [])
+
+    def get_all_disclosure_list(self, max_rows: Optional[int] = None, **filters: Any) -> Dict[str, Any]:
+        """
+        공시검색 결과를 모든 페이지에 걸쳐 하나의 목록으로 합쳐 반환합니다.
+
+        Args:
+            max_rows (int, optional): 최대 반환 건수. 채우면 남은 페이지는 요청하지 않음
+            **filters: get_disclosure_list의 검색 조건
+        """
+        rows: List[Dict[str, Any]] = []
+        total_count = 0
+        message = "정상"
+        max_pages = None
+        if max_rows is not None:
+            max_pages = max(1, math.ceil(max_rows / filters.get("page_count", MAX_PAGE_COUNT)))
+        for page in self.iter_disclosure_pages(max_pages=max_pages, **filters):
+            if page.get("status") != "000":
+                if not rows:
+                    return page
+                message = "일부 페이지 조회에 실패하여 앞부분만 반환합니다."
+                break
+            total_count = int(page.get("total_count") or 0)
+            rows.extend(page.get("list", []))
+            if max_rows is not None and len(rows) >= max_rows:
+                break
+
+        if max_rows is not None:
+            rows = rows[:max_rows]
+        return {
+            "status": "000",
+            "message": message,
+            "total_count": total_count,
+            "returned_count": len(rows),
+            "truncated": len(rows) < total_count,
+            "list": rows
+        }
+
+    def get_disclosure_history(
+        self,
+        corp_code: str,
+        bgn_de: str,
+        end_de: str,
+        max_rows: Optional[int] = None,
+        latest_only: bool = False
+    ) -> Dict[str, Any]:
+        """
+        기업 공시 이력 조회 (로컬 이력 저장소 사용)
+
+        이미 받은 기간은 로컬 이력에서 응답하고, 마지막 동기화 이후 구간만 DART에서 받아 합칩니다.
+
+        Args:
+            corp_code (str): 고유번호
+            bgn_de (str): 시작일 (YYYYMMDD)
+            end_de (str): 종료일 (YYYYMMDD)
+            max_rows (int, optional): 최대 반환 건수 (최신순)
+            latest_only (bool): 정정 공시로 대체된 버전을 빼고 최신 유효 버전만 반환
+        """
+        from ..utils.amendment_index import latest_versions
+        from ..utils.disclosure_history import get_history_store
+        from ..utils.query_planner import parse_date
+
+        # 잘못된 날짜가 동기화 구간(synced_from/synced_through)으로 저장되지 않도록 먼저 검사합니다
+        for value in (bgn_de, end_de):
+            try:
+                if len(value) != 8 or not value.isdigit():
+                    raise ValueError(value)
+                parse_date(value)
+            except (TypeError, ValueError):
+                return {"status": "100", "message": f"날짜는 YYYYMMDD 형식으로 입력하세요: {value}"}
+        if bgn_de > end_de:
+            return {"status": "100", "message": f"시작일({bgn_de})이 종료일({end_de})보다 늦습니다."}
+
+        store = get_history_store(self.client.config)
+        history = store.query(
+            corp_code, bgn_de, end_de,
+            lambda range_bgn, range_end: self.get_all_disclosure_list(
+                corp_code=corp_code, bgn_de=range_bgn, end_de=range_end
+            )
+        )
+        if history.get("status") != "000":
+            return history
+
+        rows = latest_versions(history["rows"]) if latest_only else history["rows"]
+        if not rows:
+            return {"status": "013", "message": "조회된 데이터가 없습니다."}
+        return {
+            "status": "000",
+            "message": "정상",
+            "total_count": len(rows),
+            "returned_count": len(rows[:max_rows]),
+            "truncated": max_rows is not None and len(rows) > max_rows,
+            "fetched_count": history["fetched"],
+            "synced_through": history["synced_through"],
+            "list": rows[:max_rows]
+        }
+
+    def search_disclosures(
+        self,
+        bgn_de: str,
+        end_de: str,
+        corp_code: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        **filters: Any
+    ) -> Dict[str, Any]:
+        """
+        기간 제한 없는 공시검색
+
+        고유번호 없이 검색하면 DART가 3개월 이내 기간만 허용하므로, 기간을 3개월 구간으로 나누어
+        각 구간의 1페이지를 동시에 조회한 뒤 나머지 페이지를 최신 구간부터 이어서 조회합니다.
+        결과는 접수일 내림차순이며 rcept_no 기준으로 중복을 제거합니다.
+
+        Args:
+            bgn_de (str): 시작일 (YYYYMMDD)
+            end_de (str): 종료일 (YYYYMMDD)
+            corp_code (str, optional): 고유번호. 있으면 기간을 나누지 않음
+            max_rows (int, optional): 최대 반환 건수. 채우면 남은 페이지는 요청하지 않음
+            **filters: pblntf_ty, pblntf_detail_ty, corp_cls, last_report_at 등 추가 검색 조건
+        """
+        from ..utils.query_planner import split_date_range
+
+        try:
+            windows = [(bgn_de, end_de)] if corp_code else split_date_range(bgn_de, end_de)
+        except ValueError as e:
+            return {"status": "100", "message": f"잘못된 조회 기간입니다: {e}"}
+
+        filters = {**filters, "corp_code": corp_code, "sort": "date", "sort_mth": "desc"}
+        max_concurrency = self.client.config.max_concurrency
+
+        def fetch(window_page: Any) -> Dict[str, Any]:
+            (window_bgn, window_end), page_no = window_page
+            return self.get_disclosure_list(
+                bgn_de=window_bgn, end_de=window_end, page_no=page_no, page_count=MAX_PAGE_COUNT, **filters
+            )
+
+        # 1) 구간별 1페이지를 동시에 조회하여 전체 건수와 페이지 수 확인
+        first_pages = list(bounded_map(fetch, [(window, 1) for window in windows], max_concurrency))
+        for page in first_pages:
+            if page.get("status") not in ("000", "013"):
+                return page
+        total_pages = [int(page.get("total_page") or 1) if page.get("status") == "000" else 0 for page in first_pages]
+        total_count = sum(int(page.get("total_count") or 0) for page in first_pages if page.get("status") == "000")
+        if total_count == 0:
+            return {"status": "013", "message": "조회된 데이터가 없습니다."}
+
+        # 2) 나머지 페이지는 최신 구간부터 순서대로, 동시 요청 수를 제한하여 조회
+        rest = bounded_map(
+            fetch,
+            ((window, page_no) for window, pages in zip(windows, total_pages) for page_no in range(2, pages + 1)),
+            max_concurrency
+        )
+
+        plan = [(window, first, page_no)
+                for window, first, pages in zip(windows, first_pages, total_pages)
+                for page_no in range(1, pages + 1)]
+        rows: List[Dict[str, Any]] = []
+        seen = set()
+        message = "정상"
+        # 중복 제거 후 건수로 판단 (max_rows를 채우고도 남은 행이나 읽지 않은 페이지가 있으면 잘린 것)
+        truncated = False
+        try:
+            for position, (window, first, page_no) in enumerate(plan):
+                page = first if page_no == 1 else next(rest)
+                if page.get("status") != "000":
+                    message = f"{window[0]}~{window[1]} 구간 일부 페이지 조회에 실패했습니다."
+                    continue
+                for row in page.get("list", []):
+                    if row.get("rcept_no") not in seen:
+                        seen.add(row.get("rcept_no"))
+                        rows.append(row)
+                if max_rows is not None and len(rows) >= max_rows:
+                    truncated = len(rows) > max_rows or position < len(plan) - 1
+                    break
+        finally:
+            rest.close()
+
+        if max_rows is not None:
+            rows = rows[:max_rows]
+        return {
+            "status": "000",
+            "message": message,
+            "bgn_de": bgn_de,
+            "end_de": end_de,
+            "windows": len(windows),
+            "total_count": total_count,
+            "returned_count": len(rows),
+            "truncated": truncated,
+            "list": rows
+        }
+
+    def ingest_daily_disclosures(
+        self,
+        bgn_de: str,
+        end_de: str,
+        force: bool = False,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        시장 전체 일별 공시를 로컬 일별 저장소에 수집합니다. (수집 작업용)
+
+        Args:
+            bgn_de (str): 시작일 (YYYYMMDD)
+            end_de (str): 종료일 (YYYYMMDD)
+            force (bool): 이미 완료된 날짜도 다시 수집
+            on_progress: 날짜별 결과 콜백
+        """
+        from ..utils.daily_archive import get_daily_archive
+
+        archive = get_daily_archive(self.client.config)
+        return archive.ingest_range(
+            bgn_de, end_de,
+            lambda date, pblntf_ty: self.get_all_disclosure_list(bgn_de=date, end_de=date, pblntf_ty=pblntf_ty),
+            force=force,
+            on_progress=on_progress
+        )
+
+    def get_daily_disclosures(
+        self,
+        date: str,
+        pblntf_ty: Optional[str] = None,
+        corp_cls: Optional[str] = None,
+        corp_code: Optional[str] = None,
+        max_rows: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        특정 일자의 시장 전체 공시 조회 (로컬 일별 저장소, DART 호출 없음)
+
+        Args:
+            date (str): 접수일 (YYYYMMDD)
+            pblntf_ty (str, optional): 공시유형 (A~J)
+            corp_cls (str, optional): 법인구분 (Y, K, N, E)
+            corp_code (str, optional): 고유번호
+            max_rows (int, optional): 최대 반환 건수
+        """
+        from collections import Counter
+        from ..utils.daily_archive import get_daily_archive
+
+        archive = get_daily_archive(self.client.config)
+        rows = archive.query(date, pblntf_ty=pblntf_ty, corp_cls=corp_cls, corp_code=corp_code)
+        if rows is None:
+            return {
+                "status": "013",
+                "message": f"{date} 일자 공시가 수집되어 있지 않습니다. mcp-opendart-daily --start {date} --end {date}로 수집하세요."
+            }
+        return {
+            "status": "000",
+            "message": "정상",
+            "date": date,
+            "complete": archive.is_complete(date),
+            "total_count": len(rows),
+            "by_pblntf_ty": dict(Counter(row["pblntf_ty"] for row in rows)),
+            "returned_count": len(rows[:max_rows]),
+            "list": rows[:max_rows]
+        }
+
+    def search_disclosure_titles(
+        self,
+        query: str,
+        bgn_de: Optional[str] = None,
+        end_de: Optional[str] = None,
+        corp_cls: Optional[str] = None,
+        pblntf_ty: Optional[str] = None,
+        limit: int = 100
+    ) -> Dict[str, Any]:
+        """
+        로컬 공시 제목 검색 (DART 호출 없음)
+
+        일별 공시 저장소와 기업별 공시 이력에 저장된 공시의 보고서명을 2-gram 색인으로 검색합니다.
+
+        Args:
+            query (str): 보고서명 검색어 (공백으로 구분하면 모두 포함, 예: "유상증자결정")
+            bgn_de (str, optional): 접수일 시작 (YYYYMMDD)
+            end_de (str, optional): 접수일 종료 (YYYYMMDD)
+            corp_cls (str, optional): 법인구분 (Y, K, N, E)
+            pblntf_ty (str, optional): 공시유형 (A~J, 일별 저장소에 수집된 공시만 해당)
+            limit (int): 최대 반환 건수
+        """
+        from ..utils.title_index import get_title_index
+
+        result = get_title_index(self.client.config).search(
+            query, bgn_de=bgn_de, end_de=end_de, corp_cls=corp_cls, pblntf_ty=pblntf_ty, limit=limit
+        )
+        if result["indexed_count"] == 0:
+            return {
+                "status": "013",
+                "message": "로컬에 저장된 공시가 없습니다. mcp-opendart-daily로 일별 공시를 먼저 수집하세요."
+            }
+        if result["total_count"] == 0:
+            return {"status": "013", "message": "조회된 데이터가 없습니다."}
+        return {
+            "status": "000",
+            "message": "정상",
+            "total_count": result["total_count"],
+            "returned_count": len(result["rows"]),
+            "list": result["rows"]
+        }
+
+    def find_disclosure(self, rcept_no: str, corp_code: Optional[str] = None) -> Dict[str, Any]:
+        """
+        접수번호로 공시검색 결과 행(corp_code, report_nm 등)을 찾습니다.
+
+        로컬 공시 색인을 먼저 확인하고, 없으면 접수번호의 접수일 하루를 공시검색으로 조회합니다.
+        corp_code를 주면 해당 기업만 조회하므로 호출이 한 번으로 끝납니다.
+
+        Args:
+            rcept_no (str): 접수번호(14자리)
+            corp_code (str, optional): 공시대상회사의 고유번호(8자리)
+        """
+        from ..utils.title_index import get_title_index
+
+        if len(rcept_no) != 14 or not rcept_no.isdigit():
+            return {"status": "100", "message": f"접수번호 형식이 올바르지 않습니다: {rcept_no}"}
+
+        row = get_title_index(self.client.config).lookup(rcept_no)
+        if row is not None and (corp_code is None or row["corp_code"] == corp_code):
+            return {"status": "000", "message": "정상", "source": "local", "disclosure": row}
+
+        rcept_dt = rcept_no[:8]
+        pages = self.iter_disclosure_pages(corp_code=corp_code, bgn_de=rcept_dt, end_de=rcept_dt)
+        try:
+            for page in pages:
+                if page.get("status") != "000":
+                    return page
+                for row in page.get("list", []):
+                    if row.get("rcept_no") == rcept_no:
+                        return {"status": "000", "message": "정상", "source": "list", "disclosure": row}
+        finally:
+            pages.close()
+        return {"status": "013", "message": f"접수번호 {rcept_no}에 해당하는 공시를 찾을 수 없습니다."}
+
+    def resolve_latest_version(self, rcept_no: str) -> Dict[str, Any]:
+        """
+        접수번호가 속한 원문·정정 묶음과 본문 기준 최신 유효 버전을 찾습니다.
+
+        로컬 공시 색인 기준이며, 비고(rm)에 정정 표시가 있는데 로컬에 정정 공시가 없으면
+        해당 기업의 공시 이력을 접수일부터 오늘까지 동기화한 뒤 다시 연결합니다.
+        로컬에 없는 접수번호는 그대로 반환합니다.
+
+        Returns:
+            Dict[str, Any]: versions(접수번호 오름차순), effective(최신 유효 버전)
+        """
+        from ..utils.amendment_index import effective_version, has_later_amendment, link_amendments
+        from ..utils.title_index import get_title_index
+
+        index = get_title_index(self.client.config)
+        row = index.lookup(rcept_no)
+        if row is None:
+            return {"versions": [rcept_no], "effective": rcept_no}
+
+        chain = index.amendment_chain(rcept_no)
+        if chain["versions"][-1] == rcept_no and has_later_amendment(row):
+            history = self.get_disclosure_history(row["corp_code"], row["rcept_dt"], date.today().strftime("%Y%m%d"))
+            for rows in link_amendments(history.get("list", [])):
+                versions = [r["rcept_no"] for r in rows]
+                if rcept_no in versions:
+                    chain = {"versions": versions, "effective": effective_version(rows)["rcept_no"]}
+                    break
+        return chain
+
+    def _resolve_version(self, rcept_no: str, resolve_latest: bool) -> Dict[str, Any]:
+        """응답에 넣을 접수번호 필드 (최신 버전으로 바뀌었으면 요청한 접수번호도 함께)"""
+        effective = self.resolve_latest_version(rcept_no)["effective"] if resolve_latest else rcept_no
+        if effective == rcept_no:
+            return {"rcept_no": rcept_no}
+        logger.info(f"정정 공시 반영: {rcept_no} → {effective}")
+        return {"rcept_no": effective, "requested_rcept_no": rcept_no}
+
     def get_corporation_info(self, corp_code: str) -> Dict[str, Any]:
         """
         기업개황 조회
@@ -82,49 +499,192 @@ class DisclosureAPI:
         params = {"corp_code": corp_code}
         return self.client.get(endpoint, params)
 
-    def get_disclosure_document(self, rcp_no: str) -> Dict[str, Any]:
+    def get_disclosure_document(self, rcp_no: str, resolve_latest: bool = True) -> Dict[str, Any]:
         """
         공시서류원본파일 조회
         https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS001&apiId=2019003
+
+        resolve_latest(기본값)이면 정정 공시로 대체된 접수번호 대신 최신 유효 버전의 원본을 받습니다. False면 요청한 접수번호 그대로
         """
-        import zipfile
-        import io
-        
+        from pathlib import Path
+        from ..utils.archive_store import KIND_DOCUMENT, extract_archive, get_archive_store
+
+        version = self._resolve_version(rcp_no, resolve_latest)
+        rcp_no = version["rcept_no"]
         endpoint = "document.xml"
         params = {"rcept_no": rcp_no}
-        response = self.client.get(endpoint, params)
-        
-        # Save the response to the specified directory if successful
-        if response.get("status") == "000" and isinstance(response.get("content"), bytes):
-            import os
-            from pathlib import Path
-            
-            # Get the absolute path of the project root
-            project_root = Path(__file__).parent.parent.parent
-            data_dir = project_root / 'opendart' / 'utils' / 'data'
-            data_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Save the zip content to a temporary file
-            zip_path = data_dir / f'disclosure_{rcp_no}.zip'
-            with open(zip_path, 'wb') as f:
-                f.write(response["content"])
-            
+        store = get_archive_store(self.client.config)
+        response = store.get_or_fetch(KIND_DOCUMENT, rcp_no, lambda: self.client.get(endpoint, params))
+
+        # 저장소의 원본을 rcept_no별 디렉토리에 풀어 둡니다
+        if response.get("archive_path"):
             try:
-                # Extract the XML file from the zip
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    zip_ref.extractall(data_dir)
-                
-                # Remove the temporary zip file
-                os.remove(zip_path)
-                
-                # Add file path information to the response
-                response["saved_path"] = str(data_dir / f'disclosure_{rcp_no}.xml')
+                extract_dir = extract_archive(
+                    Path(response["archive_path"]),
+                    Path(self.client.config.data_dir) / "documents" / rcp_no
+                )
+                store.add_derived(KIND_DOCUMENT, rcp_no, extract_dir)
+                main_xml = extract_dir / f"{rcp_no}.xml"
+                response["saved_path"] = str(main_xml if main_xml.exists() else extract_dir)
             except Exception as e:
-                print(f"Failed to extract zip file: {e}")
-                if os.path.exists(zip_path):
-                    os.remove(zip_path)
-        
+                logger.error(f"Failed to extract zip file: {e}")
+
+        response.update(version)
         return response
+
+    async def prepare_section_index(self, rcept_no: str, resolve_latest: bool = True) -> None:
+        """
+        원본파일을 확보하고 섹션 인덱스를 parse_pool.run_async로 만들어 둡니다. (비동기 도구용)
+
+        도구 호출이 취소되면 대기 중인 파싱도 취소됩니다. 이후 섹션·표 조회는 캐시된 인덱스를 사용하며,
+        원본을 받지 못하거나 파싱에 실패하면 조회 메서드가 오류 응답을 돌려주도록 그대로 둡니다.
+        """
+        from pathlib import Path
+        from ..utils import document_parser
+
+        document = await asyncio.to_thread(self.get_disclosure_document, rcept_no, resolve_latest)
+        saved_path = document.get("saved_path")
+        if document.get("status") != "000" or not saved_path or not saved_path.endswith(".xml"):
+            return
+        try:
+            await document_parser.section_index_cache.get_async(Path(saved_path))
+        except Exception as e:
+            logger.warning(f"섹션 인덱스 준비 실패: {e}")
+
+    def _load_section_index(self, rcept_no: str, resolve_latest: bool = True) -> Dict[str, Any]:
+        """원본파일을 확보하고 본문 XML 경로와 섹션 인덱스를 반환합니다. 실패 시 오류 응답을 반환합니다."""
+        from pathlib import Path
+        from ..utils import document_parser
+        from ..utils.archive_store import KIND_DOCUMENT, get_archive_store
+
+        document = self.get_disclosure_document(rcept_no, resolve_latest)
+        if document.get("status") != "000":
+            return document
+
+        saved_path = document.get("saved_path")
+        if not saved_path or not saved_path.endswith(".xml"):
+            return {
+                "status": "500",
+                "message": "공시서류 원본파일에서 본문 XML을 찾을 수 없습니다."
+            }
+
+        xml_path = Path(saved_path)
+        version = {key: document[key] for key in ("rcept_no", "requested_rcept_no") if key in document}
+        index = document_parser.section_index_cache.get(xml_path)
+        # 새로 만든 섹션 인덱스 파일을 아카이브 용량에 반영
+        get_archive_store(self.client.config).add_derived(KIND_DOCUMENT, document["rcept_no"], xml_path.parent)
+        return {"xml_path": xml_path, "index": index, "version": version}
+
+    def get_disclosure_section(
+        self,
+        rcept_no: str,
+        section: Optional[str] = None,
+        offset: int = 0,
+        max_chars: int = 20000,
+        resolve_latest: bool = True
+    ) -> Dict[str, Any]:
+        """
+        공시서류 목차 또는 특정 섹션 본문 조회
+
+        원본파일은 아카이브에서 재사용하고, 섹션 인덱스(바이트 오프셋)로 요청한 섹션만 읽습니다.
+
+        Args:
+            rcept_no (str): 접수번호
+            section (str, optional): 섹션 id 또는 제목 (예: "II. 사업의 내용"). 없으면 목차 반환
+            offset (int): 본문 시작 위치(문자 수). 긴 섹션을 나누어 읽을 때 사용
+            max_chars (int): 반환할 최대 문자 수
+            resolve_latest (bool): 정정 공시가 있으면 최신 유효 버전의 원본을 조회 (False면 요청한 접수번호 그대로)
+        """
+        from ..utils import document_parser
+
+        loaded = self._load_section_index(rcept_no, resolve_latest)
+        if "status" in loaded:
+            return loaded
+        xml_path, index = loaded["xml_path"], loaded["index"]
+
+        if section is None:
+            return {
+                "status": "000",
+                "message": "정상",
+                **loaded["version"],
+                "toc": document_parser.table_of_contents(index)
+            }
+
+        found = document_parser.find_section(index, section)
+        if found is None:
+            return {
+                "status": "013",
+                "message": f"'{section}' 섹션을 찾을 수 없습니다. section 없이 호출하여 목차를 확인하세요."
+            }
+
+        text = document_parser.render_fragment(
+            document_parser.read_section(xml_path, found), index["encoding"]
+        )
+        body = text[offset:offset + max_chars]
+        next_offset = offset + len(body)
+        return {
+            "status": "000",
+            "message": "정상",
+            **loaded["version"],
+            "section": {"id": found["id"], "level": found["level"], "title": found["title"]},
+            "text": body,
+            "total_chars": len(text),
+            "next_offset": next_offset if next_offset < len(text) else None
+        }
+    
+    def get_disclosure_table(
+        self,
+        rcept_no: str,
+        section: str,
+        table_no: Optional[int] = None,
+        resolve_latest: bool = True
+    ) -> Dict[str, Any]:
+        """
+        공시서류 섹션 내 표 조회
+
+        섹션 원문만 읽어 표를 순서대로 탐색하고, 요청한 표를 열 단위(columnar) 레코드로 변환합니다.
+
+        Args:
+            rcept_no (str): 접수번호
+            section (str): 섹션 id 또는 제목
+            table_no (int, optional): 섹션 내 표 번호(0부터). 없으면 표 목록 반환
+            resolve_latest (bool): 정정 공시가 있으면 최신 유효 버전의 원본을 조회 (False면 요청한 접수번호 그대로)
+        """
+        from ..utils import document_parser, table_extractor
+
+        loaded = self._load_section_index(rcept_no, resolve_latest)
+        if "status" in loaded:
+            return loaded
+        xml_path, index = loaded["xml_path"], loaded["index"]
+
+        found = document_parser.find_section(index, section)
+        if found is None:
+            return {
+                "status": "013",
+                "message": f"'{section}' 섹션을 찾을 수 없습니다. get_disclosure_section으로 목차를 확인하세요."
+            }
+
+        fragment = document_parser.read_section(xml_path, found)
+        tables = table_extractor.iter_tables(fragment, index["encoding"])
+        result: Dict[str, Any] = {
+            "status": "000",
+            "message": "정상",
+            **loaded["version"],
+            "section": {"id": found["id"], "title": found["title"]},
+        }
+        if table_no is None:
+            result["tables"] = [table_extractor.table_summary(*table) for table in tables]
+            return result
+
+        for n, table_html, context in tables:
+            if n == table_no:
+                result["table_no"] = n
+                result["table"] = table_extractor.to_columnar(table_html, context)
+                return result
+        return {
+            "status": "013",
+            "message": f"섹션 '{found['title']}'에 {table_no}번 표가 없습니다."
+        }
     
     def get_corporation_code(self) -> Dict[str, Any]:
         """
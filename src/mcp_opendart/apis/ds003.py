@@ -1,6 +1,31 @@
-from typing import Dict, Any, Optional, List
+import asyncio
+import logging
+import math
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Set, Union
 
 from ..apis.client import OpenDartClient
+from ..utils.archive_store import KIND_XBRL, extract_archive, get_archive_store
+from ..utils.concurrency import bounded_map
+
+logger = logging.getLogger(__name__)
+
+# 다중회사 API(fnlttMultiAcnt, fnlttCmpnyIndx)가 한 번에 받는 최대 고유번호 수
+MULTI_CORP_BATCH_SIZE = 100
+
+# 주요 재무지표 분류 (M210000: 수익성, M220000: 안정성, M230000: 성장성, M240000: 활동성)
+INDEX_CLASS_CODES = ("M210000", "M220000", "M230000", "M240000")
+
+
+def split_list(values: Union[str, List[str]]) -> List[str]:
+    """쉼표 구분 문자열 또는 목록을 공백을 지운 중복 없는 값 목록으로 바꿉니다. (입력 순서 유지)"""
+    items = values.split(",") if isinstance(values, str) else values
+    return list(dict.fromkeys(item.strip() for item in items if item and item.strip()))
+
+
+def split_corp_codes(corp_code: Union[str, List[str]]) -> List[str]:
+    """쉼표 구분 문자열 또는 목록을 중복 없는 고유번호 목록으로 바꿉니다."""
+    return split_list(corp_code)
 
 
 class FinancialInfoAPI:
@@ -32,9 +57,83 @@ class FinancialInfoAPI:
         
         return self.client.get(endpoint, data)
     
+    def _get_multi_corp(self, endpoint: str, corp_codes: List[str], params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        다중회사 API를 MULTI_CORP_BATCH_SIZE개씩 나누어 동시에 호출하고 결과를 합칩니다.
+
+        합친 행은 기존 응답처럼 list로, 요청한 고유번호별로 묶은 행은 by_corp로 돌려줍니다.
+        응답 행에 corp_code가 없으면(fnlttMultiAcnt) CORPCODE.xml의 종목코드 → 고유번호 표로 찾고,
+        요청한 회사에 대응하지 않는 행은 unmatched_rows로 따로 돌려줍니다.
+        데이터가 없는 묶음(013)은 건너뛰고, 실패한 묶음의 고유번호는 failed_corp_codes로 돌려줍니다.
+        """
+        from ..utils.corp_code_search import load_corporations
+
+        if not corp_codes:
+            return {"status": "100", "message": "corp_code를 입력하세요."}
+
+        batches = [corp_codes[i:i + MULTI_CORP_BATCH_SIZE] for i in range(0, len(corp_codes), MULTI_CORP_BATCH_SIZE)]
+        responses = bounded_map(
+            lambda batch: self.client.get(endpoint, {**params, "corp_code": ",".join(batch)}),
+            batches,
+            self.client.config.max_concurrency
+        )
+
+        rows: List[Dict[str, Any]] = []
+        failed: List[str] = []
+        last_error: Dict[str, Any] = {}
+        for batch, response in zip(batches, responses):
+            status = response.get("status")
+            if status == "013":
+                continue
+            if status != "000":
+                logger.warning(f"{endpoint} {len(batch)}개 기업 조회 실패: {response.get('message') or response.get('error')}")
+                failed.extend(batch)
+                last_error = response
+                continue
+            rows.extend(response.get("list", []))
+
+        if not rows:
+            if failed:
+                return last_error
+            return {"status": "013", "message": "조회된 데이터가 없습니다."}
+
+        requested = set(corp_codes)
+        by_stock: Dict[str, str] = {}
+        if any(not row.get("corp_code") for row in rows):
+            try:
+                by_stock = {
+                    corp["stock_code"]: corp["corp_code"]
+                    for corp in load_corporations() if corp["stock_code"] and corp["corp_code"] in requested
+                }
+            except OSError as e:
+                logger.warning(f"CORPCODE.xml을 읽지 못해 종목코드로 고유번호를 찾을 수 없습니다: {e}")
+        by_corp: Dict[str, List[Dict[str, Any]]] = {}
+        unmatched: List[Dict[str, Any]] = []
+        for row in rows:
+            corp_code = row.get("corp_code") or by_stock.get(row.get("stock_code") or "")
+            if corp_code in requested:
+                by_corp.setdefault(corp_code, []).append(row)
+            else:
+                unmatched.append(row)
+
+        result: Dict[str, Any] = {
+            "status": "000",
+            "message": "정상" if not failed else "일부 기업의 조회에 실패하여 결과가 불완전할 수 있습니다.",
+            "requested_count": len(corp_codes),
+            "batch_count": len(batches),
+            "corp_count": len(by_corp),
+            "list": rows,
+            "by_corp": by_corp
+        }
+        if unmatched:
+            result["unmatched_rows"] = unmatched
+        if failed:
+            result["failed_corp_codes"] = failed
+        return result
+
     def get_multi_acnt(
         self, 
-        corp_code: str, 
+        corp_code: Union[str, List[str]], 
         bsns_year: str, 
         reprt_code: str,
         fs_div: Optional[str] = None
@@ -42,10 +141,11 @@ class FinancialInfoAPI:
         """
         다중회사 주요계정
         https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS003&apiId=2019017
+
+        고유번호 개수 제한 없이 받아 100개씩 나누어 동시에 조회하고, 합친 list와 고유번호별 by_corp를 함께 반환합니다.
         """
         endpoint = "fnlttMultiAcnt.json"
         params = {
-            "corp_code": corp_code, 
             "bsns_year": bsns_year, 
             "reprt_code": reprt_code,
             "fs_div": fs_div
@@ -53,12 +153,13 @@ class FinancialInfoAPI:
         # None 값 제거
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self.client.get(endpoint, params)
+        return self._get_multi_corp(endpoint, split_corp_codes(corp_code), params)
     
     def get_xbrl_file(
         self, 
         rcept_no: str, 
-        reprt_code: str
+        reprt_code: str,
+        resolve_latest: bool = True
     ) -> Dict[str, Any]:
         """
         재무제표 원본파일(XBRL)
@@ -67,7 +168,18 @@ class FinancialInfoAPI:
         Args:
             rcept_no (str): 접수번호
             reprt_code (str): 보고서 코드 (1분기보고서: 11013, 반기보고서: 11012, 3분기보고서: 11014, 사업보고서: 11011)
+            resolve_latest (bool): 정정 공시가 있으면 최신 유효 버전의 XBRL을 받음 (없으면 요청한 접수번호로 재시도). False면 요청한 접수번호 그대로
         """
+        if resolve_latest:
+            from .ds001 import DisclosureAPI
+
+            effective = DisclosureAPI(self.client).resolve_latest_version(rcept_no)["effective"]
+            if effective != rcept_no:
+                response = self.get_xbrl_file(effective, reprt_code, resolve_latest=False)
+                if response.get("archive_path"):
+                    response["requested_rcept_no"] = rcept_no
+                    return response
+
         endpoint = "fnlttXbrl.xml"
         data = {
             "rcept_no": rcept_no,
@@ -76,33 +188,180 @@ class FinancialInfoAPI:
         # None 값 제거
         data = {k: v for k, v in data.items() if v is not None}
         
-        response = self.client.download(endpoint, data)
+        store = get_archive_store(self.client.config)
+        response = store.get_or_fetch(
+            KIND_XBRL, rcept_no, lambda: self.client.download(endpoint, data), reprt_code=reprt_code
+        )
         
-        # Save the response to the specified directory if successful
-        if response.get("status") == "000" and isinstance(response.get("content"), bytes):
-            import os
-            from pathlib import Path
-            import zipfile
-            from io import BytesIO
-            
-            # Get the absolute path of the project root
-            project_root = Path(__file__).parent.parent.parent
-            data_dir = project_root / 'opendart' / 'utils' / 'data'
-            data_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Create a directory for extracted files using rcept_no
-            extract_dir = data_dir / f'{rcept_no}_{reprt_code}'
-            extract_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Extract ZIP content
-            with zipfile.ZipFile(BytesIO(response["content"])) as zip_file:
-                zip_file.extractall(extract_dir)
-            
-            # Add extracted directory path information to the response
-            response["saved_path"] = str(extract_dir)
+        # 저장소의 원본을 rcept_no_reprt_code 디렉토리에 풀어 둡니다
+        if response.get("archive_path"):
+            try:
+                extract_dir = extract_archive(
+                    Path(response["archive_path"]),
+                    Path(self.client.config.data_dir) / "xbrl" / f"{rcept_no}_{reprt_code}"
+                )
+                store.add_derived(KIND_XBRL, rcept_no, extract_dir, reprt_code=reprt_code)
+                response["saved_path"] = str(extract_dir)
+            except Exception as e:
+                logger.error(f"Failed to extract zip file: {e}")
         
+        response["rcept_no"] = rcept_no
         return response
     
+    def get_xbrl_facts(
+        self,
+        rcept_no: str,
+        reprt_code: str,
+        concept: Optional[str] = None,
+        period: Optional[str] = None,
+        include_dimensions: bool = False,
+        limit: int = 200,
+        resolve_latest: bool = True
+    ) -> Dict[str, Any]:
+        """
+        XBRL 원본파일의 팩트(개념, 기간, 단위, 소수점, 값) 조회
+
+        인스턴스 문서를 스트리밍 파싱한 팩트 테이블을 rcept_no별로 캐시하여 재사용합니다.
+
+        Args:
+            rcept_no (str): 접수번호
+            reprt_code (str): 보고서 코드
+            concept (str, optional): 개념명 일부 (예: Revenue, ifrs-full:Assets)
+            period (str, optional): 기간 접두어 (예: 2023, 2023-12-31)
+            include_dimensions (bool): 차원(세그먼트 등)이 있는 팩트 포함 여부
+            limit (int): 최대 반환 건수
+            resolve_latest (bool): 정정 공시가 있으면 최신 유효 버전의 XBRL을 조회 (False면 요청한 접수번호 그대로)
+        """
+        from ..utils.xbrl_parser import fact_table_cache, query_facts
+
+        response = self.get_xbrl_file(rcept_no=rcept_no, reprt_code=reprt_code, resolve_latest=resolve_latest)
+        if not response.get("archive_path"):
+            response.pop("content", None)
+            return response
+
+        version: Dict[str, Any] = {key: response[key] for key in ("rcept_no", "requested_rcept_no") if key in response}
+        rcept_no = version["rcept_no"]
+        cache_path = self._fact_table_path(rcept_no, reprt_code)
+        try:
+            table = fact_table_cache.get(cache_path, response["archive_path"])
+        except Exception as e:
+            return {"status": "500", "message": f"XBRL 파싱 중 오류가 발생했습니다: {str(e)}"}
+        get_archive_store(self.client.config).add_derived(KIND_XBRL, rcept_no, cache_path, reprt_code=reprt_code)
+
+        result = query_facts(table, concept, period, include_dimensions, limit)
+        return {
+            "status": "000",
+            "message": "정상",
+            **version,
+            **result
+        }
+
+    def _fact_table_path(self, rcept_no: str, reprt_code: str) -> Path:
+        return Path(self.client.config.data_dir) / "xbrl" / f"{rcept_no}_{reprt_code}.facts.json"
+
+    async def prepare_xbrl_facts(self, rcept_no: str, reprt_code: str, resolve_latest: bool = True) -> None:
+        """
+        XBRL 원본을 확보하고 팩트 테이블을 parse_pool.run_async로 만들어 둡니다. (비동기 도구용)
+
+        도구 호출이 취소되면 대기 중인 파싱도 취소됩니다. 이후 get_xbrl_facts는 캐시된 테이블을 사용하며,
+        원본을 받지 못하거나 파싱에 실패하면 get_xbrl_facts가 오류 응답을 돌려주도록 그대로 둡니다.
+        """
+        from ..utils.xbrl_parser import fact_table_cache
+
+        response = await asyncio.to_thread(self.get_xbrl_file, rcept_no, reprt_code, resolve_latest)
+        if not response.get("archive_path"):
+            return
+        try:
+            await fact_table_cache.get_async(
+                self._fact_table_path(response["rcept_no"], reprt_code), response["archive_path"]
+            )
+        except Exception as e:
+            logger.warning(f"XBRL 팩트 테이블 준비 실패: {e}")
+    
+    def get_financial_series(
+        self,
+        corp_code: str,
+        bgn_year: int,
+        end_year: int,
+        reprt_codes: Union[str, List[str]] = "11011",
+        fs_div: Optional[str] = None,
+        all_accounts: bool = False
+    ) -> Dict[str, Any]:
+        """
+        여러 기간의 재무제표를 계정별 시계열 표로 조회
+
+        필요한 (사업연도, 보고서 코드) 조합을 동시에 조회하며 응답은 캐시를 거칩니다.
+        사업보고서는 전기(frmtrm)·전전기(bfefrmtrm) 금액으로 이전 2개 연도를 채우므로
+        3년에 한 번만 조회하고, 미제출 등으로 빠진 연도만 다시 조회합니다.
+
+        Args:
+            corp_code (str): 고유번호
+            bgn_year (int): 시작 사업연도
+            end_year (int): 종료 사업연도
+            reprt_codes (str | List[str]): 보고서 코드 목록 (11013: 1분기, 11012: 반기, 11014: 3분기, 11011: 사업보고서)
+            fs_div (str, optional): CFS(연결) 또는 OFS(개별). all_accounts이면 기본값 CFS
+            all_accounts (bool): 전체 재무제표(fnlttSinglAcntAll) 사용 여부. 기본은 주요계정(fnlttSinglAcnt)
+        """
+        from ..utils.financial_series import REPORT_PERIODS, Period, SeriesTable, plan_fetches
+
+        codes = split_list(reprt_codes)
+        unknown = [code for code in codes if code not in REPORT_PERIODS]
+        if unknown or not codes:
+            return {"status": "100", "message": f"지원하지 않는 보고서 코드입니다: {', '.join(unknown) or reprt_codes}"}
+        if bgn_year > end_year:
+            return {"status": "100", "message": f"시작 연도({bgn_year})가 종료 연도({end_year})보다 늦습니다."}
+
+        if all_accounts:
+            endpoint = "fnlttSinglAcntAll.json"
+            fs_div = fs_div or "CFS"
+        else:
+            endpoint = "fnlttSinglAcnt.json"
+
+        def fetch(period: Any) -> Dict[str, Any]:
+            params = {"corp_code": corp_code, "bsns_year": str(period[0]), "reprt_code": period[1]}
+            if all_accounts:
+                params["fs_div"] = fs_div
+            return self.client.get_cached(endpoint, params)
+
+        periods = [(year, code) for year in range(bgn_year, end_year + 1) for code in codes]
+        table = SeriesTable(periods)
+        pending = set(periods)
+        attempted: Set[Period] = set()
+        failed: List[Dict[str, Any]] = []
+        while True:
+            plan = plan_fetches(pending, attempted)
+            if not plan:
+                break
+            attempted.update(plan)
+            for period, response in zip(plan, bounded_map(fetch, plan, self.client.config.max_concurrency)):
+                status = response.get("status")
+                if status == "013":
+                    continue
+                if status != "000":
+                    failed.append({"bsns_year": str(period[0]), "reprt_code": period[1],
+                                   "message": response.get("message") or response.get("error")})
+                    continue
+                rows = response.get("list", [])
+                if fs_div and not all_accounts:
+                    rows = [row for row in rows if row.get("fs_div") == fs_div]
+                pending -= table.merge(period, rows)
+
+        if not table.sources:
+            if failed:
+                return {"status": "500", "message": "재무제표 조회에 실패했습니다.", "failed": failed}
+            return {"status": "013", "message": "조회된 데이터가 없습니다."}
+        result: Dict[str, Any] = {
+            "status": "000",
+            "message": "정상" if not failed else "일부 기간의 조회에 실패하여 결과가 불완전할 수 있습니다.",
+            "corp_code": corp_code,
+            "fetched_count": len(attempted),
+            "requested_periods": len(periods),
+            **table.to_dict()
+        }
+        if failed:
+            result["failed"] = failed
+        return result
+
     def get_single_acc(
         self,
         corp_code: str,
@@ -121,18 +380,376 @@ class FinancialInfoAPI:
             fs_div (str, optional): 개별/연결구분 (OFS:재무제표, CFS:연결재무제표). Defaults to "OFS".
 
         Returns:
-            dict[str, Any]: API 응답
+            dict[str, Any]: API 응답 (로컬 재무제표 저장소를 거치며 fetched_at, source가 추가됨)
+        """
+        return self.get_stored_statements([(corp_code, bsns_year, reprt_code, fs_div)])[(corp_code, bsns_year, reprt_code, fs_div)]
+
+    def get_stored_statements(self, keys: List[Any], fetch_missing: bool = True) -> Dict[Any, Dict[str, Any]]:
         """
-        return self.client.get(
-            "fnlttSinglAcntAll.json",
-            params={
+        전체 재무제표를 로컬 저장소에서 읽고, 저장되지 않은 것만 동시에 조회하여 저장합니다.
+
+        Args:
+            keys (List[Tuple[str, str, str, str]]): (고유번호, 사업연도, 보고서 코드, 개별/연결구분) 목록
+            fetch_missing (bool): 저장되지 않은 재무제표를 DART에서 조회할지 여부
+        """
+        from ..utils.statement_store import get_statement_store, statement_params
+
+        def fetch(key: Any) -> Dict[str, Any]:
+            return self.client.get("fnlttSinglAcntAll.json", params=statement_params(key))
+
+        store = get_statement_store(self.client.config)
+        return store.get_many(keys, fetch if fetch_missing else None, self.client.config.max_concurrency)
+
+    def ingest_statements(
+        self,
+        years: List[str],
+        reprt_codes: List[str],
+        fs_divs: List[str],
+        corp_codes: Optional[List[str]] = None,
+        reserve: float = 0.5,
+        on_progress: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """
+        상장사 전체 재무제표를 로컬 저장소로 수집합니다. (수집 작업용)
+
+        Args:
+            years (List[str]): 사업연도 목록
+            reprt_codes (List[str]): 보고서 코드 목록
+            fs_divs (List[str]): CFS·OFS 중 수집할 구분
+            corp_codes (List[str], optional): 대상 고유번호. 생략 시 CORPCODE.xml의 종목코드가 있는 전체 상장사
+            reserve (float): 대화형 호출을 위해 남겨둘 호출 한도 비율 (0~1)
+            on_progress: 묶음별 진행 상황(처리량, 남은 시간) 콜백
+        """
+        from ..utils.corp_code_search import load_corporations
+        from ..utils.statement_ingest import ingest_statements, plan_statements
+        from ..utils.statement_store import get_statement_store, statement_params
+
+        if corp_codes is None:
+            corp_codes = [corp["corp_code"] for corp in load_corporations() if corp.get("stock_code")]
+        store = get_statement_store(self.client.config)
+        keys = plan_statements(store, corp_codes, years, reprt_codes, fs_divs)
+        logger.info(f"재무제표 수집 계획: {len(corp_codes)}개사, {len(keys)}건 (저장된 항목 제외)")
+
+        def fetch(key: Any) -> Dict[str, Any]:
+            return self.client.get("fnlttSinglAcntAll.json", params=statement_params(key))
+
+        params = {"years": years, "reprt_codes": reprt_codes, "fs_divs": fs_divs, "corp_count": len(corp_codes)}
+        summary = ingest_statements(store, keys, fetch, self.client.rate_limiter, self.client.config.max_concurrency,
+                                    reserve, params, on_progress)
+        return {**summary, "corp_count": len(corp_codes)}
+
+    def get_financial_ratios(
+        self,
+        corp_codes: Union[str, List[str]],
+        bsns_years: Union[str, List[str]],
+        reprt_code: str = "11011",
+        fs_div: str = "CFS",
+        ratios: Optional[Union[str, List[str]]] = None,
+        fetch_missing: bool = True
+    ) -> Dict[str, Any]:
+        """
+        여러 회사·여러 사업연도의 재무비율을 전체 재무제표에서 한 번에 계산
+
+        재무제표는 로컬 저장소(get_single_acc와 공유)에서 읽으므로 이미 저장된 재무제표는 DART를 호출하지 않습니다.
+        계정은 account_id(표준계정코드)로 찾고, 비율은 모든 재무제표에 대해 배열 단위로 계산합니다.
+
+        Args:
+            corp_codes (str | List[str]): 고유번호 목록 (쉼표 구분 가능)
+            bsns_years (str | List[str]): 사업연도 목록 (쉼표 구분 가능)
+            reprt_code (str): 보고서 코드 (11013: 1분기, 11012: 반기, 11014: 3분기, 11011: 사업보고서)
+            fs_div (str): CFS(연결) 또는 OFS(개별)
+            ratios (str | List[str], optional): 계산할 비율 이름 (기본: 전체)
+            fetch_missing (bool): 저장되지 않은 재무제표를 DART에서 조회할지 여부
+        """
+        from ..utils.ratio_engine import RATIOS, compute_ratios, ratio_table
+
+        corps = split_corp_codes(corp_codes)
+        years = split_list(bsns_years)
+        if not corps or not years:
+            return {"status": "100", "message": "고유번호와 사업연도를 하나 이상 입력해야 합니다."}
+        names = split_list(ratios) if ratios else None
+        unknown = [name for name in names or [] if name not in {ratio.name for ratio in RATIOS}]
+        if unknown:
+            return {"status": "100", "message": f"지원하지 않는 비율입니다: {', '.join(unknown)}"}
+
+        keys = [(corp, year, reprt_code, fs_div) for corp in corps for year in years]
+        cube, synced = self._sync_statement_cube(keys, fetch_missing)
+
+        slots: List[int] = []
+        statements: List[Dict[str, Any]] = []
+        missing: List[Dict[str, str]] = []
+        failed: List[Dict[str, Any]] = []
+        for key in keys:
+            corp, year = key[0], key[1]
+            slot = cube.slot_of(key)
+            if key in synced["failed"] and synced["failed"][key].get("status") != "013":
+                failed.append({"corp_code": corp, "bsns_year": year,
+                               "message": synced["failed"][key].get("message") or synced["failed"][key].get("error")})
+            elif slot < 0 or cube.status[slot] != "000":
+                missing.append({"corp_code": corp, "bsns_year": year})
+            else:
+                slots.append(slot)
+                statements.append({"corp_code": corp, "bsns_year": year,
+                                   "rcept_no": cube.rcept_no[slot], "fetched_at": cube.fetched_at[slot]})
+
+        if not statements:
+            if failed:
+                return {"status": "500", "message": "재무제표 조회에 실패했습니다.", "failed": failed}
+            return {"status": "013", "message": "조회된 데이터가 없습니다.", "missing": missing}
+
+        values = compute_ratios(cube.concept_matrix(slots), [reprt_code] * len(slots), names)
+        result: Dict[str, Any] = {
+            "status": "000",
+            "message": "정상" if not failed else "일부 재무제표 조회에 실패하여 결과가 불완전할 수 있습니다.",
+            "reprt_code": reprt_code,
+            "fs_div": fs_div,
+            "fetched_count": synced["fetched_count"],
+            "statements": statements,
+            "ratios": ratio_table(values),
+        }
+        if missing:
+            result["missing"] = missing
+        if failed:
+            result["failed"] = failed
+        return result
+
+    def _sync_statement_cube(self, keys: Optional[List[Any]], fetch_missing: bool = True) -> Any:
+        """재무제표 큐브를 저장소와 맞추고(keys가 없으면 저장된 전체), 필요하면 저장되지 않은 재무제표를 조회합니다."""
+        from ..utils.statement_cube import get_statement_cube
+        from ..utils.statement_store import get_statement_store, statement_params
+
+        def fetch(key: Any) -> Dict[str, Any]:
+            return self.client.get("fnlttSinglAcntAll.json", params=statement_params(key))
+
+        cube = get_statement_cube(self.client.config)
+        synced = cube.sync(get_statement_store(self.client.config), keys,
+                           fetch if fetch_missing else None, self.client.config.max_concurrency)
+        return cube, synced
+
+    def get_account_cross_section(
+        self,
+        account_id: str,
+        bsns_year: str,
+        reprt_code: str = "11011",
+        fs_div: str = "CFS",
+        corp_codes: Optional[Union[str, List[str]]] = None,
+        sj_div: Optional[str] = None,
+        measure: str = "thstrm_amount"
+    ) -> Dict[str, Any]:
+        """
+        여러 회사의 같은 계정 금액을 로컬 재무제표 큐브에서 한 번에 조회 (DART 호출 없음)
+
+        Args:
+            account_id (str): 표준계정코드 (예: ifrs-full_Revenue, dart_OperatingIncomeLoss) 또는 택사노미 출력명 (예: 매출액)
+            bsns_year (str): 사업연도
+            reprt_code (str): 보고서 코드
+            fs_div (str): CFS(연결) 또는 OFS(개별)
+            corp_codes (str | List[str], optional): 고유번호 목록. 생략 시 저장된 전체 회사
+            sj_div (str, optional): 재무제표 구분 (BS, IS, CIS, CF). 생략 시 BS → IS → CIS → CF 순으로 찾음
+            measure (str): 금액 열 (thstrm_amount, thstrm_add_amount, frmtrm_amount, frmtrm_add_amount)
+        """
+        from ..utils.amounts import to_python
+        from ..utils.statement_cube import MEASURES
+
+        if measure not in MEASURES:
+            return {"status": "100", "message": f"지원하지 않는 금액 열입니다: {measure}"}
+        corps = split_corp_codes(corp_codes) if corp_codes else None
+        keys = [(corp, bsns_year, reprt_code, fs_div) for corp in corps] if corps else None
+        cube, _ = self._sync_statement_cube(keys, fetch_missing=False)
+
+        account = cube.accounts.find(account_id, sj_div)
+        if account is None:
+            # 계정명(예: 매출액)으로 들어온 경우 택사노미 출력명으로 표준계정코드를 찾습니다
+            candidates = self._taxonomy_index().find_by_label(account_id)
+            account = next((number for number in (cube.accounts.find(candidate, sj_div) for candidate in candidates)
+                            if number is not None), None)
+        if account is None:
+            return {"status": "013", "message": f"저장된 재무제표에 없는 계정입니다: {account_id}"}
+        slots = [cube.slot_of(key) for key in keys] if keys else cube.find_slots(bsns_year, reprt_code, fs_div)
+        values = cube.gather(measure, account, slots)
+        present = [(slot, value) for slot, value in zip(slots, values) if slot >= 0 and not math.isnan(value)]
+        if not present:
+            return {"status": "013", "message": "조회된 데이터가 없습니다."}
+        sj, normalized = cube.accounts.keys[account]
+        return {
+            "status": "000",
+            "message": "정상",
+            "account_id": normalized,
+            "account_nm": cube.accounts.names[account],
+            "sj_div": sj,
+            "measure": measure,
+            "corp_codes": [cube.slots[slot][0] for slot, _ in present],
+            "values": [to_python(value) for _, value in present],
+            "fetched_at": [cube.fetched_at[slot] for slot, _ in present],
+        }
+
+    def get_quarterly_series(
+        self,
+        corp_code: str,
+        bgn_year: int,
+        end_year: int,
+        fs_div: str = "CFS",
+        account_ids: Optional[Union[str, List[str]]] = None,
+        sj_div: Optional[str] = None,
+        fetch_missing: bool = True
+    ) -> Dict[str, Any]:
+        """
+        누적 공시 금액을 분기별(3개월) 금액으로 바꾼 계정별 시계열
+
+        1분기·반기·3분기·사업보고서의 전체 재무제표를 재무제표 큐브에서 읽고(없는 것만 조회),
+        손익·현금흐름 계정은 누적 금액의 차이로 분기 금액을 구합니다. (4분기 = 연간 - 3분기 누적)
+
+        Args:
+            corp_code (str): 고유번호
+            bgn_year (int): 시작 사업연도
+            end_year (int): 종료 사업연도
+            fs_div (str): CFS(연결) 또는 OFS(개별)
+            account_ids (str | List[str], optional): 표준계정코드 목록. 생략 시 전체 계정
+            sj_div (str, optional): 재무제표 구분 (BS, IS, CIS, CF)
+            fetch_missing (bool): 저장되지 않은 재무제표를 DART에서 조회할지 여부
+        """
+        from ..utils.quarterly import QUARTER_REPORTS, quarterly_series
+
+        if bgn_year > end_year:
+            return {"status": "100", "message": f"시작 연도({bgn_year})가 종료 연도({end_year})보다 늦습니다."}
+        years = [str(year) for year in range(bgn_year, end_year + 1)]
+        keys = [(corp_code, year, reprt_code, fs_div) for year in years for _, reprt_code in QUARTER_REPORTS]
+        cube, synced = self._sync_statement_cube(keys, fetch_missing)
+
+        failed = [{"bsns_year": key[1], "reprt_code": key[2],
+                   "message": response.get("message") or response.get("error")}
+                  for key, response in synced["failed"].items() if response.get("status") != "013"]
+        series = quarterly_series(cube, corp_code, years, fs_div,
+                                  split_list(account_ids) if account_ids else None, sj_div)
+        # 저장된 택사노미 양식이 있으면 재무제표 양식 순서로 정렬합니다
+        taxonomy = self._taxonomy_index()
+        statements = ("BS", "IS", "CIS", "CF")
+        series["accounts"].sort(key=lambda row: (
+            statements.index(row["sj_div"]) if row["sj_div"] in statements else len(statements),
+            taxonomy.order_key(row["sj_div"], row["account_id"])
+        ))
+        if not series["accounts"]:
+            if failed:
+                return {"status": "500", "message": "재무제표 조회에 실패했습니다.", "failed": failed}
+            return {"status": "013", "message": "조회된 데이터가 없습니다."}
+        result: Dict[str, Any] = {
+            "status": "000",
+            "message": "정상" if not failed else "일부 보고서의 조회에 실패하여 결과가 불완전할 수 있습니다.",
+            "corp_code": corp_code,
+            "fs_div": fs_div,
+            "fetched_count": synced["fetched_count"],
+            **series
+        }
+        if failed:
+            result["failed"] = failed
+        return result
+
+    def screen_financials(
+        self,
+        expression: str,
+        bsns_year: Optional[str] = None,
+        reprt_code: str = "11011",
+        fs_div: str = "CFS",
+        corp_cls: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        descending: bool = True,
+        limit: int = 50,
+        columns: Optional[Union[str, List[str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        로컬 재무제표 큐브의 전체 회사를 조건식으로 선별하고 순위를 매깁니다. (DART 호출 없음)
+
+        조건식은 재무비율(예: debt_ratio, operating_margin)과 표준 계정 금액(예: revenue, assets)을 변수로 쓰며,
+        모든 회사에 대해 배열 단위로 한 번에 평가됩니다. 예: "debt_ratio < 50 and operating_margin > 15"
+
+        Args:
+            expression (str): 조건식 (비교, and/or/not, 사칙연산)
+            bsns_year (str, optional): 사업연도. 생략 시 저장된 가장 최근 연도
+            reprt_code (str): 보고서 코드
+            fs_div (str): CFS(연결) 또는 OFS(개별)
+            corp_cls (str, optional): 법인구분 (Y: 유가증권, K: 코스닥, N: 코넥스, E: 기타). 로컬 공시 목록 기준이며,
+                로컬 공시가 없어 법인구분을 모르는 회사는 제외하고 그 수를 unknown_market_count로 반환
+            sort_by (str, optional): 정렬 기준 식 (예: "roe"). 생략 시 고유번호 순
+            descending (bool): 내림차순 여부
+            limit (int): 최대 반환 건수
+            columns (str | List[str], optional): 결과에 추가로 표시할 변수
+        """
+        from ..utils.amounts import to_python
+        from ..utils.corp_code_search import load_corporations
+        from ..utils.ratio_engine import RATIOS, compute_ratios
+        from ..utils.screener import VARIABLES, ExpressionError, compile_expression, evaluate_filter, rank
+        from ..utils.title_index import get_title_index
+
+        try:
+            evaluator, used = compile_expression(expression)
+            sorter, sort_used = compile_expression(sort_by) if sort_by else (None, set())
+        except ExpressionError as e:
+            return {"status": "100", "message": str(e), "variables": list(VARIABLES)}
+        extra = split_list(columns) if columns else []
+        unknown = [name for name in extra if name not in VARIABLES]
+        if unknown:
+            return {"status": "100", "message": f"알 수 없는 변수입니다: {', '.join(unknown)}", "variables": list(VARIABLES)}
+
+        cube, _ = self._sync_statement_cube(None, fetch_missing=False)
+        if bsns_year is None:
+            years = {cube.slots[slot][1] for slot in cube.find_slots(None, reprt_code, fs_div)}
+            bsns_year = max(years) if years else None
+        slots = cube.find_slots(bsns_year, reprt_code, fs_div) if bsns_year else []
+        # 법인구분은 로컬 공시 목록에서만 알 수 있으므로 필터가 있을 때만 읽고, 공시가 없어 구분을 모르는 회사 수를 알립니다
+        corporations: Dict[str, Dict[str, str]] = {}
+        unknown_market = 0
+        if corp_cls:
+            corporations = get_title_index(self.client.config).corporations()
+            unknown_market = sum(1 for slot in slots if cube.slots[slot][0] not in corporations)
+            slots = [slot for slot in slots if corporations.get(cube.slots[slot][0], {}).get("corp_cls") == corp_cls]
+        if not slots:
+            response = {"status": "013", "message": "조건에 맞는 저장된 재무제표가 없습니다. 재무제표 수집 작업을 먼저 실행하세요."}
+            return {**response, "unknown_market_count": unknown_market} if corp_cls else response
+
+        size = len(slots)
+        matrix = cube.concept_matrix(slots)
+        shown = list(dict.fromkeys(sorted(used) + sorted(sort_used) + extra))
+        ratio_names = {ratio.name for ratio in RATIOS} & set(shown)
+        env = {name: matrix[name][0] for name in shown if name in matrix}
+        env.update(compute_ratios(matrix, [reprt_code] * size, ratio_names))
+
+        matched = evaluate_filter(evaluator, env, size)
+        ordered = rank(sorter(env, size), matched, descending) if sorter else matched
+        selected = ordered[:max(limit, 0)]
+
+        wanted = {cube.slots[slots[i]][0] for i in selected}
+        try:
+            listing = {corp["corp_code"]: corp for corp in load_corporations() if corp["corp_code"] in wanted}
+        except OSError:
+            listing = {}
+        rows = []
+        for position, i in enumerate(selected, 1):
+            slot = slots[i]
+            corp_code = cube.slots[slot][0]
+            info = {**listing.get(corp_code, {}), **corporations.get(corp_code, {})}
+            rows.append({
+                "rank": position,
                 "corp_code": corp_code,
-                "bsns_year": bsns_year,
-                "reprt_code": reprt_code,
-                "fs_div": fs_div,
-            },
-        )
-    
+                "corp_name": info.get("corp_name", ""),
+                "stock_code": info.get("stock_code", ""),
+                "corp_cls": info.get("corp_cls", ""),
+                **{name: to_python(round(env[name][i], 2)) if math.isfinite(env[name][i]) else None for name in shown},
+                "rcept_no": cube.rcept_no[slot],
+                "fetched_at": cube.fetched_at[slot],
+            })
+        return {
+            "status": "000",
+            "message": "정상",
+            "bsns_year": bsns_year,
+            "reprt_code": reprt_code,
+            "fs_div": fs_div,
+            "screened_count": size,
+            "matched_count": len(matched),
+            **({"unknown_market_count": unknown_market} if corp_cls else {}),
+            "oldest_fetched_at": min((cube.fetched_at[slot] or "" for slot in slots), default=None),
+            "rows": rows,
+        }
+
     def get_xbrl_taxonomy(
         self, 
         sj_div: str, 
@@ -143,6 +760,9 @@ class FinancialInfoAPI:
         """
         XBRL택사노미재무제표양식
         https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS003&apiId=2020001
+
+        양식 구분(sj_div)만 지정하면 로컬 택사노미 저장소를 거치며, 각 행에 양식 순서(ord),
+        깊이(depth), 상위 계정(parent_account_id)이 추가됩니다.
         """
         endpoint = "xbrlTaxonomy.json"
         params = {
@@ -153,8 +773,30 @@ class FinancialInfoAPI:
         }
         # None 값 제거
         params = {k: v for k, v in params.items() if v is not None}
-        
-        return self.client.get(endpoint, params)
+
+        if len(params) > 1:
+            return self.client.get(endpoint, params)
+
+        from ..utils.taxonomy_cache import TaxonomyCache, get_taxonomy_cache
+
+        entry = get_taxonomy_cache(self.client.config).get(sj_div, lambda div: self.client.get(endpoint, {"sj_div": div}))
+        if "version" not in entry:
+            return entry
+        return {
+            "status": "000",
+            "message": "정상",
+            "sj_div": sj_div,
+            "bsns_de": entry["bsns_de"],
+            "fetched_at": entry["fetched_at"],
+            "source": entry["source"],
+            "list": TaxonomyCache.to_rows(entry)
+        }
+
+    def _taxonomy_index(self) -> Any:
+        """로컬에 저장된 택사노미 양식 색인 (DART 호출 없음)"""
+        from ..utils.taxonomy_cache import get_taxonomy_cache
+
+        return get_taxonomy_cache(self.client.config).index()
         
     def get_single_index(
         self, 
@@ -185,9 +827,91 @@ class FinancialInfoAPI:
         
         return self.client.get(endpoint, params)
         
+    def get_all_indices(
+        self,
+        corp_code: str,
+        bsns_years: Union[str, List[str]],
+        reprt_codes: Union[str, List[str]] = "11011"
+    ) -> Dict[str, Any]:
+        """
+        단일회사 주요 재무지표 4개 분류를 (여러 기간에 대해) 동시에 조회하여 한 표로 합칩니다.
+
+        (사업연도, 보고서 코드, 지표분류) 조합마다 fnlttSinglIndx를 캐시를 거쳐 조회하고,
+        지표별로 기간 순서에 맞춘 값 목록을 만듭니다.
+
+        Args:
+            corp_code (str): 고유번호
+            bsns_years (str | List[str]): 사업연도 목록 (쉼표 구분 가능, 2023년 이후)
+            reprt_codes (str | List[str]): 보고서 코드 목록 (11013: 1분기, 11012: 반기, 11014: 3분기, 11011: 사업보고서)
+        """
+        from ..utils.amounts import parse_amount, to_python
+        from ..utils.financial_series import REPORT_PERIODS, period_order
+
+        years = split_list(bsns_years)
+        codes = split_list(reprt_codes)
+        invalid_years = [year for year in years if not (len(year) == 4 and year.isascii() and year.isdigit())]
+        if invalid_years:
+            return {"status": "100", "message": f"사업연도는 4자리 숫자로 입력하세요 (예: 2023): {', '.join(invalid_years)}"}
+        unknown = [code for code in codes if code not in REPORT_PERIODS]
+        if unknown or not codes or not years:
+            return {"status": "100", "message": f"사업연도와 보고서 코드를 확인하세요: {', '.join(unknown) or reprt_codes}"}
+
+        periods = sorted(((int(year), code) for year in years for code in codes), key=period_order)
+        requests = [(period, idx_cl_code) for period in periods for idx_cl_code in INDEX_CLASS_CODES]
+
+        def fetch(request: Any) -> Dict[str, Any]:
+            (year, reprt_code), idx_cl_code = request
+            return self.client.get_cached("fnlttSinglIndx.json", {
+                "corp_code": corp_code, "bsns_year": str(year), "reprt_code": reprt_code, "idx_cl_code": idx_cl_code
+            })
+
+        indicators: Dict[str, Dict[str, Any]] = {}
+        filled = set()
+        failed: List[Dict[str, Any]] = []
+        for (period, idx_cl_code), response in zip(requests, bounded_map(fetch, requests, self.client.config.max_concurrency)):
+            status = response.get("status")
+            if status == "013":
+                continue
+            if status != "000":
+                failed.append({"bsns_year": str(period[0]), "reprt_code": period[1], "idx_cl_code": idx_cl_code,
+                               "message": response.get("message") or response.get("error")})
+                continue
+            filled.add(period)
+            for row in response.get("list", []):
+                indicator = indicators.setdefault(row.get("idx_code", ""), {
+                    "idx_cl_code": idx_cl_code,
+                    "idx_cl_nm": row.get("idx_cl_nm", ""),
+                    "idx_code": row.get("idx_code", ""),
+                    "idx_nm": row.get("idx_nm", ""),
+                    "values": {},
+                })
+                indicator["values"][period] = to_python(parse_amount(row.get("idx_val")))
+
+        if not indicators:
+            if failed:
+                return {"status": "500", "message": "재무지표 조회에 실패했습니다.", "failed": failed}
+            return {"status": "013", "message": "조회된 데이터가 없습니다."}
+        shown = [period for period in periods if period in filled]
+        order = {code: i for i, code in enumerate(INDEX_CLASS_CODES)}
+        result: Dict[str, Any] = {
+            "status": "000",
+            "message": "정상" if not failed else "일부 지표의 조회에 실패하여 결과가 불완전할 수 있습니다.",
+            "corp_code": corp_code,
+            "requested_count": len(requests),
+            "periods": [f"{year}.{REPORT_PERIODS[code]}" for year, code in shown],
+            "indicators": [
+                {**{key: value for key, value in indicator.items() if key != "values"},
+                 "values": [indicator["values"].get(period) for period in shown]}
+                for indicator in sorted(indicators.values(), key=lambda item: order[item["idx_cl_code"]])
+            ],
+        }
+        if failed:
+            result["failed"] = failed
+        return result
+
     def get_multi_index(
         self, 
-        corp_code: str, 
+        corp_code: Union[str, List[str]], 
         bsns_year: str, 
         reprt_code: str,
         idx_cl_code: str
@@ -196,15 +920,16 @@ class FinancialInfoAPI:
         다중회사 주요 재무지표
         https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS003&apiId=2022002
 
+        고유번호 개수 제한 없이 받아 100개씩 나누어 동시에 조회하고, 합친 list와 고유번호별 by_corp를 함께 반환합니다.
+
         Args:
-            corp_code (str): 고유번호
+            corp_code (str | List[str]): 고유번호 목록 (쉼표 구분 문자열 또는 목록)
             bsns_year (str): 사업연도
             reprt_code (str): 보고서 코드 (11011:사업보고서, 11012:반기보고서, 11013:1분기보고서, 11014:3분기보고서)
             idx_cl_code (str): 지표분류코드 (M210000:수익성지표, M220000:안정성지표, M230000:성장성지표, M240000:활동성지표)
         """
         endpoint = "fnlttCmpnyIndx.json"
         params = {
-            "corp_code": corp_code, 
             "bsns_year": bsns_year, 
             "reprt_code": reprt_code,
             "idx_cl_code": idx_cl_code
@@ -212,4 +937,4 @@ class FinancialInfoAPI:
         # None 값 제거
         params = {k: v for k, v in params.items() if v is not None}
         
-        return self.client.get(endpoint, params)
\ No newline at end of file
+        return self._get_multi_corp(endpoint, split_corp_codes(corp_code), params)
\ No newline at end of file
@@ -1,6 +1,11 @@
+import logging
 from typing import Dict, Any, Optional, List
 
 from ..apis.client import OpenDartClient
+from ..utils.concurrency import bounded_map
+from ..utils.report_router import MAJOR_REPORT_ROUTES, Route
+
+logger = logging.getLogger(__name__)
 
 
 class MajorReportAPI:
@@ -835,4 +840,62 @@ class MajorReportAPI:
             "bgn_de": bgn_de, 
             "end_de": end_de
         }
-        return self.client.get(endpoint, params)
\ No newline at end of file
+        return self.client.get(endpoint, params)
+
+    def get_major_event_timeline(
+        self,
+        corp_code: str,
+        bgn_de: str,
+        end_de: str
+    ) -> Dict[str, Any]:
+        """
+        주요사항보고서 전체 이벤트 타임라인
+
+        36개 DS005 API를 max_concurrency만큼 동시에 조회하여 접수번호 순(시간순) 목록 하나로 합칩니다.
+        응답은 캐시를 거치며(013 포함), 데이터가 없는 API(013)는 결과에서 제외합니다.
+
+        Parameters:
+            corp_code (str): 고유번호 공시대상회사의 고유번호(8자리)
+            bgn_de (str): 검색시작 접수일자(YYYYMMDD)
+            end_de (str): 검색종료 접수일자(YYYYMMDD)
+        """
+        params = {"corp_code": corp_code, "bgn_de": bgn_de, "end_de": end_de}
+
+        def fetch(route: Route) -> Dict[str, Any]:
+            return self.client.get_cached(f"{route.endpoint}.json", dict(params))
+
+        events: List[Dict[str, Any]] = []
+        event_counts: Dict[str, int] = {}
+        failed: List[Dict[str, Any]] = []
+        responses = bounded_map(fetch, MAJOR_REPORT_ROUTES, self.client.config.max_concurrency)
+        for route, response in zip(MAJOR_REPORT_ROUTES, responses):
+            status = response.get("status")
+            if status == "013":
+                continue
+            if status != "000":
+                logger.warning(f"{route.title} 조회 실패: {response.get('message') or response.get('error')}")
+                failed.append({"event": route.title, "endpoint": route.endpoint, "status": status,
+                               "message": response.get("message") or response.get("error")})
+                continue
+            items = response.get("list", [])
+            event_counts[route.title] = len(items)
+            for item in items:
+                events.append({"event": route.title, "endpoint": route.endpoint, **item})
+
+        # 접수번호 앞 8자리가 접수일자이므로 접수번호 순서가 곧 시간 순서
+        events.sort(key=lambda event: event.get("rcept_no", ""))
+
+        if not events and failed:
+            return {"status": "500", "message": "주요사항보고서 조회에 실패했습니다.", "failed": failed}
+        if not events:
+            return {"status": "013", "message": "조회된 데이터가 없습니다."}
+        result: Dict[str, Any] = {
+            "status": "000",
+            "message": "정상" if not failed else "일부 주요사항보고서 조회에 실패하여 결과가 불완전할 수 있습니다.",
+            "total_count": len(events),
+            "event_counts": event_counts,
+            "list": events
+        }
+        if failed:
+            result["failed"] = failed
+        return result
@@ -2,6 +2,7 @@ import os
 import logging
 from typing import Literal, cast
 from dataclasses import dataclass
+from pathlib import Path
 from dotenv import load_dotenv
 
 # .env 파일 로드
@@ -10,6 +11,10 @@ load_dotenv()
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 로컬 데이터 기본 경로 (사용자 캐시 디렉터리, XDG_CACHE_HOME이 있으면 그 아래)
+# 패키지 디렉터리(site-packages)는 읽기 전용이거나 재설치 시 지워질 수 있으므로 쓰지 않습니다.
+DEFAULT_DATA_DIR = str(Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "mcp-opendart")
+
 @dataclass
 class OpenDartConfig:
     """OpenDART API configuration."""
@@ -22,6 +27,13 @@ class OpenDartConfig:
     api_rate_limit_period: int = 3600
     log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     log_file: str = "opendart.log"
+    data_dir: str = DEFAULT_DATA_DIR
+    archive_max_bytes: int = 2 * 1024 ** 3
+    parse_pool_workers: int = 2
+    parse_timeout: int = 300
+    max_concurrency: int = 4
+    poller_enabled: bool = False
+    poll_interval: int = 60
     
     @classmethod
     def from_env(cls) -> "OpenDartConfig":
@@ -45,7 +57,14 @@ class OpenDartConfig:
             api_rate_limit=int(os.getenv("API_RATE_LIMIT", "1000")),
             api_rate_limit_period=int(os.getenv("API_RATE_LIMIT_PERIOD", "3600")),
             log_format=os.getenv("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
-            log_file=os.getenv("LOG_FILE", "opendart.log")
+            log_file=os.getenv("LOG_FILE", "opendart.log"),
+            data_dir=os.getenv("OPENDART_DATA_DIR") or DEFAULT_DATA_DIR,
+            archive_max_bytes=int(os.getenv("ARCHIVE_MAX_BYTES", str(2 * 1024 ** 3))),
+            parse_pool_workers=int(os.getenv("PARSE_POOL_WORKERS", "2")),
+            parse_timeout=int(os.getenv("PARSE_TIMEOUT", "300")),
+            max_concurrency=int(os.getenv("MAX_CONCURRENCY", "4")),
+            poller_enabled=os.getenv("POLLER_ENABLED", "false").lower() in ("1", "true", "yes"),
+            poll_interval=int(os.getenv("POLL_INTERVAL", "60"))
         )
 
 @dataclass
@@ -0,0 +1,61 @@
+"""
+시장 전체 일별 공시 수집 작업
+
+예)
+    mcp-opendart-daily                              # 마지막 완료일 다음 날부터 오늘까지
+    mcp-opendart-daily --start 20240101 --end 20241231
+    mcp-opendart-daily --start 20240102 --end 20240102 --force
+"""
+import datetime
+import logging
+import sys
+from typing import Any, Dict, Optional
+
+import click
+
+from mcp_opendart.apis.client import OpenDartClient
+from mcp_opendart.apis.ds001 import DisclosureAPI
+from mcp_opendart.config import opendart_config
+from mcp_opendart.utils.daily_archive import get_daily_archive
+from mcp_opendart.utils.query_planner import format_date, parse_date
+
+logger = logging.getLogger("mcp-opendart")
+
+
+def _default_start(end_de: str) -> str:
+    """체크포인트(마지막 완료일) 다음 날, 없으면 종료일"""
+    last_completed = get_daily_archive(opendart_config).read_checkpoint().get("last_completed")
+    if not last_completed:
+        return end_de
+    return min(end_de, format_date(parse_date(last_completed) + datetime.timedelta(days=1)))
+
+
+@click.command()
+@click.option("--start", "bgn_de", default=None, help="수집 시작일 (YYYYMMDD). 기본값: 체크포인트 다음 날")
+@click.option("--end", "end_de", default=None, help="수집 종료일 (YYYYMMDD). 기본값: 오늘")
+@click.option("--force", is_flag=True, help="이미 완료된 날짜도 다시 수집")
+def main(bgn_de: Optional[str], end_de: Optional[str], force: bool) -> None:
+    """시장 전체 공시를 일자별 로컬 파티션(<data_dir>/daily)으로 수집합니다."""
+    logging.basicConfig(level=logging.INFO, format=opendart_config.log_format)
+
+    end_de = end_de or format_date(datetime.date.today())
+    bgn_de = bgn_de or _default_start(end_de)
+
+    def on_progress(result: Dict[str, Any]) -> None:
+        if result.get("skipped"):
+            click.echo(f"{result['date']} 건너뜀 (수집 완료)")
+        else:
+            click.echo(f"{result['date']} {result['count']}건 저장")
+
+    api = DisclosureAPI(OpenDartClient(opendart_config))
+    summary = api.ingest_daily_disclosures(bgn_de, end_de, force=force, on_progress=on_progress)
+    if summary.get("status") != "000":
+        click.echo(f"❌ {summary.get('failed_date')} 수집 실패: {summary.get('message') or summary.get('error')}", err=True)
+        sys.exit(1)
+    click.echo(
+        f"✅ {bgn_de}~{end_de} 수집 {summary['ingested']}일 ({summary['filings']}건), 건너뜀 {summary['skipped']}일"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+상장사 전체 재무제표 수집 작업
+
+예)
+    mcp-opendart-statements                                   # 최근 3개 사업연도 사업보고서, 연결·개별
+    mcp-opendart-statements --year 2023 --year 2024 --reprt-code 11011 --reprt-code 11014
+    mcp-opendart-statements --fs-div CFS --reserve 0.8         # 호출 한도의 80%를 대화형 호출용으로 남김
+"""
+import datetime
+import logging
+import os
+import sys
+from typing import Any, Dict, Optional, Tuple
+
+import click
+
+from mcp_opendart.apis.client import OpenDartClient
+from mcp_opendart.apis.ds003 import FinancialInfoAPI
+from mcp_opendart.config import opendart_config
+from mcp_opendart.utils.statement_ingest import read_checkpoint
+from mcp_opendart.utils.statement_store import get_statement_store
+
+logger = logging.getLogger("mcp-opendart")
+
+
+def _format_seconds(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    return str(datetime.timedelta(seconds=int(seconds)))
+
+
+@click.command()
+@click.option("--year", "years", multiple=True, help="사업연도 (여러 번 지정 가능). 기본값: 직전 3개 사업연도")
+@click.option("--reprt-code", "reprt_codes", multiple=True, default=("11011",), show_default=True,
+              help="보고서 코드 (11013: 1분기, 11012: 반기, 11014: 3분기, 11011: 사업보고서)")
+@click.option("--fs-div", "fs_divs", multiple=True, default=("CFS", "OFS"), show_default=True,
+              type=click.Choice(["CFS", "OFS"]), help="연결(CFS)·개별(OFS) 구분")
+@click.option("--corp-code", "corp_codes", multiple=True, help="대상 고유번호 (생략 시 전체 상장사)")
+@click.option("--reserve", default=0.5, show_default=True, type=click.FloatRange(0, 0.95),
+              help="대화형 호출을 위해 남겨둘 호출 한도 비율 (작업은 나머지 비율의 속도로 호출)")
+def main(
+    years: Tuple[str, ...],
+    reprt_codes: Tuple[str, ...],
+    fs_divs: Tuple[str, ...],
+    corp_codes: Tuple[str, ...],
+    reserve: float
+) -> None:
+    """상장사 전체 재무제표(fnlttSinglAcntAll)를 로컬 저장소(<data_dir>/statements)로 수집합니다."""
+    logging.basicConfig(level=logging.INFO, format=opendart_config.log_format)
+    if hasattr(os, "nice"):
+        os.nice(10)  # 같은 호스트의 MCP 서버보다 낮은 CPU 우선순위
+
+    this_year = datetime.date.today().year
+    years = years or tuple(str(year) for year in range(this_year - 3, this_year))
+
+    def on_progress(progress: Dict[str, Any]) -> None:
+        click.echo(
+            f"{progress['done']}/{progress['total']} "
+            f"(저장 {progress['stored']}, 데이터 없음 {progress['empty']}, 실패 {progress['failed']}) "
+            f"{progress['rate_per_second']:.2f}건/초, 남은 시간 {_format_seconds(progress['eta_seconds'])}"
+        )
+
+    previous = read_checkpoint(get_statement_store(opendart_config))
+    if previous.get("progress"):
+        done, total = previous["progress"]["done"], previous["progress"]["total"]
+        click.echo(f"이전 실행 ({previous.get('updated_at')}): {done}/{total}건 처리, 저장된 항목은 건너뛰고 이어서 수집합니다.")
+
+    api = FinancialInfoAPI(OpenDartClient(opendart_config))
+    summary = api.ingest_statements(
+        list(years), list(reprt_codes), list(fs_divs),
+        corp_codes=list(corp_codes) or None, reserve=reserve, on_progress=on_progress
+    )
+    if summary.get("status") != "000":
+        click.echo(f"❌ 수집 중단: {summary.get('message')} ({summary['done']}/{summary['total']}건 처리)", err=True)
+        sys.exit(1)
+    click.echo(
+        f"✅ {summary['corp_count']}개사 {summary['total']}건 수집 "
+        f"(저장 {summary['stored']}, 데이터 없음 {summary['empty']}, 실패 {summary['failed']})"
+    )
+
+
+if __name__ == "__main__":
+    main()
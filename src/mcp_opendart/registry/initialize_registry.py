@@ -39,6 +39,18 @@ def initialize_registry() -> ToolRegistry:
                 "end_de": {
                     "type": "string",
                     "description": "검색 종료일 (YYYYMMDD)"
+                },
+                "page_no": {
+                    "type": "integer",
+                    "description": "특정 페이지(100건 단위)만 DART에서 직접 조회. 생략하면 로컬 공시 이력에서 전체 기간 반환"
+                },
+                "max_rows": {
+                    "type": "integer",
+                    "description": "전체 조회 시 최대 반환 건수 (기본값: 200)"
+                },
+                "latest_only": {
+                    "type": "boolean",
+                    "description": "정정 공시로 대체된 버전을 빼고 최신 유효 버전만 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bgn_de", "end_de"]
@@ -69,6 +81,10 @@ def initialize_registry() -> ToolRegistry:
                     "type": "string",
                     "description": "재무제표 구분 (OFS: 개별, CFS: 연결)",
                     "nullable": True
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -84,8 +100,9 @@ def initialize_registry() -> ToolRegistry:
             "type": "object",
             "properties": {
                 "corp_code": {
-                    "type": "string",
-                    "description": "기업 고유번호 목록 (콤마 구분)"
+                    "type": ["string", "array"],
+                    "items": {"type": "string"},
+                    "description": "기업 고유번호 목록 (콤마 구분 문자열 또는 배열, 개수 제한 없음 - 100개씩 나누어 동시 조회)"
                 },
                 "bsns_year": {
                     "type": "string",
@@ -159,8 +176,9 @@ def initialize_registry() -> ToolRegistry:
             "type": "object",
             "properties": {
                 "corp_code": {
-                    "type": "string",
-                    "description": "기업 고유번호 목록 (콤마 구분)"
+                    "type": ["string", "array"],
+                    "items": {"type": "string"},
+                    "description": "기업 고유번호 목록 (콤마 구분 문자열 또는 배열, 개수 제한 없음 - 100개씩 나누어 동시 조회)"
                 },
                 "bsns_year": {
                     "type": "string",
@@ -183,7 +201,7 @@ def initialize_registry() -> ToolRegistry:
     registry.register_tool(
         name="get_xbrl_taxonomy",
         korean_name="XBRL 표준 계정체계 조회",
-        description="IFRS 기반 XBRL 재무제표 표준 계정체계를 조회하여 재무데이터 정형화와 비교 분석을 지원",
+        description="IFRS 기반 XBRL 재무제표 표준 계정체계를 조회하여 재무데이터 정형화와 비교 분석을 지원 (양식 구분만 지정하면 로컬 저장소 사용, 계정 순서·깊이·상위 계정 포함)",
         parameters={
             "type": "object",
             "properties": {
@@ -248,6 +266,10 @@ def initialize_registry() -> ToolRegistry:
                 "fs_div": {
                     "type": "string",
                     "description": "재무제표 구분 (OFS: 개별, CFS: 연결). 기본값: 'OFS'"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -273,6 +295,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "주식 수·지분율을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -303,6 +329,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "주식 수·지분율을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -333,6 +363,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "주식 수·지분율을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -1699,6 +1733,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -1729,6 +1767,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "주식 수·지분율을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -1788,6 +1830,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -1817,6 +1863,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -1846,6 +1896,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -1876,6 +1930,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -1906,6 +1964,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -1936,6 +1998,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "주식 수·지분율을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -1968,6 +2034,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -1998,6 +2068,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -2028,6 +2102,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -2058,6 +2136,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -2088,6 +2170,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -2118,6 +2204,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -2177,6 +2267,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -2206,6 +2300,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -2266,6 +2364,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -2296,6 +2398,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -2326,6 +2432,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -2356,6 +2466,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -2386,6 +2500,10 @@ def initialize_registry() -> ToolRegistry:
                 "reprt_code": {
                     "type": "string",
                     "description": "보고서 코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)"
+                },
+                "numeric": {
+                    "type": "boolean",
+                    "description": "금액을 숫자 열(열 단위 data)로 변환하여 반환 (기본값: false)"
                 }
             },
             "required": ["corp_code", "bsns_year", "reprt_code"]
@@ -2397,4 +2515,585 @@ def initialize_registry() -> ToolRegistry:
         ]
     )
 
+    registry.register_tool(
+        name="get_disclosure_section",
+        korean_name="공시서류 목차·섹션 조회",
+        description="공시서류 원본(document.xml)의 목차를 확인하고 필요한 섹션 본문만 발췌하여 사업보고서 등을 효율적으로 분석. 정정 공시가 있으면 최신 버전을 조회하며, 요청한 버전 그대로 보려면 resolve_latest=false",
+        parameters={
+            "type": "object",
+            "properties": {
+                "rcept_no": {
+                    "type": "string",
+                    "description": "접수번호(14자리)"
+                },
+                "section": {
+                    "type": "string",
+                    "description": "섹션 id 또는 제목 (예: II. 사업의 내용). 생략 시 목차 반환",
+                    "nullable": True
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "본문 시작 위치(문자 수), 이전 응답의 next_offset"
+                },
+                "max_chars": {
+                    "type": "integer",
+                    "description": "반환할 최대 문자 수 (기본값: 20000)"
+                },
+                "resolve_latest": {
+                    "type": "boolean",
+                    "description": "정정 공시가 있으면 최신 유효 버전의 원본을 조회 (기본값: true, false면 요청한 접수번호 그대로)"
+                }
+            },
+            "required": ["rcept_no"]
+        },
+        linked_tools=["get_disclosure_list", "get_corporation_code_by_name"]
+    )
+
+    registry.register_tool(
+        name="get_disclosure_table",
+        korean_name="공시서류 표 조회",
+        description="공시서류 섹션 내 표를 단위 정보와 숫자형 열로 변환하여 조회, 본문 전체 대신 필요한 표만 확인. 정정 공시가 있으면 최신 버전을 조회하며, 요청한 버전 그대로 보려면 resolve_latest=false",
+        parameters={
+            "type": "object",
+            "properties": {
+                "rcept_no": {
+                    "type": "string",
+                    "description": "접수번호(14자리)"
+                },
+                "section": {
+                    "type": "string",
+                    "description": "섹션 id 또는 제목"
+                },
+                "table_no": {
+                    "type": "integer",
+                    "description": "섹션 내 표 번호(0부터). 생략 시 표 목록 반환",
+                    "nullable": True
+                },
+                "resolve_latest": {
+                    "type": "boolean",
+                    "description": "정정 공시가 있으면 최신 유효 버전의 원본을 조회 (기본값: true, false면 요청한 접수번호 그대로)"
+                }
+            },
+            "required": ["rcept_no", "section"]
+        },
+        linked_tools=["get_disclosure_section", "get_disclosure_list"]
+    )
+
+    registry.register_tool(
+        name="get_xbrl_facts",
+        korean_name="XBRL 팩트 조회",
+        description="정기보고서 XBRL 인스턴스 문서의 팩트(개념, 기간, 단위, 소수점, 값)를 개념명·기간 조건으로 조회. 정정 공시가 있으면 최신 버전을 조회하며, 요청한 버전 그대로 보려면 resolve_latest=false",
+        parameters={
+            "type": "object",
+            "properties": {
+                "rcept_no": {
+                    "type": "string",
+                    "description": "접수번호(14자리)"
+                },
+                "reprt_code": {
+                    "type": "string",
+                    "description": "보고서 코드 (11011:사업보고서, 11012:반기보고서, 11013:1분기보고서, 11014:3분기보고서)"
+                },
+                "concept": {
+                    "type": "string",
+                    "description": "개념명 일부 (예: Revenue, ifrs-full:Assets)",
+                    "nullable": True
+                },
+                "period": {
+                    "type": "string",
+                    "description": "기간 접두어 (예: 2023, 2023-12-31)",
+                    "nullable": True
+                },
+                "include_dimensions": {
+                    "type": "boolean",
+                    "description": "차원(세그먼트 등)이 있는 팩트 포함 여부"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "최대 반환 건수 (기본값: 200)"
+                },
+                "resolve_latest": {
+                    "type": "boolean",
+                    "description": "정정 공시가 있으면 최신 유효 버전의 XBRL을 조회 (기본값: true, false면 요청한 접수번호 그대로)"
+                }
+            },
+            "required": ["rcept_no", "reprt_code"]
+        },
+        linked_tools=["get_disclosure_list", "get_single_acc", "get_xbrl_taxonomy"]
+    )
+
+    registry.register_tool(
+        name="search_disclosures",
+        korean_name="기간 제한 없는 공시검색",
+        description="고유번호 없이 시장 전체 공시를 3개월 단위로 나누어 병렬 조회하고 접수번호 기준으로 합쳐 반환",
+        parameters={
+            "type": "object",
+            "properties": {
+                "bgn_de": {
+                    "type": "string",
+                    "description": "검색 시작일 (YYYYMMDD)"
+                },
+                "end_de": {
+                    "type": "string",
+                    "description": "검색 종료일 (YYYYMMDD)"
+                },
+                "corp_code": {
+                    "type": "string",
+                    "description": "기업 고유번호(8자리). 생략 시 시장 전체 검색",
+                    "nullable": True
+                },
+                "pblntf_ty": {
+                    "type": "string",
+                    "description": "공시유형 (A: 정기공시, B: 주요사항보고, C: 발행공시, D: 지분공시, E: 기타공시, F: 외부감사관련, G: 펀드공시, H: 자산유동화, I: 거래소공시, J: 공정위공시)",
+                    "nullable": True
+                },
+                "pblntf_detail_ty": {
+                    "type": "string",
+                    "description": "공시상세유형 (예: A001 사업보고서, B001 주요사항보고서)",
+                    "nullable": True
+                },
+                "corp_cls": {
+                    "type": "string",
+                    "description": "법인구분 (Y: 유가증권, K: 코스닥, N: 코넥스, E: 기타)",
+                    "nullable": True
+                },
+                "max_rows": {
+                    "type": "integer",
+                    "description": "최대 반환 건수, 최신순 (기본값: 500)"
+                }
+            },
+            "required": ["bgn_de", "end_de"]
+        },
+        linked_tools=["get_disclosure_list", "get_corporation_code_by_name", "get_disclosure_section"]
+    )
+
+    registry.register_tool(
+        name="get_daily_disclosures",
+        korean_name="일별 시장 전체 공시 조회",
+        description="수집 작업(mcp-opendart-daily)이 저장한 일자별 시장 전체 공시를 DART 호출 없이 조회하고 공시유형별 건수를 확인",
+        parameters={
+            "type": "object",
+            "properties": {
+                "date": {
+                    "type": "string",
+                    "description": "접수일 (YYYYMMDD)"
+                },
+                "pblntf_ty": {
+                    "type": "string",
+                    "description": "공시유형 (A: 정기공시, B: 주요사항보고, C: 발행공시, D: 지분공시, E: 기타공시, F: 외부감사관련, G: 펀드공시, H: 자산유동화, I: 거래소공시, J: 공정위공시)",
+                    "nullable": True
+                },
+                "corp_cls": {
+                    "type": "string",
+                    "description": "법인구분 (Y: 유가증권, K: 코스닥, N: 코넥스, E: 기타)",
+                    "nullable": True
+                },
+                "corp_code": {
+                    "type": "string",
+                    "description": "기업 고유번호(8자리)",
+                    "nullable": True
+                },
+                "max_rows": {
+                    "type": "integer",
+                    "description": "최대 반환 건수 (기본값: 500)"
+                }
+            },
+            "required": ["date"]
+        },
+        linked_tools=["search_disclosures", "get_disclosure_list", "get_disclosure_section"]
+    )
+
+    registry.register_tool(
+        name="watch_disclosures",
+        korean_name="관심 기업 신규 공시 구독",
+        description="관심 기업의 신규 공시를 서버 폴링 스트림에서 골라 구독 세션으로 즉시 알림, 반복 조회 없이 공시 모니터링",
+        parameters={
+            "type": "object",
+            "properties": {
+                "corp_codes": {
+                    "type": "string",
+                    "description": "기업 고유번호 목록 (쉼표로 구분)"
+                },
+                "report_keywords": {
+                    "type": "string",
+                    "description": "보고서명 키워드 (쉼표로 구분, 예: 주요사항보고서,최대주주). 생략 시 모든 공시",
+                    "nullable": True
+                }
+            },
+            "required": ["corp_codes"]
+        },
+        linked_tools=["get_corporation_code_by_name", "unwatch_disclosures", "list_disclosure_watches", "get_disclosure_section"]
+    )
+
+    registry.register_tool(
+        name="unwatch_disclosures",
+        korean_name="관심 기업 구독 해제",
+        description="watch_disclosures로 등록한 관심 기업 구독을 해제",
+        parameters={
+            "type": "object",
+            "properties": {
+                "subscription_id": {
+                    "type": "string",
+                    "description": "구독 id (watch_disclosures 응답의 subscription_id)"
+                }
+            },
+            "required": ["subscription_id"]
+        },
+        linked_tools=["watch_disclosures", "list_disclosure_watches"]
+    )
+
+    registry.register_tool(
+        name="list_disclosure_watches",
+        korean_name="관심 기업 구독 목록 조회",
+        description="현재 세션에 등록된 관심 기업 구독과 리소스 URI를 조회",
+        parameters={
+            "type": "object",
+            "properties": {},
+            "required": []
+        },
+        linked_tools=["watch_disclosures", "unwatch_disclosures"]
+    )
+
+    registry.register_tool(
+        name="search_disclosure_titles",
+        korean_name="공시 제목 검색",
+        description="로컬 일별 공시·공시 이력의 보고서명 색인을 DART 호출 없이 검색하여 특정 공시(유상증자결정, 최대주주변경 등)를 낸 기업 탐색",
+        parameters={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "보고서명 검색어 (공백으로 구분 시 모두 포함)"
+                },
+                "bgn_de": {
+                    "type": "string",
+                    "description": "접수일 시작 (YYYYMMDD)",
+                    "nullable": True
+                },
+                "end_de": {
+                    "type": "string",
+                    "description": "접수일 종료 (YYYYMMDD)",
+                    "nullable": True
+                },
+                "corp_cls": {
+                    "type": "string",
+                    "description": "법인구분 (Y: 유가증권, K: 코스닥, N: 코넥스, E: 기타)",
+                    "nullable": True
+                },
+                "pblntf_ty": {
+                    "type": "string",
+                    "description": "공시유형 (A~J)",
+                    "nullable": True
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "최대 반환 건수, 최신순 (기본값: 100)"
+                }
+            },
+            "required": ["query"]
+        },
+        linked_tools=["get_daily_disclosures", "search_disclosures", "get_disclosure_section"]
+    )
+
+    registry.register_tool(
+        name="get_major_report_detail",
+        korean_name="주요사항보고서·증권신고서 상세 조회",
+        description="접수번호의 보고서명으로 해당하는 DS005/DS006 상세 API 하나만 골라 호출하고 접수번호로 걸러 반환",
+        parameters={
+            "type": "object",
+            "properties": {
+                "rcept_no": {
+                    "type": "string",
+                    "description": "접수번호 (14자리)"
+                },
+                "corp_code": {
+                    "type": "string",
+                    "description": "고유번호 (8자리)",
+                    "nullable": True
+                },
+                "report_nm": {
+                    "type": "string",
+                    "description": "공시검색 결과의 보고서명 (corp_code와 함께 주면 공시 행 조회 생략)",
+                    "nullable": True
+                }
+            },
+            "required": ["rcept_no"]
+        },
+        linked_tools=["get_disclosure_list", "search_disclosure_titles", "get_daily_disclosures"]
+    )
+
+    registry.register_tool(
+        name="get_major_event_timeline",
+        korean_name="주요사항보고서 이벤트 타임라인",
+        description="36개 주요사항보고서 API를 동시에 조회(캐시·호출 제한 적용)하여 데이터가 있는 이벤트만 접수 순서대로 합친 타임라인 반환",
+        parameters={
+            "type": "object",
+            "properties": {
+                "corp_code": {
+                    "type": "string",
+                    "description": "고유번호 (8자리)"
+                },
+                "bgn_de": {
+                    "type": "string",
+                    "description": "검색시작 접수일자 (YYYYMMDD)"
+                },
+                "end_de": {
+                    "type": "string",
+                    "description": "검색종료 접수일자 (YYYYMMDD)"
+                }
+            },
+            "required": ["corp_code", "bgn_de", "end_de"]
+        },
+        linked_tools=["get_major_report_detail", "get_disclosure_list"]
+    )
+
+    registry.register_tool(
+        name="get_financial_series",
+        korean_name="다기간 재무 시계열 조회",
+        description="여러 사업연도·보고서의 재무제표를 동시에 조회(캐시 사용)하여 계정별 시계열 표로 반환, 사업보고서는 전기·전전기 금액으로 조회 횟수를 줄임",
+        parameters={
+            "type": "object",
+            "properties": {
+                "corp_code": {
+                    "type": "string",
+                    "description": "고유번호 (8자리)"
+                },
+                "bgn_year": {
+                    "type": "integer",
+                    "description": "시작 사업연도 (예: 2020)"
+                },
+                "end_year": {
+                    "type": "integer",
+                    "description": "종료 사업연도 (예: 2024)"
+                },
+                "reprt_codes": {
+                    "type": ["string", "array"],
+                    "items": {"type": "string"},
+                    "description": "보고서 코드 목록 (11013: 1분기, 11012: 반기, 11014: 3분기, 11011: 사업보고서, 기본값: 11011)"
+                },
+                "fs_div": {
+                    "type": "string",
+                    "description": "CFS(연결) 또는 OFS(개별)",
+                    "nullable": True
+                },
+                "all_accounts": {
+                    "type": "boolean",
+                    "description": "전체 재무제표 계정 사용 여부 (기본값: false, 주요계정)"
+                }
+            },
+            "required": ["corp_code", "bgn_year", "end_year"]
+        },
+        linked_tools=["get_single_acnt", "get_single_acc", "get_multi_acnt"]
+    )
+
+    registry.register_tool(
+        name="get_financial_ratios",
+        korean_name="재무비율 일괄 계산",
+        description="여러 회사·사업연도의 전체 재무제표(로컬 저장소 우선)에서 표준계정코드(account_id)로 계정을 찾아 수익성·안정성·성장성·활동성 비율을 한 번에 계산",
+        parameters={
+            "type": "object",
+            "properties": {
+                "corp_codes": {
+                    "type": ["string", "array"],
+                    "items": {"type": "string"},
+                    "description": "고유번호 목록 (쉼표 구분 문자열 또는 배열)"
+                },
+                "bsns_years": {
+                    "type": ["string", "array"],
+                    "items": {"type": "string"},
+                    "description": "사업연도 목록 (예: 2022,2023,2024)"
+                },
+                "reprt_code": {
+                    "type": "string",
+                    "description": "보고서 코드 (11013: 1분기, 11012: 반기, 11014: 3분기, 11011: 사업보고서, 기본값: 11011)"
+                },
+                "fs_div": {
+                    "type": "string",
+                    "description": "CFS(연결) 또는 OFS(개별) (기본값: CFS)"
+                },
+                "ratios": {
+                    "type": ["string", "array"],
+                    "items": {"type": "string"},
+                    "description": "계산할 비율 이름 (예: roe,debt_ratio, 생략 시 전체)",
+                    "nullable": True
+                },
+                "fetch_missing": {
+                    "type": "boolean",
+                    "description": "저장되지 않은 재무제표를 DART에서 조회할지 여부 (기본값: true)"
+                }
+            },
+            "required": ["corp_codes", "bsns_years"]
+        },
+        linked_tools=["get_single_acc", "get_single_index", "get_financial_series"]
+    )
+
+    registry.register_tool(
+        name="get_account_cross_section",
+        korean_name="계정 횡단면 조회",
+        description="로컬 재무제표 큐브에서 여러 회사의 같은 표준계정(account_id) 금액을 DART 호출 없이 조회, 회사별 데이터 수집 시각 포함",
+        parameters={
+            "type": "object",
+            "properties": {
+                "account_id": {
+                    "type": "string",
+                    "description": "표준계정코드 (예: ifrs-full_Revenue, dart_OperatingIncomeLoss)"
+                },
+                "bsns_year": {
+                    "type": "string",
+                    "description": "사업연도"
+                },
+                "reprt_code": {
+                    "type": "string",
+                    "description": "보고서 코드 (기본값: 11011)"
+                },
+                "fs_div": {
+                    "type": "string",
+                    "description": "CFS(연결) 또는 OFS(개별) (기본값: CFS)"
+                },
+                "corp_codes": {
+                    "type": ["string", "array"],
+                    "items": {"type": "string"},
+                    "description": "고유번호 목록 (생략 시 저장된 전체 회사)",
+                    "nullable": True
+                },
+                "sj_div": {
+                    "type": "string",
+                    "description": "재무제표 구분 (BS, IS, CIS, CF)",
+                    "nullable": True
+                },
+                "measure": {
+                    "type": "string",
+                    "description": "금액 열 (thstrm_amount, thstrm_add_amount, frmtrm_amount, frmtrm_add_amount, 기본값: thstrm_amount)"
+                }
+            },
+            "required": ["account_id", "bsns_year"]
+        },
+        linked_tools=["get_single_acc", "get_financial_ratios"]
+    )
+
+    registry.register_tool(
+        name="screen_financials",
+        korean_name="재무 스크리닝",
+        description="로컬 재무제표 큐브의 전체 회사에 재무비율·계정 조건식을 배열 단위로 평가하여 선별·정렬, 회사별 데이터 수집 시각 포함",
+        parameters={
+            "type": "object",
+            "properties": {
+                "expression": {
+                    "type": "string",
+                    "description": "조건식 (예: debt_ratio < 50 and operating_margin > 15). 변수: 재무비율(roe, roa, debt_ratio 등), 계정(revenue, assets 등)"
+                },
+                "bsns_year": {
+                    "type": "string",
+                    "description": "사업연도 (생략 시 저장된 가장 최근 연도)",
+                    "nullable": True
+                },
+                "reprt_code": {
+                    "type": "string",
+                    "description": "보고서 코드 (기본값: 11011)"
+                },
+                "fs_div": {
+                    "type": "string",
+                    "description": "CFS(연결) 또는 OFS(개별) (기본값: CFS)"
+                },
+                "corp_cls": {
+                    "type": "string",
+                    "description": "법인구분 (Y: 유가증권, K: 코스닥, N: 코넥스, E: 기타). 로컬 공시가 없어 구분을 모르는 회사는 제외되고 unknown_market_count로 집계",
+                    "nullable": True
+                },
+                "sort_by": {
+                    "type": "string",
+                    "description": "정렬 기준 식 (예: roe)",
+                    "nullable": True
+                },
+                "descending": {
+                    "type": "boolean",
+                    "description": "내림차순 정렬 여부 (기본값: true)"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "최대 반환 건수 (기본값: 50)"
+                },
+                "columns": {
+                    "type": ["string", "array"],
+                    "items": {"type": "string"},
+                    "description": "결과에 추가로 표시할 변수",
+                    "nullable": True
+                }
+            },
+            "required": ["expression"]
+        },
+        linked_tools=["get_financial_ratios", "get_account_cross_section"]
+    )
+
+    registry.register_tool(
+        name="get_quarterly_series",
+        korean_name="분기별 재무 시계열 조회",
+        description="누적 공시 금액(thstrm_add_amount)을 분기별 3개월 금액으로 변환하여 전체 계정의 분기 시계열 반환 (4분기 = 연간 - 3분기 누적, 재무상태표는 분기말 잔액)",
+        parameters={
+            "type": "object",
+            "properties": {
+                "corp_code": {
+                    "type": "string",
+                    "description": "고유번호 (8자리)"
+                },
+                "bgn_year": {
+                    "type": "integer",
+                    "description": "시작 사업연도 (예: 2023)"
+                },
+                "end_year": {
+                    "type": "integer",
+                    "description": "종료 사업연도 (예: 2024)"
+                },
+                "fs_div": {
+                    "type": "string",
+                    "description": "CFS(연결) 또는 OFS(개별) (기본값: CFS)"
+                },
+                "account_ids": {
+                    "type": ["string", "array"],
+                    "items": {"type": "string"},
+                    "description": "표준계정코드 목록 (생략 시 전체 계정)",
+                    "nullable": True
+                },
+                "sj_div": {
+                    "type": "string",
+                    "description": "재무제표 구분 (BS, IS, CIS, CF)",
+                    "nullable": True
+                },
+                "fetch_missing": {
+                    "type": "boolean",
+                    "description": "저장되지 않은 재무제표를 DART에서 조회할지 여부 (기본값: true)"
+                }
+            },
+            "required": ["corp_code", "bgn_year", "end_year"]
+        },
+        linked_tools=["get_single_acc", "get_financial_series"]
+    )
+
+    registry.register_tool(
+        name="get_all_indices",
+        korean_name="주요 재무지표 전체 분류 조회",
+        description="수익성(M210000)·안정성(M220000)·성장성(M230000)·활동성(M240000) 지표를 여러 기간에 대해 동시에 조회(캐시 사용)하여 지표별 기간 값 표로 반환",
+        parameters={
+            "type": "object",
+            "properties": {
+                "corp_code": {
+                    "type": "string",
+                    "description": "고유번호 (8자리)"
+                },
+                "bsns_years": {
+                    "type": ["string", "array"],
+                    "items": {"type": "string"},
+                    "description": "사업연도 목록 (예: 2023,2024)"
+                },
+                "reprt_codes": {
+                    "type": ["string", "array"],
+                    "items": {"type": "string"},
+                    "description": "보고서 코드 목록 (11013: 1분기, 11012: 반기, 11014: 3분기, 11011: 사업보고서, 기본값: 11011)"
+                }
+            },
+            "required": ["corp_code", "bsns_years"]
+        },
+        linked_tools=["get_single_index", "get_financial_ratios"]
+    )
+
     return registry
@@ -18,6 +18,8 @@ from .apis.client import OpenDartClient
 from .apis import ds001, ds002, ds003, ds004, ds005, ds006
 from typing import AsyncIterator
 from mcp_opendart.registry.initialize_registry import initialize_registry
+from .utils.parse_pool import parse_pool
+from .utils.disclosure_poller import disclosure_poller
 
 # 로거 설정
 mcp_config = MCPConfig.from_env()
@@ -127,6 +129,8 @@ async def opendart_lifespan(app: FastMCP) -> AsyncIterator[OpenDartContext]:
         )
         
         logger.info("OpenDART client and API modules initialized successfully.")
+        if opendart_config.poller_enabled:
+            disclosure_poller.start(ctx.ds001)
         yield ctx
         
     except Exception as e:
@@ -134,6 +138,9 @@ async def opendart_lifespan(app: FastMCP) -> AsyncIterator[OpenDartContext]:
         raise
     finally:
         logger.info("Shutting down OpenDART FastMCP server...")
+        if opendart_config.poller_enabled:
+            disclosure_poller.stop()
+        parse_pool.shutdown()
 
 tool_registry = initialize_registry()
 # Create the main FastMCP instance
@@ -147,7 +154,8 @@ mcp = FastMCP(
 import importlib
 for module_name in [
     "disclosure_tools", "financial_info_tools", "major_report_tools",
-    "ownership_disclosure_tools", "periodic_report_tools", "securities_filing_tools"
+    "ownership_disclosure_tools", "periodic_report_tools", "securities_filing_tools",
+    "watchlist_tools"
 ]:
     importlib.import_module(f"mcp_opendart.tools.{module_name}")
 
@@ -1,8 +1,9 @@
-import logging, datetime
-from typing import Any, Optional
+import asyncio, logging, datetime
+from typing import Any, Dict, Optional
 from mcp_opendart.server import mcp
 from mcp.types import TextContent
 from mcp_opendart.utils.ctx_helper import with_context
+from mcp_opendart.utils.parse_pool import parse_pool
 from mcp_opendart.registry.initialize_registry import initialize_registry
 
 logger = logging.getLogger("mcp-opendart")
@@ -55,6 +56,36 @@ async def get_opendart_tool_info(
 
     return TextContent(type="text", text=text.strip())
 
+@mcp.tool(
+    name="get_server_status",
+    description="파싱 풀 작업 통계(대기·실행 중 작업 수, 대기 시간, 파싱 시간)와 OpenDART 호출 한도 여유를 조회하여 서버 부하 확인",
+    tags={"서버상태", "모니터링"}
+)
+async def get_server_status(
+    ctx: Optional[Any] = None,
+) -> TextContent:
+    """
+    서버 상태 조회
+
+    parse_pool: 작업 종류(document, xbrl, corpcode 등)별 처리·오류·취소 건수, pending(대기·실행 중), 대기/파싱 시간
+    rate_limit: 호출 한도(capacity, 초당 보충량)와 현재 남은 호출 수
+    """
+    def status(context: Any) -> Dict[str, Any]:
+        limiter = context.client.rate_limiter
+        return {
+            "status": "000",
+            "message": "정상",
+            "parse_pool": {"max_workers": parse_pool.max_workers, "jobs": parse_pool.stats()},
+            "rate_limit": {
+                "capacity": limiter.capacity,
+                "rate_per_second": round(limiter.rate, 3),
+                "available": round(limiter.available(), 2),
+            },
+        }
+
+    result = with_context(ctx, "get_server_status", status)
+    return TextContent(type="text", text=str(result))
+
 @mcp.tool(
     name="get_corporation_code_by_name",
     description="기업명을 이용하여 기업 고유번호 조회, 공시조회를 위해 가장 먼저 실행하여 고유번호를 얻어야 함",
@@ -64,7 +95,7 @@ async def get_corporation_code_by_name(
     corp_name: str,
     ctx: Optional[Any] = None,
 ) -> TextContent:
-    result = with_context(ctx, "get_corporation_code_by_name", lambda context: context.ds001.get_corporation_code_by_name(corp_name))
+    result = await asyncio.to_thread(with_context, ctx, "get_corporation_code_by_name", lambda context: context.ds001.get_corporation_code_by_name(corp_name))
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -72,10 +103,13 @@ async def get_corporation_code_by_name(
     description="지정 기간 내 공시 접수 목록을 조회하여 기업 활동의 주요 이벤트 발생 여부 탐색",
     tags={"공시", "목록", "접수내역", "이벤트탐지"}
 )
-def get_disclosure_list(
+async def get_disclosure_list(
     corp_code: str,
     bgn_de: str,
     end_de: str,
+    page_no: Optional[int] = None,
+    max_rows: int = 200,
+    latest_only: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -85,10 +119,130 @@ def get_disclosure_list(
         corp_code (str): 공시대상회사의 고유번호 (8자리)
         bgn_de (str): 조회 시작일 (YYYYMMDD)
         end_de (str): 조회 종료일 (YYYYMMDD)
+        page_no (Optional[int]): 특정 페이지(100건 단위)만 DART에서 직접 조회. 생략하면 로컬 공시 이력에서 전체 기간을 반환
+        max_rows (int): 전체 조회 시 최대 반환 건수. 기본값: 200
+        latest_only (bool): 정정 공시로 대체된 원문·이전 정정본을 빼고 최신 유효 버전만 반환. 기본값: False
+
+    참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS001&apiId=2019001
+    """
+    if page_no is not None:
+        result = await asyncio.to_thread(with_context, ctx, "get_disclosure_list", lambda context: context.ds001.get_disclosure_list(
+            corp_code, bgn_de, end_de, last_report_at="Y" if latest_only else None, page_no=page_no, page_count=100
+        ))
+    else:
+        result = await asyncio.to_thread(with_context, ctx, "get_disclosure_list", lambda context: context.ds001.get_disclosure_history(
+            corp_code, bgn_de, end_de, max_rows=max_rows, latest_only=latest_only
+        ))
+    return TextContent(type="text", text=str(result))
+
+
+@mcp.tool(
+    name="search_disclosures",
+    description="기간 제한 없이 시장 전체 또는 특정 기업의 공시를 검색, 고유번호 없이도 1년 이상 기간의 공시 유형별 동향 파악",
+    tags={"공시", "목록", "시장전체", "공시검색", "이벤트탐지"}
+)
+async def search_disclosures(
+    bgn_de: str,
+    end_de: str,
+    corp_code: Optional[str] = None,
+    pblntf_ty: Optional[str] = None,
+    pblntf_detail_ty: Optional[str] = None,
+    corp_cls: Optional[str] = None,
+    max_rows: int = 500,
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    기간 제한 없는 공시검색
+
+    Args:
+        bgn_de (str): 조회 시작일 (YYYYMMDD)
+        end_de (str): 조회 종료일 (YYYYMMDD)
+        corp_code (Optional[str]): 고유번호 (8자리). 생략하면 시장 전체를 3개월 단위로 나누어 검색
+        pblntf_ty (Optional[str]): 공시유형 (A: 정기공시, B: 주요사항보고, C: 발행공시, D: 지분공시 등)
+        pblntf_detail_ty (Optional[str]): 공시상세유형 (예: A001 사업보고서)
+        corp_cls (Optional[str]): 법인구분 (Y: 유가증권, K: 코스닥, N: 코넥스, E: 기타)
+        max_rows (int): 최대 반환 건수 (최신순). 기본값: 500
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS001&apiId=2019001
     """
-    result = with_context(ctx, "get_disclosure_list", lambda context: context.ds001.get_disclosure_list(corp_code, bgn_de, end_de))
+    result = await asyncio.to_thread(with_context, ctx, "search_disclosures", lambda context: context.ds001.search_disclosures(
+        bgn_de=bgn_de,
+        end_de=end_de,
+        corp_code=corp_code,
+        max_rows=max_rows,
+        pblntf_ty=pblntf_ty,
+        pblntf_detail_ty=pblntf_detail_ty,
+        corp_cls=corp_cls
+    ))
+    return TextContent(type="text", text=str(result))
+
+
+@mcp.tool(
+    name="get_daily_disclosures",
+    description="특정 일자에 접수된 시장 전체 공시를 로컬 일별 저장소에서 조회하여 당일 공시 동향과 유형별 건수 파악",
+    tags={"공시", "일별", "시장전체", "스크리닝"}
+)
+async def get_daily_disclosures(
+    date: str,
+    pblntf_ty: Optional[str] = None,
+    corp_cls: Optional[str] = None,
+    corp_code: Optional[str] = None,
+    max_rows: int = 500,
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    일별 시장 전체 공시 조회 (mcp-opendart-daily 작업으로 수집된 데이터)
+
+    Args:
+        date (str): 접수일 (YYYYMMDD)
+        pblntf_ty (Optional[str]): 공시유형 (A: 정기공시, B: 주요사항보고, C: 발행공시, D: 지분공시 등)
+        corp_cls (Optional[str]): 법인구분 (Y: 유가증권, K: 코스닥, N: 코넥스, E: 기타)
+        corp_code (Optional[str]): 고유번호 (8자리)
+        max_rows (int): 최대 반환 건수. 기본값: 500
+    """
+    result = await asyncio.to_thread(with_context, ctx, "get_daily_disclosures", lambda context: context.ds001.get_daily_disclosures(
+        date=date,
+        pblntf_ty=pblntf_ty,
+        corp_cls=corp_cls,
+        corp_code=corp_code,
+        max_rows=max_rows
+    ))
+    return TextContent(type="text", text=str(result))
+
+
+@mcp.tool(
+    name="search_disclosure_titles",
+    description="로컬에 저장된 공시의 보고서명을 검색하여 유상증자결정, 최대주주변경 등 특정 유형 공시를 낸 기업을 즉시 탐색",
+    tags={"공시", "제목검색", "시장전체", "스크리닝", "이벤트탐지"}
+)
+async def search_disclosure_titles(
+    query: str,
+    bgn_de: Optional[str] = None,
+    end_de: Optional[str] = None,
+    corp_cls: Optional[str] = None,
+    pblntf_ty: Optional[str] = None,
+    limit: int = 100,
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    공시 제목 검색 (로컬 색인)
+
+    Args:
+        query (str): 보고서명 검색어 (예: 유상증자결정, 최대주주변경). 공백으로 구분하면 모두 포함
+        bgn_de (Optional[str]): 접수일 시작 (YYYYMMDD)
+        end_de (Optional[str]): 접수일 종료 (YYYYMMDD)
+        corp_cls (Optional[str]): 법인구분 (Y: 유가증권, K: 코스닥, N: 코넥스, E: 기타)
+        pblntf_ty (Optional[str]): 공시유형 (A: 정기공시, B: 주요사항보고, C: 발행공시, D: 지분공시 등)
+        limit (int): 최대 반환 건수 (최신순). 기본값: 100
+    """
+    result = await asyncio.to_thread(with_context, ctx, "search_disclosure_titles", lambda context: context.ds001.search_disclosure_titles(
+        query=query,
+        bgn_de=bgn_de,
+        end_de=end_de,
+        corp_cls=corp_cls,
+        pblntf_ty=pblntf_ty,
+        limit=limit
+    ))
     return TextContent(type="text", text=str(result))
 
 
@@ -113,6 +267,71 @@ def get_corporation_info(
     return TextContent(type="text", text=str(result))
 
 
+@mcp.tool(
+    name="get_disclosure_section",
+    description="접수번호(rcept_no)로 공시서류 목차를 조회하거나 특정 섹션(예: 'II. 사업의 내용') 본문만 발췌하여 사업 내용과 위험 요인 분석. 정정 공시가 있으면 최신 버전을 조회하며, 요청한 버전 그대로 보려면 resolve_latest=False",
+    tags={"공시서류", "목차", "섹션", "본문", "사업의내용"}
+)
+async def get_disclosure_section(
+    rcept_no: str,
+    section: Optional[str] = None,
+    offset: int = 0,
+    max_chars: int = 20000,
+    resolve_latest: bool = True,
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    공시서류 목차 및 섹션 본문 조회
+
+    Args:
+        rcept_no (str): 접수번호 (14자리)
+        section (Optional[str]): 섹션 id 또는 제목. 생략하면 목차(id, level, title)를 반환
+        offset (int): 본문 시작 위치(문자 수). 응답의 next_offset으로 이어서 조회
+        max_chars (int): 반환할 최대 문자 수. 기본값: 20000
+        resolve_latest (bool): 정정 공시가 있으면 최신 유효 버전의 원본을 조회. 기본값: True (False면 요청한 접수번호 그대로)
+    """
+    await with_context(ctx, "prepare_section_index", lambda context: context.ds001.prepare_section_index(rcept_no, resolve_latest))
+    result = await asyncio.to_thread(with_context, ctx, "get_disclosure_section", lambda context: context.ds001.get_disclosure_section(
+        rcept_no=rcept_no,
+        section=section,
+        offset=offset,
+        max_chars=max_chars,
+        resolve_latest=resolve_latest
+    ))
+    return TextContent(type="text", text=str(result))
+
+
+@mcp.tool(
+    name="get_disclosure_table",
+    description="공시서류 섹션 내 표(부문별 매출, 차입금 명세, 특수관계자 거래 등)를 단위와 숫자가 정리된 열 단위 데이터로 조회. 정정 공시가 있으면 최신 버전을 조회하며, 요청한 버전 그대로 보려면 resolve_latest=False",
+    tags={"공시서류", "표", "부문정보", "차입금", "특수관계자"}
+)
+async def get_disclosure_table(
+    rcept_no: str,
+    section: str,
+    table_no: Optional[int] = None,
+    resolve_latest: bool = True,
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    공시서류 섹션 내 표 조회
+
+    Args:
+        rcept_no (str): 접수번호 (14자리)
+        section (str): 섹션 id 또는 제목 (get_disclosure_section 목차 참고)
+        table_no (Optional[int]): 섹션 내 표 번호(0부터). 생략하면 표 목록(단위, 행 수, 열 이름)을 반환
+        resolve_latest (bool): 정정 공시가 있으면 최신 유효 버전의 원본을 조회. 기본값: True (False면 요청한 접수번호 그대로)
+    """
+    await with_context(ctx, "prepare_section_index", lambda context: context.ds001.prepare_section_index(rcept_no, resolve_latest))
+    result = await asyncio.to_thread(with_context, ctx, "get_disclosure_table", lambda context: context.ds001.get_disclosure_table(
+        rcept_no=rcept_no,
+        section=section,
+        table_no=table_no,
+        resolve_latest=resolve_latest
+    ))
+    return TextContent(type="text", text=str(result))
+
+
 # @mcp.tool(
 #     name="get_disclosure_document",
 #     description="접수번호(rcp_no)를 이용하여 공시서류 원본파일(XML)의 다운로드 정보를 조회합니다.",
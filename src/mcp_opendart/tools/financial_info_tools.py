@@ -1,7 +1,9 @@
+import asyncio
 import logging
-from typing import Any, Optional
+from typing import Any, List, Optional, Union
 from mcp_opendart.server import mcp
 from mcp.types import TextContent
+from mcp_opendart.utils.amounts import normalize_response
 from mcp_opendart.utils.ctx_helper import with_context
 
 logger = logging.getLogger("mcp-opendart")
@@ -16,6 +18,7 @@ def get_single_acnt(
     bsns_year: str,
     reprt_code: str,
     fs_div: Optional[str] = None,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -26,6 +29,7 @@ def get_single_acnt(
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서 코드 (예: 11011: 사업보고서, 11012: 반기보고서 등)
         fs_div (Optional[str]): 개별/연결 구분 (OFS: 개별, CFS: 연결). 기본값 없음.
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS003&apiId=2019016
     """
@@ -35,6 +39,8 @@ def get_single_acnt(
         reprt_code=reprt_code,
         fs_div=fs_div
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -42,8 +48,8 @@ def get_single_acnt(
     description="연결 재무제표 기반 그룹 전체 재무 건전성 및 수익성 구조 분석",
     tags={"재무제표", "그룹분석", "연결재무", "재무건전성"}
 )
-def get_multi_acnt(
-    corp_code: str,
+async def get_multi_acnt(
+    corp_code: Union[str, List[str]],
     bsns_year: str,
     reprt_code: str,
     fs_div: Optional[str] = None,
@@ -53,14 +59,14 @@ def get_multi_acnt(
     다중회사 주요계정 조회
 
     Args:
-        corp_code (str): 고유번호 목록
+        corp_code (Union[str, List[str]]): 고유번호 목록 (쉼표 구분 문자열 또는 배열, 개수 제한 없음)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서 코드 (예: 11011: 사업보고서, 11012: 반기보고서 등)
         fs_div (Optional[str]): 개별/연결 구분 (OFS: 개별, CFS: 연결). 기본값 없음.
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS003&apiId=2019017
     """
-    result = with_context(ctx, "get_multi_acnt", lambda context: context.ds003.get_multi_acnt(
+    result = await asyncio.to_thread(with_context, ctx, "get_multi_acnt", lambda context: context.ds003.get_multi_acnt(
         corp_code=corp_code,
         bsns_year=bsns_year,
         reprt_code=reprt_code,
@@ -93,6 +99,45 @@ def get_multi_acnt(
 #     ))
 #     return TextContent(type="text", text=str(result))
 
+@mcp.tool(
+    name="get_xbrl_facts",
+    description="정기보고서 XBRL 원본의 팩트(개념, 기간, 단위, 값)를 개념명·기간으로 조회하여 재무제표 원본 수치 검증. 정정 공시가 있으면 최신 버전을 조회하며, 요청한 버전 그대로 보려면 resolve_latest=False",
+    tags={"XBRL", "원본파일", "팩트", "재무제표", "정기보고서"}
+)
+async def get_xbrl_facts(
+    rcept_no: str,
+    reprt_code: str,
+    concept: Optional[str] = None,
+    period: Optional[str] = None,
+    include_dimensions: bool = False,
+    limit: int = 200,
+    resolve_latest: bool = True,
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    XBRL 팩트 조회
+
+    Args:
+        rcept_no (str): 접수번호 (예: 20240312000736)
+        reprt_code (str): 보고서 코드 (11011: 사업보고서, 11012: 반기보고서 등)
+        concept (Optional[str]): 개념명 일부 (예: Revenue, ifrs-full:Assets)
+        period (Optional[str]): 기간 접두어 (예: 2023, 2023-12-31)
+        include_dimensions (bool): 차원(세그먼트 등)이 있는 팩트 포함 여부. 기본값: False
+        limit (int): 최대 반환 건수. 기본값: 200
+        resolve_latest (bool): 정정 공시가 있으면 최신 유효 버전의 XBRL을 조회. 기본값: True (False면 요청한 접수번호 그대로)
+    """
+    await with_context(ctx, "prepare_xbrl_facts", lambda context: context.ds003.prepare_xbrl_facts(rcept_no, reprt_code, resolve_latest))
+    result = await asyncio.to_thread(with_context, ctx, "get_xbrl_facts", lambda context: context.ds003.get_xbrl_facts(
+        rcept_no=rcept_no,
+        reprt_code=reprt_code,
+        concept=concept,
+        period=period,
+        include_dimensions=include_dimensions,
+        limit=limit,
+        resolve_latest=resolve_latest
+    ))
+    return TextContent(type="text", text=str(result))
+
 @mcp.tool(
     name="get_single_acc",
     description="단일 기업의 전체 XBRL 재무제표 데이터를 기반으로 세부 계정까지 정밀 분석",
@@ -103,6 +148,7 @@ def get_single_acc(
     bsns_year: str,
     reprt_code: str,
     fs_div: str = "OFS",
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -113,6 +159,7 @@ def get_single_acc(
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서 코드 (예: 11011: 사업보고서)
         fs_div (str): 개별/연결 구분 (OFS: 개별, CFS: 연결). 기본값: "OFS"
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS003&apiId=2019020
     """
@@ -122,6 +169,198 @@ def get_single_acc(
         reprt_code=reprt_code,
         fs_div=fs_div
     ))
+    if numeric:
+        result = normalize_response(result)
+    return TextContent(type="text", text=str(result))
+
+@mcp.tool(
+    name="get_financial_series",
+    description="한 기업의 여러 사업연도·분기 재무제표를 한 번에 동시 조회하여 계정별 시계열 표(매출, 영업이익, 자산 등 추이) 생성",
+    tags={"재무제표", "시계열", "추이분석", "단일회사", "다기간"}
+)
+async def get_financial_series(
+    corp_code: str,
+    bgn_year: int,
+    end_year: int,
+    reprt_codes: Union[str, List[str]] = "11011",
+    fs_div: Optional[str] = None,
+    all_accounts: bool = False,
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    다기간 재무 시계열 조회
+
+    Args:
+        corp_code (str): 고유번호 (8자리)
+        bgn_year (int): 시작 사업연도 (예: 2020)
+        end_year (int): 종료 사업연도 (예: 2024)
+        reprt_codes (Union[str, List[str]]): 보고서 코드 목록 (11013: 1분기, 11012: 반기, 11014: 3분기, 11011: 사업보고서). 기본값: "11011"
+        fs_div (Optional[str]): CFS(연결) 또는 OFS(개별). 생략 시 주요계정은 둘 다, 전체 재무제표는 CFS
+        all_accounts (bool): 전체 재무제표 계정 사용 여부. 기본값: False (주요계정)
+    """
+    result = await asyncio.to_thread(with_context, ctx, "get_financial_series", lambda context: context.ds003.get_financial_series(
+        corp_code=corp_code,
+        bgn_year=bgn_year,
+        end_year=end_year,
+        reprt_codes=reprt_codes,
+        fs_div=fs_div,
+        all_accounts=all_accounts
+    ))
+    return TextContent(type="text", text=str(result))
+
+@mcp.tool(
+    name="get_financial_ratios",
+    description="여러 기업·여러 사업연도의 수익성·안정성·성장성·활동성 재무비율(ROE, 부채비율, 매출액증가율 등)을 저장된 전체 재무제표에서 한 번에 계산",
+    tags={"재무비율", "재무분석", "다중회사", "다기간", "전체재무제표"}
+)
+async def get_financial_ratios(
+    corp_codes: Union[str, List[str]],
+    bsns_years: Union[str, List[str]],
+    reprt_code: str = "11011",
+    fs_div: str = "CFS",
+    ratios: Optional[Union[str, List[str]]] = None,
+    fetch_missing: bool = True,
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    재무비율 일괄 계산
+
+    Args:
+        corp_codes (Union[str, List[str]]): 고유번호 목록 (쉼표 구분 문자열 또는 배열)
+        bsns_years (Union[str, List[str]]): 사업연도 목록 (예: "2022,2023,2024")
+        reprt_code (str): 보고서 코드 (11013: 1분기, 11012: 반기, 11014: 3분기, 11011: 사업보고서). 기본값: "11011"
+        fs_div (str): CFS(연결) 또는 OFS(개별). 기본값: "CFS"
+        ratios (Optional[Union[str, List[str]]]): 계산할 비율 (예: "roe,debt_ratio"). 생략 시 전체
+        fetch_missing (bool): 저장되지 않은 재무제표를 DART에서 조회할지 여부. 기본값: True
+    """
+    result = await asyncio.to_thread(with_context, ctx, "get_financial_ratios", lambda context: context.ds003.get_financial_ratios(
+        corp_codes=corp_codes,
+        bsns_years=bsns_years,
+        reprt_code=reprt_code,
+        fs_div=fs_div,
+        ratios=ratios,
+        fetch_missing=fetch_missing
+    ))
+    return TextContent(type="text", text=str(result))
+
+@mcp.tool(
+    name="get_account_cross_section",
+    description="로컬에 저장된 전체 재무제표에서 여러 기업의 같은 계정 금액(예: 2023년 매출액)을 DART 호출 없이 한 번에 조회",
+    tags={"재무제표", "계정", "횡단면", "다중회사", "로컬"}
+)
+async def get_account_cross_section(
+    account_id: str,
+    bsns_year: str,
+    reprt_code: str = "11011",
+    fs_div: str = "CFS",
+    corp_codes: Optional[Union[str, List[str]]] = None,
+    sj_div: Optional[str] = None,
+    measure: str = "thstrm_amount",
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    계정 횡단면 조회
+
+    Args:
+        account_id (str): 표준계정코드 (예: ifrs-full_Revenue, dart_OperatingIncomeLoss)
+        bsns_year (str): 사업연도
+        reprt_code (str): 보고서 코드 (11013: 1분기, 11012: 반기, 11014: 3분기, 11011: 사업보고서). 기본값: "11011"
+        fs_div (str): CFS(연결) 또는 OFS(개별). 기본값: "CFS"
+        corp_codes (Optional[Union[str, List[str]]]): 고유번호 목록. 생략 시 저장된 전체 회사
+        sj_div (Optional[str]): 재무제표 구분 (BS, IS, CIS, CF)
+        measure (str): 금액 열 (thstrm_amount, thstrm_add_amount, frmtrm_amount, frmtrm_add_amount). 기본값: "thstrm_amount"
+    """
+    result = await asyncio.to_thread(with_context, ctx, "get_account_cross_section", lambda context: context.ds003.get_account_cross_section(
+        account_id=account_id,
+        bsns_year=bsns_year,
+        reprt_code=reprt_code,
+        fs_div=fs_div,
+        corp_codes=corp_codes,
+        sj_div=sj_div,
+        measure=measure
+    ))
+    return TextContent(type="text", text=str(result))
+
+@mcp.tool(
+    name="get_quarterly_series",
+    description="1분기·반기·3분기·사업보고서의 누적 재무제표를 분기별(3개월) 금액으로 변환한 계정별 시계열 (4분기 = 연간 - 3분기 누적)",
+    tags={"재무제표", "분기실적", "시계열", "단일회사", "전체재무제표"}
+)
+async def get_quarterly_series(
+    corp_code: str,
+    bgn_year: int,
+    end_year: int,
+    fs_div: str = "CFS",
+    account_ids: Optional[Union[str, List[str]]] = None,
+    sj_div: Optional[str] = None,
+    fetch_missing: bool = True,
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    분기별 재무 시계열 조회
+
+    Args:
+        corp_code (str): 고유번호 (8자리)
+        bgn_year (int): 시작 사업연도 (예: 2023)
+        end_year (int): 종료 사업연도 (예: 2024)
+        fs_div (str): CFS(연결) 또는 OFS(개별). 기본값: "CFS"
+        account_ids (Optional[Union[str, List[str]]]): 표준계정코드 목록 (예: "ifrs-full_Revenue,dart_OperatingIncomeLoss"). 생략 시 전체 계정
+        sj_div (Optional[str]): 재무제표 구분 (BS, IS, CIS, CF)
+        fetch_missing (bool): 저장되지 않은 재무제표를 DART에서 조회할지 여부. 기본값: True
+    """
+    result = await asyncio.to_thread(with_context, ctx, "get_quarterly_series", lambda context: context.ds003.get_quarterly_series(
+        corp_code=corp_code,
+        bgn_year=bgn_year,
+        end_year=end_year,
+        fs_div=fs_div,
+        account_ids=account_ids,
+        sj_div=sj_div,
+        fetch_missing=fetch_missing
+    ))
+    return TextContent(type="text", text=str(result))
+
+@mcp.tool(
+    name="screen_financials",
+    description="로컬에 수집된 전체 상장사 재무제표에서 재무비율·계정 조건식(예: debt_ratio < 50 and operating_margin > 15)으로 기업을 선별하고 순위 매김 (DART 호출 없음)",
+    tags={"스크리닝", "재무비율", "종목선별", "시장전체", "로컬"}
+)
+async def screen_financials(
+    expression: str,
+    bsns_year: Optional[str] = None,
+    reprt_code: str = "11011",
+    fs_div: str = "CFS",
+    corp_cls: Optional[str] = None,
+    sort_by: Optional[str] = None,
+    descending: bool = True,
+    limit: int = 50,
+    columns: Optional[Union[str, List[str]]] = None,
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    재무 스크리닝
+
+    Args:
+        expression (str): 조건식. 변수는 재무비율(roe, debt_ratio, operating_margin 등)과 계정(revenue, assets 등)
+        bsns_year (Optional[str]): 사업연도. 생략 시 저장된 가장 최근 연도
+        reprt_code (str): 보고서 코드. 기본값: "11011"
+        fs_div (str): CFS(연결) 또는 OFS(개별). 기본값: "CFS"
+        corp_cls (Optional[str]): 법인구분 (Y: 유가증권, K: 코스닥, N: 코넥스, E: 기타). 구분을 모르는 회사 수는 unknown_market_count
+        sort_by (Optional[str]): 정렬 기준 식 (예: "roe")
+        descending (bool): 내림차순 정렬 여부. 기본값: True
+        limit (int): 최대 반환 건수. 기본값: 50
+        columns (Optional[Union[str, List[str]]]): 결과에 추가로 표시할 변수
+    """
+    result = await asyncio.to_thread(with_context, ctx, "screen_financials", lambda context: context.ds003.screen_financials(
+        expression=expression,
+        bsns_year=bsns_year,
+        reprt_code=reprt_code,
+        fs_div=fs_div,
+        corp_cls=corp_cls,
+        sort_by=sort_by,
+        descending=descending,
+        limit=limit,
+        columns=columns
+    ))
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -186,13 +425,39 @@ def get_single_index(
     ))
     return TextContent(type="text", text=str(result))
 
+@mcp.tool(
+    name="get_all_indices",
+    description="단일 기업의 수익성·안정성·성장성·활동성 4개 분류 주요 재무지표를 여러 기간에 대해 한 번에 동시 조회하여 하나의 지표 표로 반환",
+    tags={"재무지표", "단일회사", "다기간", "수익성", "안정성", "성장성", "활동성"}
+)
+async def get_all_indices(
+    corp_code: str,
+    bsns_years: Union[str, List[str]],
+    reprt_codes: Union[str, List[str]] = "11011",
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    주요 재무지표 전체 분류 조회
+
+    Args:
+        corp_code (str): 고유번호 (8자리)
+        bsns_years (Union[str, List[str]]): 사업연도 목록 (예: "2023,2024")
+        reprt_codes (Union[str, List[str]]): 보고서 코드 목록 (11013: 1분기, 11012: 반기, 11014: 3분기, 11011: 사업보고서). 기본값: "11011"
+    """
+    result = await asyncio.to_thread(with_context, ctx, "get_all_indices", lambda context: context.ds003.get_all_indices(
+        corp_code=corp_code,
+        bsns_years=bsns_years,
+        reprt_codes=reprt_codes
+    ))
+    return TextContent(type="text", text=str(result))
+
 @mcp.tool(
     name="get_multi_index",
     description="그룹 단위의 주요 재무지표 분석을 통한 계열사 리스크 및 성장성 평가",
     tags={"재무지표", "다중회사", "그룹분석", "수익성", "안정성", "성장성", "활동성"}
 )
-def get_multi_index(
-    corp_code: str,
+async def get_multi_index(
+    corp_code: Union[str, List[str]],
     bsns_year: str,
     reprt_code: str,
     idx_cl_code: str,
@@ -202,14 +467,14 @@ def get_multi_index(
     다중회사 주요 재무지표 조회
 
     Args:
-        corp_code (str): 고유번호 목록
+        corp_code (Union[str, List[str]]): 고유번호 목록 (쉼표 구분 문자열 또는 배열, 개수 제한 없음)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서 코드 (예: 11011: 사업보고서)
         idx_cl_code (str): 지표분류코드 (M210000: 수익성지표, M220000: 안정성지표, M230000: 성장성지표, M240000: 활동성지표)
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS003&apiId=2022002
     """
-    result = with_context(ctx, "get_multi_index", lambda context: context.ds003.get_multi_index(
+    result = await asyncio.to_thread(with_context, ctx, "get_multi_index", lambda context: context.ds003.get_multi_index(
         corp_code=corp_code,
         bsns_year=bsns_year,
         reprt_code=reprt_code,
@@ -1,4 +1,4 @@
-import logging
+import asyncio, logging
 from typing import Any, Optional
 from mcp_opendart.server import mcp
 from mcp.types import TextContent
@@ -1013,3 +1013,61 @@ def get_stock_exchange(
     ))
     return TextContent(type="text", text=str(result))
 
+
+@mcp.tool(
+    name="get_major_report_detail",
+    description="접수번호(공시검색 결과)의 보고서명으로 해당 주요사항보고서/증권신고서 상세 API 하나만 골라 구조화된 내용 조회",
+    tags={"주요사항보고서", "증권신고서", "공시상세", "라우팅"}
+)
+async def get_major_report_detail(
+    rcept_no: str,
+    corp_code: Optional[str] = None,
+    report_nm: Optional[str] = None,
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    공시 한 건의 주요사항/증권신고서 상세 조회
+
+    보고서명(예: 주요사항보고서(유상증자결정), 증권신고서(지분증권))에 맞는 DS005/DS006 API를 골라
+    접수일 하루만 조회한 뒤 접수번호로 거릅니다.
+
+    Args:
+        rcept_no (str): 접수번호 (14자리)
+        corp_code (Optional[str]): 고유번호 (8자리). 주면 공시 행을 찾는 조회가 한 번으로 끝남
+        report_nm (Optional[str]): 공시검색 결과의 보고서명. corp_code와 함께 주면 공시 행 조회 생략
+    """
+    from mcp_opendart.utils.report_router import get_report_detail
+
+    result = await asyncio.to_thread(with_context, ctx, "get_major_report_detail", lambda context: get_report_detail(
+        context,
+        rcept_no=rcept_no,
+        corp_code=corp_code,
+        report_nm=report_nm
+    ))
+    return TextContent(type="text", text=str(result))
+
+@mcp.tool(
+    name="get_major_event_timeline",
+    description="부도, 회생, CB/BW/EB 발행, 합병, 자기주식, 소송 등 모든 주요사항보고서를 한 번에 동시 조회하여 기업 실사를 위한 시간순 이벤트 타임라인 생성",
+    tags={"주요사항보고서", "실사", "이벤트타임라인", "재무리스크", "지배구조"}
+)
+async def get_major_event_timeline(
+    corp_code: str,
+    bgn_de: str,
+    end_de: str,
+    ctx: Optional[Any] = None
+) -> TextContent:
+    """
+    주요사항보고서 전체 이벤트 타임라인 조회
+
+    Args:
+        corp_code (str): 고유번호 (8자리)
+        bgn_de (str): 검색시작 접수일자 (예: 20240101)
+        end_de (str): 검색종료 접수일자 (예: 20241231)
+    """
+    result = await asyncio.to_thread(with_context, ctx, "get_major_event_timeline", lambda context: context.ds005.get_major_event_timeline(
+        corp_code=corp_code,
+        bgn_de=bgn_de,
+        end_de=end_de
+    ))
+    return TextContent(type="text", text=str(result))
@@ -2,6 +2,7 @@ import logging
 from typing import Any, Optional
 from mcp_opendart.server import mcp
 from mcp.types import TextContent
+from mcp_opendart.utils.amounts import normalize_response
 from mcp_opendart.utils.ctx_helper import with_context
 
 logger = logging.getLogger("mcp-opendart")
@@ -15,6 +16,7 @@ def get_stock_increase_decrease(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -24,6 +26,7 @@ def get_stock_increase_decrease(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019004
     """
@@ -32,6 +35,8 @@ def get_stock_increase_decrease(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -43,6 +48,7 @@ def get_dividend_info(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -52,6 +58,7 @@ def get_dividend_info(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019005
     """
@@ -60,6 +67,8 @@ def get_dividend_info(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -71,6 +80,7 @@ def get_treasury_stock(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -80,6 +90,7 @@ def get_treasury_stock(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)
+        numeric (bool): 주식 수·지분율을 쉼표 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019006
     """
@@ -88,6 +99,8 @@ def get_treasury_stock(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -99,6 +112,7 @@ def get_major_shareholder(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -108,6 +122,7 @@ def get_major_shareholder(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)
+        numeric (bool): 주식 수·지분율을 쉼표 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019007
     """
@@ -116,6 +131,8 @@ def get_major_shareholder(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -127,6 +144,7 @@ def get_major_shareholder_changes(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -136,6 +154,7 @@ def get_major_shareholder_changes(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)
+        numeric (bool): 주식 수·지분율을 쉼표 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019008
     """
@@ -144,6 +163,8 @@ def get_major_shareholder_changes(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -155,6 +176,7 @@ def get_minority_shareholder(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -164,6 +186,7 @@ def get_minority_shareholder(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)
+        numeric (bool): 주식 수·지분율을 쉼표 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019009
     """
@@ -172,6 +195,8 @@ def get_minority_shareholder(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -211,6 +236,7 @@ def get_employee_info(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -220,6 +246,7 @@ def get_employee_info(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (11011: 사업보고서, 11012: 반기보고서)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019011
     """
@@ -228,6 +255,8 @@ def get_employee_info(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -239,6 +268,7 @@ def get_individual_compensation(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -248,6 +278,7 @@ def get_individual_compensation(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019012
     """
@@ -256,6 +287,8 @@ def get_individual_compensation(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -267,6 +300,7 @@ def get_total_compensation(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -276,6 +310,7 @@ def get_total_compensation(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (11011: 사업보고서, 11012: 반기보고서, 11013: 1분기, 11014: 3분기)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019013
     """
@@ -284,6 +319,8 @@ def get_total_compensation(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -295,6 +332,7 @@ def get_individual_compensation_amount(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -304,6 +342,7 @@ def get_individual_compensation_amount(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (예: 11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019014
     """
@@ -312,6 +351,8 @@ def get_individual_compensation_amount(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -323,6 +364,7 @@ def get_investment_in_other_corp(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -332,6 +374,7 @@ def get_investment_in_other_corp(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (예: 11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019015
     """
@@ -340,6 +383,8 @@ def get_investment_in_other_corp(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -351,6 +396,7 @@ def get_stock_total(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -360,6 +406,7 @@ def get_stock_total(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (예: 11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)
+        numeric (bool): 주식 수·지분율을 쉼표 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020002
     """
@@ -368,6 +415,8 @@ def get_stock_total(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -379,6 +428,7 @@ def get_debt_securities_issued(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -388,6 +438,7 @@ def get_debt_securities_issued(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (예: 11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020003
     """
@@ -396,6 +447,8 @@ def get_debt_securities_issued(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -407,6 +460,7 @@ def get_commercial_paper_outstanding(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -416,6 +470,7 @@ def get_commercial_paper_outstanding(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (예: 11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020004
     """
@@ -424,6 +479,8 @@ def get_commercial_paper_outstanding(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -435,6 +492,7 @@ def get_short_term_bond_outstanding(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -444,6 +502,7 @@ def get_short_term_bond_outstanding(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (예: 11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020005
     """
@@ -452,6 +511,8 @@ def get_short_term_bond_outstanding(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -463,6 +524,7 @@ def get_corporate_bond_outstanding(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -472,6 +534,7 @@ def get_corporate_bond_outstanding(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (예: 11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020006
     """
@@ -480,6 +543,8 @@ def get_corporate_bond_outstanding(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -491,6 +556,7 @@ def get_hybrid_securities_outstanding(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -500,6 +566,7 @@ def get_hybrid_securities_outstanding(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (예: 11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020007
     """
@@ -508,6 +575,8 @@ def get_hybrid_securities_outstanding(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -519,6 +588,7 @@ def get_conditional_capital_securities_outstanding(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -528,6 +598,7 @@ def get_conditional_capital_securities_outstanding(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (예: 11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020008
     """
@@ -536,6 +607,8 @@ def get_conditional_capital_securities_outstanding(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -575,6 +648,7 @@ def get_audit_service_contract(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -584,6 +658,7 @@ def get_audit_service_contract(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (예: 11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020010
     """
@@ -592,6 +667,8 @@ def get_audit_service_contract(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -603,6 +680,7 @@ def get_non_audit_service_contract(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -612,6 +690,7 @@ def get_non_audit_service_contract(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (예: 11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020011
     """
@@ -620,6 +699,8 @@ def get_non_audit_service_contract(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -659,6 +740,7 @@ def get_unregistered_exec_compensation(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -668,6 +750,7 @@ def get_unregistered_exec_compensation(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (예: 11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020013
     """
@@ -676,6 +759,8 @@ def get_unregistered_exec_compensation(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -687,6 +772,7 @@ def get_executive_compensation_approved(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -696,6 +782,7 @@ def get_executive_compensation_approved(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (예: 11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020014
     """
@@ -704,6 +791,8 @@ def get_executive_compensation_approved(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -715,6 +804,7 @@ def get_executive_compensation_by_type(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -724,6 +814,7 @@ def get_executive_compensation_by_type(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (예: 11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020015
     """
@@ -732,6 +823,8 @@ def get_executive_compensation_by_type(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -743,6 +836,7 @@ def get_public_capital_usage(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -752,6 +846,7 @@ def get_public_capital_usage(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (예: 11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020016
     """
@@ -760,6 +855,8 @@ def get_public_capital_usage(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
 
 @mcp.tool(
@@ -771,6 +868,7 @@ def get_private_capital_usage(
     corp_code: str,
     bsns_year: str,
     reprt_code: str,
+    numeric: bool = False,
     ctx: Optional[Any] = None
 ) -> TextContent:
     """
@@ -780,6 +878,7 @@ def get_private_capital_usage(
         corp_code (str): 고유번호 (8자리)
         bsns_year (str): 사업연도 (예: 2024)
         reprt_code (str): 보고서코드 (예: 11011: 사업보고서, 11012: 반기보고서, 11013: 1분기보고서, 11014: 3분기보고서)
+        numeric (bool): 금액을 쉼표·단위 없는 숫자 열(열 단위 data)로 변환하여 반환. 기본값: False
 
     참고: https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020017
     """
@@ -788,4 +887,6 @@ def get_private_capital_usage(
         bsns_year=bsns_year,
         reprt_code=reprt_code
     ))
+    if numeric:
+        result = normalize_response(result)
     return TextContent(type="text", text=str(result))
@@ -0,0 +1,93 @@
+import json
+import logging
+from typing import Any, Optional
+from fastmcp import Context
+from mcp.types import TextContent
+from mcp_opendart.apis.ds003 import split_list
+from mcp_opendart.server import mcp, opendart_context
+from mcp_opendart.utils.watchlist import WATCHLIST_URI, watchlist
+
+logger = logging.getLogger("mcp-opendart")
+
+
+def _lifespan_context(ctx: "Context[Any, Any]") -> Any:
+    try:
+        return ctx.request_context.lifespan_context
+    except Exception:
+        return opendart_context
+
+
+@mcp.tool(
+    name="watch_disclosures",
+    description="관심 기업(고유번호 목록)의 신규 공시를 구독하여 접수 즉시 알림(로그 메시지, 리소스 변경)으로 수신",
+    tags={"공시", "관심기업", "알림", "실시간"}
+)
+async def watch_disclosures(
+    corp_codes: str,
+    ctx: Context,  # type: ignore[type-arg]  # FastMCP은 어노테이션이 Context 자체일 때만 컨텍스트를 주입합니다
+    report_keywords: Optional[str] = None,
+) -> TextContent:
+    """
+    관심 기업 신규 공시 구독
+
+    Args:
+        corp_codes (str): 고유번호 목록 (쉼표로 구분, 예: 00126380,00164779)
+        report_keywords (Optional[str]): 보고서명 키워드 (쉼표로 구분, 예: 주요사항보고서,최대주주). 생략 시 모든 공시
+    """
+    codes = split_list(corp_codes)
+    if not codes:
+        return TextContent(type="text", text=str({"status": "100", "message": "corp_codes를 입력하세요."}))
+
+    subscription = watchlist.add(ctx.session, codes, split_list(report_keywords or ""), _lifespan_context(ctx).ds001)
+    result = {"status": "000", "message": "정상", **subscription.summary()}
+    return TextContent(type="text", text=str(result))
+
+
+@mcp.tool(
+    name="unwatch_disclosures",
+    description="관심 기업 신규 공시 구독 해제",
+    tags={"공시", "관심기업", "알림"}
+)
+async def unwatch_disclosures(
+    subscription_id: str,
+    ctx: Context,  # type: ignore[type-arg]
+) -> TextContent:
+    """
+    관심 기업 구독 해제
+
+    Args:
+        subscription_id (str): watch_disclosures가 반환한 구독 id
+    """
+    subscription = watchlist.get(subscription_id)
+    if subscription is None or subscription.session is not ctx.session:
+        result = {"status": "013", "message": f"구독 '{subscription_id}'을(를) 찾을 수 없습니다."}
+    else:
+        watchlist.remove(subscription_id)
+        result = {"status": "000", "message": "정상", "subscription_id": subscription_id}
+    return TextContent(type="text", text=str(result))
+
+
+@mcp.tool(
+    name="list_disclosure_watches",
+    description="현재 세션의 관심 기업 구독 목록 조회",
+    tags={"공시", "관심기업", "알림"}
+)
+async def list_disclosure_watches(ctx: Context) -> TextContent:  # type: ignore[type-arg]
+    result = {
+        "status": "000",
+        "message": "정상",
+        "watches": [subscription.summary() for subscription in watchlist.for_session(ctx.session)]
+    }
+    return TextContent(type="text", text=str(result))
+
+
+@mcp.resource(
+    WATCHLIST_URI,
+    name="watchlist_filings",
+    description="관심 기업 구독에 일치한 최근 신규 공시 (최대 100건)",
+    mime_type="application/json"
+)
+def watchlist_filings(subscription_id: str) -> str:
+    subscription = watchlist.get(subscription_id)
+    filings = list(subscription.recent) if subscription else []
+    return json.dumps({"subscription_id": subscription_id, "filings": filings}, ensure_ascii=False)
@@ -0,0 +1,87 @@
+import re
+from typing import Any, Dict, Iterable, List, Tuple
+
+# 본문을 대체하는 정정 (이후 버전이 원문을 대신함)
+BODY_AMENDMENTS = ("기재정정", "발행조건확정")
+# 첨부서류만 정정·추가 (본문은 이전 버전이 유효)
+ATTACHMENT_AMENDMENTS = ("첨부정정", "첨부추가")
+
+_PREFIX = re.compile(r"^\s*\[([^\]]+)\]")
+_SPACES = re.compile(r"\s+")
+
+
+def split_report_name(report_nm: str) -> Tuple[List[str], str]:
+    """보고서명을 [기재정정] 등 접두어 목록과 본래 보고서명(공백 제거)으로 나눕니다."""
+    prefixes: List[str] = []
+    name = report_nm or ""
+    match = _PREFIX.match(name)
+    while match:
+        prefixes.append(match.group(1).strip())
+        name = name[match.end():]
+        match = _PREFIX.match(name)
+    return prefixes, _SPACES.sub("", name)
+
+
+def amendment_kind(report_nm: str) -> str:
+    """"original", "body"(본문 정정), "attachment"(첨부 정정) 중 하나"""
+    prefixes, _ = split_report_name(report_nm)
+    if any(prefix in BODY_AMENDMENTS for prefix in prefixes):
+        return "body"
+    if any(prefix in ATTACHMENT_AMENDMENTS for prefix in prefixes):
+        return "attachment"
+    return "original"
+
+
+def has_later_amendment(row: Dict[str, Any]) -> bool:
+    """비고(rm)의 "정"은 이 공시 이후 정정 공시가 제출되었음을 뜻합니다."""
+    return "정" in (row.get("rm") or "")
+
+
+def link_amendments(rows: Iterable[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """
+    공시 목록을 원문과 정정 공시의 묶음(chain)으로 연결합니다.
+
+    같은 회사·같은 제출인·같은 본래 보고서명의 공시를 접수번호 순으로 보며, 원문이 나오면 새 묶음을 시작하고
+    정정 공시는 앞선 묶음이 하나뿐이거나 비고(rm)에 이후 정정 표시가 있는 묶음이 하나뿐일 때만 그 묶음에 붙입니다.
+    어느 묶음을 정정했는지 알 수 없거나 원문이 목록에 없는 정정 공시는 그 자체로 묶음을 시작합니다.
+    """
+    groups: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+    for row in rows:
+        _, base = split_report_name(row.get("report_nm", ""))
+        groups.setdefault((row.get("corp_code", ""), row.get("flr_nm") or "", base), []).append(row)
+
+    chains: List[List[Dict[str, Any]]] = []
+    for group in groups.values():
+        group_chains: List[List[Dict[str, Any]]] = []
+        for row in sorted(group, key=lambda row: row.get("rcept_no", "")):
+            if amendment_kind(row.get("report_nm", "")) != "original":
+                candidates = group_chains
+                if len(candidates) > 1:
+                    candidates = [chain for chain in group_chains if has_later_amendment(chain[-1])]
+                if len(candidates) == 1:
+                    candidates[0].append(row)
+                    continue
+            chain = [row]
+            group_chains.append(chain)
+            chains.append(chain)
+    return chains
+
+
+def effective_version(chain: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """본문 기준 최신 유효 버전 (첨부정정·첨부추가는 본문을 대체하지 않음)"""
+    for row in chain[::-1]:
+        if amendment_kind(row.get("report_nm", "")) != "attachment":
+            return row
+    return chain[-1]
+
+
+def latest_versions(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    공시 목록에서 대체된 버전을 빼고 묶음별 최신 유효 버전만 남깁니다. (원래 목록 순서 유지)
+
+    남은 행에는 묶음의 모든 접수번호(versions, 오름차순)가 추가됩니다.
+    """
+    keep: Dict[str, List[str]] = {}
+    for chain in link_amendments(rows):
+        keep[effective_version(chain)["rcept_no"]] = [row["rcept_no"] for row in chain]
+    return [{**row, "versions": keep[row["rcept_no"]]} for row in rows if row.get("rcept_no") in keep]
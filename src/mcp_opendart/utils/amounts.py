@@ -0,0 +1,148 @@
+import math
+import re
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .table_extractor import UNIT_MULTIPLIERS, parse_number
+
+MISSING = float("nan")
+
+_STRIP = str.maketrans("", "", ", ")
+# 쉼표를 지운 뒤 바로 float로 바꿀 수 있는 표기 (그 밖은 table_extractor.parse_number로 엄격하게 해석)
+_PLAIN = re.compile(r"[+\-]?\d+(\.\d+)?$")
+# 숫자 열로 보지 않는 식별자·코드·날짜·이름 열
+_TEXT_COLUMN = re.compile(r"(^ord$|^se$|_code$|_no$|_cls$|_dt$|_de$|_div$|_nm$|_id$|year|currency)")
+# 행 라벨 끝의 단위 표기 (예: "(연결)당기순이익(백만원)", "현금배당수익률(%)")
+_LABEL_UNIT = re.compile(r"\(([^()]*)\)\s*$")
+# 행 라벨에서 단위를 찾는 열 (DS002 배당 등)
+LABEL_COLUMNS = ("se",)
+
+
+def parse_amount(value: Any) -> float:
+    """
+    금액 하나를 float로 바꿉니다. 빈 값·'-'·숫자가 아닌 값은 NaN
+
+    float()가 받아들이는 'nan', 'inf', '1e3', '1_000' 같은 표기는 금액으로 보지 않으며, 유한하지 않은 값도 NaN입니다.
+    """
+    if value is None:
+        return MISSING
+    try:
+        if isinstance(value, str):
+            text = value.translate(_STRIP)
+            if _PLAIN.match(text):
+                number = float(text)
+            else:
+                parsed = parse_number(value)
+                number = MISSING if parsed is None else float(parsed)
+        else:
+            number = float(value)
+    except (TypeError, ValueError, OverflowError):
+        return MISSING
+    return number if math.isfinite(number) else MISSING
+
+
+def parse_amounts(values: Iterable[Any]) -> "array[float]":
+    """
+    금액 문자열 목록을 한 번에 float 배열(array('d'))로 바꿉니다.
+
+    대부분의 값("1,234", "-5")은 쉼표만 지우고 바로 변환하고, 괄호·△ 음수 표기와 '%'만 느린 경로로 처리합니다.
+    빈 값과 '-'는 NaN입니다.
+    """
+    return array("d", map(parse_amount, values))
+
+
+def to_python(value: float) -> Optional[Union[int, float]]:
+    """NaN → None, 정수 값 → int (응답 직렬화용)"""
+    if math.isnan(value):
+        return None
+    return int(value) if value.is_integer() else value
+
+
+def label_unit(label: str) -> Tuple[Optional[str], int]:
+    """행 라벨 끝의 '(백만원)' 같은 표기에서 단위와 원/주 기준 배수를 찾습니다."""
+    match = _LABEL_UNIT.search(label or "")
+    if not match:
+        return None, 1
+    unit = match.group(1).replace(" ", "")
+    if unit == "%":
+        return unit, 1
+    multiplier = UNIT_MULTIPLIERS.get(unit)
+    return (unit, multiplier) if multiplier is not None else (None, 1)
+
+
+def base_unit(unit: str) -> str:
+    """배수를 곱한 뒤의 단위 (천원 → 원, 천주 → 주)"""
+    return "주" if unit.endswith("주") else "원"
+
+
+def _is_numeric(values: List[Any], parsed: "array[float]") -> bool:
+    """빈 값이 아닌 값이 하나 이상 있고 모두 숫자로 변환되었는지"""
+    filled = False
+    for value, number in zip(values, parsed):
+        if value in (None, "", "-"):
+            continue
+        if math.isnan(number):
+            return False
+        filled = True
+    return filled
+
+
+def normalize_rows(rows: List[Dict[str, Any]], label_column: Optional[str] = None) -> Dict[str, Any]:
+    """
+    응답 목록을 열 단위로 바꾸고 숫자 열은 float 배열로 한 번에 변환합니다.
+
+    label_column(기본: se 열이 있으면 se)의 단위 표기가 천원·백만원 등이면 그 행의 숫자를 원 단위로 환산하고,
+    행별 단위는 row_units로 돌려줍니다.
+
+    Returns:
+        Dict[str, Any]: rows, columns([{name, type}]), data(숫자 열은 array('d'), 나머지는 list), row_units
+    """
+    # 행마다 빠진 열이 있을 수 있으므로 모든 행의 열 이름을 합칩니다
+    names = list(dict.fromkeys(key for row in rows for key in row))
+    if label_column is None:
+        label_column = next((name for name in LABEL_COLUMNS if name in names), None)
+
+    numeric = set()
+    data: Dict[str, Any] = {}
+    for name in names:
+        values = [row.get(name) for row in rows]
+        data[name] = values
+        # 식별자·날짜 열이 아니고 모든 값이 숫자인 열만 배열로 바꿉니다
+        if not _TEXT_COLUMN.search(name):
+            parsed = parse_amounts(values)
+            if _is_numeric(values, parsed):
+                data[name] = parsed
+                numeric.add(name)
+
+    result: Dict[str, Any] = {
+        "rows": len(rows),
+        "columns": [{"name": name, "type": "number" if name in numeric else "text"} for name in names],
+        "data": data,
+    }
+    if label_column:
+        units = [label_unit(row.get(label_column, "")) for row in rows]
+        for name in numeric:
+            column = data[name]
+            for i, (_, multiplier) in enumerate(units):
+                if multiplier != 1:
+                    column[i] *= multiplier
+        result["row_units"] = [
+            base_unit(unit) if unit is not None and multiplier != 1 else unit for unit, multiplier in units
+        ]
+    return result
+
+
+def normalize_response(response: Dict[str, Any], label_column: Optional[str] = None) -> Dict[str, Any]:
+    """
+    DART 목록 응답의 list를 정제된 열 단위 숫자 데이터로 바꿉니다. (도구 응답용)
+
+    숫자는 int/float, 빈 값은 None으로 내보냅니다. 정상 응답이 아니면 그대로 반환합니다.
+    """
+    if response.get("status") != "000" or not isinstance(response.get("list"), list):
+        return response
+    normalized = normalize_rows(response["list"], label_column)
+    normalized["data"] = {
+        name: [to_python(value) for value in column] if isinstance(column, array) else column
+        for name, column in normalized["data"].items()
+    }
+    return {**{key: value for key, value in response.items() if key != "list"}, **normalized}
@@ -0,0 +1,378 @@
+import hashlib
+import io
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Set
+
+if sys.platform != "win32":
+    import fcntl
+
+from ..config import opendart_config, OpenDartConfig
+
+logger = logging.getLogger("mcp-opendart")
+
+# 저장 대상 종류
+KIND_DOCUMENT = "document"
+KIND_XBRL = "xbrl"
+
+# 마지막 사용 시각(atime)은 메모리에 모았다가 이 간격(초)마다, 또는 저장·제거 시 인덱스에 기록합니다
+ATIME_FLUSH_SECONDS = 60
+
+
+def archive_key(kind: str, rcept_no: str, reprt_code: Optional[str] = None) -> str:
+    """저장소 키 생성 (XBRL은 reprt_code까지 포함)"""
+    if kind == KIND_XBRL:
+        return f"{kind}/{rcept_no}_{reprt_code}"
+    return f"{kind}/{rcept_no}"
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """임시 파일에 기록 후 rename하여 부분 기록 파일이 보이지 않도록 합니다."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _path_size(path: Path) -> int:
+    """파일 또는 디렉토리(하위 파일 합계)의 크기"""
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _remove_path(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ArchiveStore:
+    """
+    rcept_no 기준 공시 원본파일(ZIP) 로컬 저장소
+
+    접수번호가 부여된 공시서류는 변경되지 않으므로 한 번 받은 원본을 재사용합니다.
+    파일은 SHA-256 해시로 주소화(blobs/ab/<sha256>.zip)되고, index.json이
+    키(document/<rcept_no>, xbrl/<rcept_no>_<reprt_code>)를 해시에 연결합니다.
+    원본에서 파생된 파일(압축 해제 디렉토리, 섹션 인덱스, 팩트 테이블)은 add_derived로 항목에 등록되어
+    용량에 함께 계산되고 원본과 함께 제거됩니다.
+    전체 용량이 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = Path(root)
+        # 파생 파일 경로의 기준 (data_dir)
+        self.data_root = self.root.parent
+        self.max_bytes = max_bytes
+        self.blob_dir = self.root / "blobs"
+        self.index_path = self.root / "index.json"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._verified: Set[str] = set()
+        self._index: Dict[str, Dict[str, Any]] = self._read_index()
+        self._atimes: Dict[str, float] = {}
+        self._atimes_flushed = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # index
+    # ------------------------------------------------------------------
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data: Dict[str, Dict[str, Any]] = json.load(f)
+                return data
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ 아카이브 인덱스 손상, 재생성합니다: {e}")
+            return {}
+
+    def _write_index(self) -> None:
+        data = json.dumps(self._index, ensure_ascii=False, separators=(",", ":"))
+        atomic_write(self.index_path, data.encode("utf-8"))
+
+    @contextmanager
+    def _index_lock(self) -> Iterator[None]:
+        """프로세스 내(RLock) + 프로세스 간(flock) 인덱스 잠금"""
+        with self._lock:
+            if sys.platform == "win32":
+                yield
+                return
+            with open(self.root / ".lock", "a+") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    # 다른 프로세스가 기록한 변경분 반영
+                    self._index = self._read_index()
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / f"{digest}.zip"
+
+    @staticmethod
+    def _derived_bytes(entry: Dict[str, Any]) -> int:
+        derived: Dict[str, int] = entry.get("derived", {})
+        return sum(derived.values())
+
+    def total_bytes(self) -> int:
+        """저장된 고유 파일과 파생 파일의 전체 용량"""
+        sizes: Dict[str, int] = {entry["sha256"]: entry["size"] for entry in self._index.values()}
+        return sum(sizes.values()) + sum(self._derived_bytes(entry) for entry in self._index.values())
+
+    def _apply_atimes(self) -> None:
+        """메모리에 모은 사용 시각을 인덱스에 반영합니다. (_index_lock 내부에서 호출)"""
+        atimes, self._atimes = self._atimes, {}
+        for key, atime in atimes.items():
+            if key in self._index:
+                self._index[key]["atime"] = max(self._index[key].get("atime", 0), atime)
+        self._atimes_flushed = time.monotonic()
+
+    def flush(self) -> None:
+        """메모리에 모은 사용 시각을 index.json에 기록합니다."""
+        if not self._atimes:
+            return
+        with self._index_lock():
+            self._apply_atimes()
+            self._write_index()
+
+    # ------------------------------------------------------------------
+    # read / write
+    # ------------------------------------------------------------------
+    def path(self, kind: str, rcept_no: str, reprt_code: Optional[str] = None) -> Optional[Path]:
+        """
+        저장된 원본파일 경로를 반환합니다. 해시가 일치하지 않으면 항목을 폐기하고 None을 반환합니다.
+        """
+        key = archive_key(kind, rcept_no, reprt_code)
+        entry = self._index.get(key)
+        if entry is None:
+            with self._index_lock():
+                entry = self._index.get(key)
+        if entry is None:
+            return None
+
+        blob_path = self._blob_path(entry["sha256"])
+        if entry["sha256"] not in self._verified:
+            try:
+                digest: Optional[str] = _file_sha256(blob_path)
+            except FileNotFoundError:
+                digest = None
+            if digest != entry["sha256"]:
+                logger.warning(f"⚠️ 아카이브 해시 불일치, 항목 폐기: {key}")
+                self._discard(key)
+                return None
+            self._verified.add(entry["sha256"])
+
+        self._atimes[key] = time.time()
+        if time.monotonic() - self._atimes_flushed >= ATIME_FLUSH_SECONDS:
+            self.flush()
+        return blob_path
+
+    def get(self, kind: str, rcept_no: str, reprt_code: Optional[str] = None) -> Optional[bytes]:
+        """저장된 원본파일 내용을 반환합니다."""
+        blob_path = self.path(kind, rcept_no, reprt_code)
+        if blob_path is None:
+            return None
+        return blob_path.read_bytes()
+
+    def put(self, kind: str, rcept_no: str, content: bytes, reprt_code: Optional[str] = None) -> Path:
+        """원본파일을 저장하고 용량 제한을 적용합니다."""
+        key = archive_key(kind, rcept_no, reprt_code)
+        digest = hashlib.sha256(content).hexdigest()
+        blob_path = self._blob_path(digest)
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        if not blob_path.exists():
+            atomic_write(blob_path, content)
+        self._verified.add(digest)
+
+        with self._index_lock():
+            self._apply_atimes()
+            previous = self._index.get(key, {})
+            self._index[key] = {
+                "sha256": digest,
+                "size": len(content),
+                "atime": time.time(),
+                "derived": previous.get("derived", {}),
+            }
+            self._evict()
+            self._write_index()
+        return blob_path
+
+    def get_or_fetch(
+        self,
+        kind: str,
+        rcept_no: str,
+        fetch: Callable[[], Dict[str, Any]],
+        reprt_code: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        저장소에 있으면 재사용하고, 없으면 fetch()로 내려받아 저장합니다.
+
+        같은 키에 대한 동시 호출은 하나의 다운로드만 수행하고 나머지는 그 결과를 기다립니다.
+
+        Returns:
+            Dict[str, Any]: fetch 응답 형식과 동일하며 저장 시 archive_path, cached 키가 추가됩니다.
+        """
+        key = archive_key(kind, rcept_no, reprt_code)
+        with self._key_lock(key):
+            blob_path = self.path(kind, rcept_no, reprt_code)
+            if blob_path is not None:
+                logger.info(f"📦 아카이브 재사용: {key}")
+                return {
+                    "status": "000",
+                    "message": "정상",
+                    "content": blob_path.read_bytes(),
+                    "archive_path": str(blob_path),
+                    "cached": True,
+                }
+
+            response = fetch()
+            content = response.get("content")
+            if response.get("status") == "000" and isinstance(content, bytes) \
+                    and zipfile.is_zipfile(io.BytesIO(content)):
+                blob_path = self.put(kind, rcept_no, content, reprt_code)
+                response["archive_path"] = str(blob_path)
+                response["cached"] = False
+            return response
+
+    def add_derived(self, kind: str, rcept_no: str, path: Path, reprt_code: Optional[str] = None) -> None:
+        """
+        원본에서 만든 파일·디렉토리를 항목에 등록합니다. 크기가 바뀐 경우에만 인덱스를 기록합니다.
+
+        path는 data_dir 아래여야 하며, 항목이 제거될 때 함께 삭제됩니다.
+        """
+        key = archive_key(kind, rcept_no, reprt_code)
+        relative = Path(path).relative_to(self.data_root).as_posix()
+        size = _path_size(Path(path))
+        entry = self._index.get(key)
+        if entry is not None and entry.get("derived", {}).get(relative) == size:
+            return
+        with self._index_lock():
+            entry = self._index.get(key)
+            if entry is None:
+                return
+            entry.setdefault("derived", {})[relative] = size
+            self._apply_atimes()
+            self._evict()
+            self._write_index()
+
+    # ------------------------------------------------------------------
+    # eviction
+    # ------------------------------------------------------------------
+    def _discard(self, key: str) -> None:
+        with self._index_lock():
+            entry = self._index.pop(key, None)
+            if entry is not None:
+                self._remove_derived(entry)
+                self._remove_blob_if_unused(entry["sha256"])
+                self._write_index()
+
+    def _remove_derived(self, entry: Dict[str, Any]) -> None:
+        for relative in entry.get("derived", {}):
+            _remove_path(self.data_root / relative)
+
+    def _remove_blob_if_unused(self, digest: str) -> None:
+        if any(e["sha256"] == digest for e in self._index.values()):
+            return
+        self._verified.discard(digest)
+        try:
+            os.remove(self._blob_path(digest))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        """용량 제한을 넘는 동안 가장 오래 사용하지 않은 항목을 제거합니다. (_index_lock 내부에서 호출)"""
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return
+        for key, entry in sorted(self._index.items(), key=lambda kv: kv[1]["atime"]):
+            if total <= self.max_bytes or len(self._index) <= 1:
+                break
+            self._index.pop(key)
+            if not any(e["sha256"] == entry["sha256"] for e in self._index.values()):
+                total -= entry["size"]
+            total -= self._derived_bytes(entry)
+            self._atimes.pop(key, None)
+            self._remove_derived(entry)
+            self._remove_blob_if_unused(entry["sha256"])
+            logger.info(f"🧹 아카이브 용량 초과로 제거: {key}")
+
+
+_stores: Dict[str, ArchiveStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_archive_store(config: Optional[OpenDartConfig] = None) -> ArchiveStore:
+    """설정의 data_dir 기준 공유 ArchiveStore 인스턴스를 반환합니다."""
+    config = config or opendart_config
+    root = str(Path(config.data_dir) / "archive")
+    with _stores_lock:
+        store = _stores.get(root)
+        if store is None:
+            store = _stores[root] = ArchiveStore(Path(root), config.archive_max_bytes)
+        return store
+
+
+def extract_archive(zip_path: Path, dest_dir: Path) -> Path:
+    """
+    ZIP을 dest_dir에 풀어 둡니다. 이미 풀려 있으면 재사용합니다.
+
+    임시 디렉토리에 푼 뒤 rename하므로 동시 호출이 같은 경로에 부분 기록하지 않습니다.
+    """
+    if dest_dir.is_dir():
+        return dest_dir
+    dest_dir.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(dir=dest_dir.parent, prefix=".tmp-"))
+    try:
+        with zipfile.ZipFile(zip_path) as zip_file:
+            zip_file.extractall(tmp_dir)
+        try:
+            os.replace(tmp_dir, dest_dir)
+        except OSError:
+            # 다른 호출이 먼저 완료한 경우
+            if not dest_dir.is_dir():
+                raise
+    finally:
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    return dest_dir
@@ -0,0 +1,29 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Deque, Generator, Iterable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def bounded_map(func: Callable[[T], R], items: Iterable[T], max_workers: int) -> Generator[R, None, None]:
+    """
+    items를 최대 max_workers개까지 동시에 처리하면서 결과를 입력 순서대로 내보냅니다.
+
+    결과를 하나 꺼낼 때마다 다음 작업을 하나 제출하므로 미리 가져오는 양이 제한되고,
+    호출 측이 순회를 중단하면 아직 시작하지 않은 작업은 취소됩니다.
+    """
+    source = iter(items)
+    max_workers = max(1, max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: Deque["Future[R]"] = deque(executor.submit(func, item) for item in islice(source, max_workers))
+        try:
+            while pending:
+                result = pending.popleft().result()
+                for item in islice(source, 1):
+                    pending.append(executor.submit(func, item))
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
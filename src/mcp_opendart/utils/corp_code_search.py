@@ -28,6 +28,34 @@ def parse_corp_code_xml(xml_content: str) -> List[Dict[str, str]]:
     
     return corporations
 
+CORP_FIELDS = ('corp_name', 'corp_code', 'stock_code', 'modify_date')
+
+_corporations_cache: Dict[str, object] = {}
+
+def parse_corp_code_file(file_path: str) -> Dict[str, List[str]]:
+    """Stream-parse CORPCODE.xml into compact columns (runs in the parse pool worker)."""
+    columns: Dict[str, List[str]] = {field: [] for field in CORP_FIELDS}
+    for _, elem in ET.iterparse(file_path, events=('end',)):
+        if elem.tag == 'list':
+            for field in CORP_FIELDS:
+                columns[field].append((elem.findtext(field) or '').strip())
+            elem.clear()
+    return columns
+
+def load_corporations() -> List[Dict[str, str]]:
+    """Load the local CORPCODE.xml through the parse pool, reusing the result until the file changes."""
+    from .parse_pool import parse_pool
+
+    file_path = Path(__file__).parent / 'data' / 'CORPCODE.xml'
+    mtime = file_path.stat().st_mtime
+    if _corporations_cache.get('mtime') != mtime:
+        columns = parse_pool.run('corpcode', parse_corp_code_file, str(file_path))
+        _corporations_cache['corporations'] = [
+            dict(zip(CORP_FIELDS, values)) for values in zip(*(columns[field] for field in CORP_FIELDS))
+        ]
+        _corporations_cache['mtime'] = mtime
+    return _corporations_cache['corporations']  # type: ignore[return-value]
+
 def search_corporations(corporations: List[Dict[str, str]], search_term: str) -> List[Dict[str, str]]:
     """Search corporations by name using case-insensitive partial matching."""
     search_term = search_term.lower()
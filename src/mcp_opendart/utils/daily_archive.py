@@ -0,0 +1,194 @@
+import datetime
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from ..config import opendart_config, OpenDartConfig
+from .archive_store import atomic_write
+from .query_planner import format_date, parse_date
+
+logger = logging.getLogger("mcp-opendart")
+
+# 파티션 형식이 바뀌면 올려서 기존 파일을 다시 받도록 합니다
+PARTITION_VERSION = 1
+
+# 공시유형 (A: 정기공시 ~ J: 공정위공시)
+PBLNTF_TYPES = ("A", "B", "C", "D", "E", "F", "G", "H", "I", "J")
+
+# 파티션에 저장하는 열 (list.json 응답 필드 + 공시유형)
+COLUMNS = (
+    "rcept_no", "rcept_dt", "pblntf_ty", "corp_code", "corp_name", "corp_cls",
+    "stock_code", "report_nm", "flr_nm", "rm",
+)
+
+# (date, pblntf_ty) → get_all_disclosure_list 형식의 응답
+DayFetcher = Callable[[str, str], Dict[str, Any]]
+
+
+class DailyDisclosureArchive:
+    """
+    시장 전체 일별 공시 목록 저장소
+
+    하루치 공시를 <data_dir>/daily/YYYY/MM/YYYYMMDD.json 파티션에 열 단위로 저장합니다.
+    지난 날짜의 파티션은 complete로 표시되어 다시 받지 않고, 당일 파티션은 다음 실행에서 갱신됩니다.
+    진행 상황은 checkpoint.json에 기록되어 중단된 수집을 이어서 진행할 수 있습니다.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.checkpoint_path = self.root / "checkpoint.json"
+        self._lock = threading.Lock()
+
+    def partition_path(self, date: str) -> Path:
+        return self.root / date[:4] / date[4:6] / f"{date}.json"
+
+    # ------------------------------------------------------------------
+    # 파티션
+    # ------------------------------------------------------------------
+    def read_partition(self, date: str) -> Optional[Dict[str, Any]]:
+        """파티션을 읽습니다. 없거나 형식이 다르면 None"""
+        try:
+            with open(self.partition_path(date), "r", encoding="utf-8") as f:
+                partition: Dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return partition if partition.get("version") == PARTITION_VERSION else None
+
+    def is_complete(self, date: str) -> bool:
+        partition = self.read_partition(date)
+        return bool(partition and partition.get("complete"))
+
+    def write_partition(self, date: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """하루치 공시를 접수번호 순으로 정렬하여 열 단위로 저장합니다."""
+        rows = sorted(rows, key=lambda row: row.get("rcept_no", ""))
+        partition = {
+            "version": PARTITION_VERSION,
+            "date": date,
+            "complete": date < format_date(datetime.date.today()),
+            "count": len(rows),
+            "columns": list(COLUMNS),
+            "data": {column: [row.get(column, "") for row in rows] for column in COLUMNS},
+        }
+        path = self.partition_path(date)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, json.dumps(partition, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        return partition
+
+    def query(
+        self,
+        date: str,
+        pblntf_ty: Optional[str] = None,
+        corp_cls: Optional[str] = None,
+        corp_code: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        저장된 하루치 공시를 조건으로 걸러 행 단위로 반환합니다. 파티션이 없으면 None
+
+        조건은 열 배열에서 먼저 평가하고 일치하는 행만 dict로 만듭니다.
+        """
+        partition = self.read_partition(date)
+        if partition is None:
+            return None
+        data = partition["data"]
+        conditions = [(column, value) for column, value in (
+            ("pblntf_ty", pblntf_ty), ("corp_cls", corp_cls), ("corp_code", corp_code)
+        ) if value]
+        matched = [
+            i for i in range(partition["count"])
+            if all(data[column][i] == value for column, value in conditions)
+        ]
+        return [{column: data[column][i] for column in partition["columns"]} for i in matched]
+
+    # ------------------------------------------------------------------
+    # 체크포인트
+    # ------------------------------------------------------------------
+    def read_checkpoint(self) -> Dict[str, Any]:
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                checkpoint: Dict[str, Any] = json.load(f)
+                return checkpoint
+        except (OSError, ValueError):
+            return {}
+
+    def write_checkpoint(self, **values: Any) -> None:
+        with self._lock:
+            checkpoint = {**self.read_checkpoint(), **values}
+            self.root.mkdir(parents=True, exist_ok=True)
+            atomic_write(self.checkpoint_path, json.dumps(checkpoint, ensure_ascii=False).encode("utf-8"))
+
+    # ------------------------------------------------------------------
+    # 수집
+    # ------------------------------------------------------------------
+    def ingest_day(self, date: str, fetch: DayFetcher) -> Dict[str, Any]:
+        """
+        하루치 공시를 공시유형(A~J)별로 받아 한 파티션으로 저장합니다.
+
+        list.json 응답에는 공시유형이 없으므로 유형별로 조회하여 pblntf_ty를 붙입니다.
+        일부 유형이라도 실패하면 파티션을 쓰지 않고 오류 응답을 반환합니다.
+        """
+        rows: Dict[str, Dict[str, Any]] = {}
+        for pblntf_ty in PBLNTF_TYPES:
+            response = fetch(date, pblntf_ty)
+            if response.get("status") == "013":
+                continue
+            if response.get("status") != "000" or response.get("truncated"):
+                return response
+            for row in response.get("list", []):
+                rows.setdefault(row.get("rcept_no", ""), {**row, "pblntf_ty": pblntf_ty})
+
+        partition = self.write_partition(date, list(rows.values()))
+        return {"status": "000", "message": "정상", "date": date, "count": partition["count"]}
+
+    def ingest_range(
+        self,
+        bgn_de: str,
+        end_de: str,
+        fetch: DayFetcher,
+        force: bool = False,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        기간 내 날짜를 오래된 순으로 수집합니다. 완료된 파티션은 건너뛰므로 다시 실행해도 안전합니다.
+
+        Args:
+            force (bool): 완료된 파티션도 다시 수집
+            on_progress: 날짜별 결과를 받는 콜백
+        """
+        day, last = parse_date(bgn_de), parse_date(end_de)
+        summary: Dict[str, int] = {"ingested": 0, "skipped": 0, "filings": 0}
+        while day <= last:
+            date = format_date(day)
+            result: Dict[str, Any]
+            if not force and self.is_complete(date):
+                result = {"status": "000", "date": date, "skipped": True}
+                summary["skipped"] += 1
+            else:
+                result = self.ingest_day(date, fetch)
+                if result.get("status") != "000":
+                    logger.error(f"일별 공시 수집 실패 [{date}]: {result.get('message') or result.get('error')}")
+                    return {**result, **summary, "failed_date": date}
+                summary["ingested"] += 1
+                summary["filings"] += result["count"]
+                if self.is_complete(date) and date > self.read_checkpoint().get("last_completed", ""):
+                    self.write_checkpoint(last_completed=date)
+            if on_progress:
+                on_progress(result)
+            day += datetime.timedelta(days=1)
+        return {"status": "000", "message": "정상", **summary}
+
+
+_archives: Dict[str, DailyDisclosureArchive] = {}
+_archives_lock = threading.Lock()
+
+
+def get_daily_archive(config: Optional[OpenDartConfig] = None) -> DailyDisclosureArchive:
+    """설정의 data_dir 기준 공유 DailyDisclosureArchive 인스턴스를 반환합니다."""
+    config = config or opendart_config
+    root = str(Path(config.data_dir) / "daily")
+    with _archives_lock:
+        archive = _archives.get(root)
+        if archive is None:
+            archive = _archives[root] = DailyDisclosureArchive(Path(root))
+        return archive
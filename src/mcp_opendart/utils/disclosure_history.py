@@ -0,0 +1,196 @@
+import bisect
+import datetime
+import json
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..config import opendart_config, OpenDartConfig
+from .archive_store import atomic_write
+from .query_planner import format_date, parse_date
+
+logger = logging.getLogger("mcp-opendart")
+
+# 저장 형식이 바뀌면 올려서 기존 이력을 무효화합니다
+HISTORY_VERSION = 1
+
+_MEMORY_CACHE_SIZE = 32
+
+# (bgn_de, end_de) → get_all_disclosure_list 형식의 응답
+RangeFetcher = Callable[[str, str], Dict[str, Any]]
+
+
+class CorpHistory:
+    """
+    한 기업의 공시 이력
+
+    rows는 (rcept_dt, rcept_no) 오름차순으로 정렬되어 있고, dates는 rows와 같은 순서의
+    접수일 배열이라 기간 조회를 이진 탐색으로 처리합니다.
+    synced_from~synced_through 구간은 DART와 동기화가 끝난 연속 구간입니다.
+    """
+
+    def __init__(self, corp_code: str, data: Optional[Dict[str, Any]] = None):
+        data = data or {}
+        self.corp_code = corp_code
+        self.synced_from: Optional[str] = data.get("synced_from")
+        self.synced_through: Optional[str] = data.get("synced_through")
+        self.rows: List[Dict[str, Any]] = data.get("rows", [])
+        self.dates: List[str] = [row.get("rcept_dt", "") for row in self.rows]
+        self._rcept_nos = {row.get("rcept_no") for row in self.rows}
+
+    @property
+    def newest_rcept_dt(self) -> Optional[str]:
+        return self.dates[-1] if self.dates else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": HISTORY_VERSION,
+            "corp_code": self.corp_code,
+            "synced_from": self.synced_from,
+            "synced_through": self.synced_through,
+            "rows": self.rows,
+        }
+
+    def missing_ranges(self, bgn_de: str, end_de: str) -> List[Tuple[str, str]]:
+        """
+        요청 기간 중 아직 받지 않은 구간
+
+        동기화 구간이 끊기지 않도록 기존 구간과 맞닿는 곳까지 조회하며,
+        마지막 동기화일은 그날 이후 접수된 공시가 있을 수 있으므로 다시 조회합니다.
+        """
+        if self.synced_from is None or self.synced_through is None:
+            return [(bgn_de, end_de)]
+        ranges: List[Tuple[str, str]] = []
+        if bgn_de < self.synced_from:
+            day_before = parse_date(self.synced_from) - datetime.timedelta(days=1)
+            ranges.append((bgn_de, format_date(day_before)))
+        if end_de >= self.synced_through:
+            ranges.append((self.synced_through, end_de))
+        return ranges
+
+    def merge(self, rows: List[Dict[str, Any]], bgn_de: str, end_de: str) -> int:
+        """
+        새로 받은 행을 합치고 동기화 구간을 넓힙니다. 추가된 건수를 반환합니다.
+
+        이미 있는 접수번호는 새로 받은 행으로 바꿉니다. (이후 정정 공시가 제출되면 DART가 비고(rm)에 "정"을 덧붙이므로)
+        """
+        received = {row.get("rcept_no"): row for row in rows if row.get("rcept_no")}
+        added = [rcept_no for rcept_no in received if rcept_no not in self._rcept_nos]
+        if received:
+            self.rows = [received.get(row.get("rcept_no"), row) for row in self.rows]
+            self.rows.extend(received[rcept_no] for rcept_no in added)
+            self.rows.sort(key=lambda row: (row.get("rcept_dt", ""), row.get("rcept_no", "")))
+            self.dates = [row.get("rcept_dt", "") for row in self.rows]
+            self._rcept_nos.update(added)
+
+        # 미래 날짜까지 동기화된 것으로 기록하지 않도록 오늘로 제한
+        end_de = min(end_de, format_date(datetime.date.today()))
+        self.synced_from = min(filter(None, [self.synced_from, bgn_de]))
+        self.synced_through = max(filter(None, [self.synced_through, end_de]))
+        return len(added)
+
+    def query(self, bgn_de: str, end_de: str) -> List[Dict[str, Any]]:
+        """기간 내 공시를 접수일 내림차순으로 반환합니다."""
+        lo = bisect.bisect_left(self.dates, bgn_de)
+        hi = bisect.bisect_right(self.dates, end_de)
+        return self.rows[lo:hi][::-1]
+
+
+class DisclosureHistoryStore:
+    """
+    corp_code별 공시 이력 로컬 저장소
+
+    이력은 <data_dir>/history/<corp_code>.json에 저장됩니다. 조회 기간 중 동기화되지 않은
+    구간(주로 마지막 동기화일 이후)만 DART에서 받아 합치고, 나머지는 로컬에서 응답합니다.
+    """
+
+    def __init__(self, root: Path, max_items: int = _MEMORY_CACHE_SIZE):
+        self.root = Path(root)
+        self.max_items = max_items
+        self._items: "OrderedDict[str, CorpHistory]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._corp_locks: Dict[str, threading.Lock] = {}
+
+    def _path(self, corp_code: str) -> Path:
+        return self.root / f"{corp_code}.json"
+
+    def _corp_lock(self, corp_code: str) -> threading.Lock:
+        with self._lock:
+            return self._corp_locks.setdefault(corp_code, threading.Lock())
+
+    def _load(self, corp_code: str) -> CorpHistory:
+        with self._lock:
+            if corp_code in self._items:
+                self._items.move_to_end(corp_code)
+                return self._items[corp_code]
+
+        history = CorpHistory(corp_code)
+        try:
+            with open(self._path(corp_code), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == HISTORY_VERSION:
+                history = CorpHistory(corp_code, data)
+        except (OSError, ValueError):
+            pass
+
+        with self._lock:
+            self._items[corp_code] = history
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+        return history
+
+    def _save(self, history: CorpHistory) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(history.to_dict(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        atomic_write(self._path(history.corp_code), payload)
+
+    def query(self, corp_code: str, bgn_de: str, end_de: str, fetch: RangeFetcher) -> Dict[str, Any]:
+        """
+        기간 내 공시 이력을 반환합니다. 부족한 구간은 fetch로 받아 저장소에 합칩니다.
+
+        Returns:
+            Dict[str, Any]: status, rows(접수일 내림차순), fetched(새로 받은 건수), 동기화 구간
+        """
+        with self._corp_lock(corp_code):
+            history = self._load(corp_code)
+            fetched = 0
+            missing = history.missing_ranges(bgn_de, end_de)
+            for range_bgn, range_end in missing:
+                response = fetch(range_bgn, range_end)
+                if response.get("status") == "013":
+                    rows: List[Dict[str, Any]] = []
+                elif response.get("status") == "000" and not response.get("truncated"):
+                    rows = response.get("list", [])
+                else:
+                    return response
+                added = history.merge(rows, range_bgn, range_end)
+                fetched += added
+                logger.info(f"🗄️ 공시 이력 갱신 [{corp_code}] {range_bgn}~{range_end}: {len(rows)}건 조회, {added}건 추가")
+            if missing:
+                self._save(history)
+
+            return {
+                "status": "000",
+                "rows": history.query(bgn_de, end_de),
+                "fetched": fetched,
+                "synced_from": history.synced_from,
+                "synced_through": history.synced_through,
+                "newest_rcept_dt": history.newest_rcept_dt,
+            }
+
+
+_stores: Dict[str, DisclosureHistoryStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_history_store(config: Optional[OpenDartConfig] = None) -> DisclosureHistoryStore:
+    """설정의 data_dir 기준 공유 DisclosureHistoryStore 인스턴스를 반환합니다."""
+    config = config or opendart_config
+    root = str(Path(config.data_dir) / "history")
+    with _stores_lock:
+        store = _stores.get(root)
+        if store is None:
+            store = _stores[root] = DisclosureHistoryStore(Path(root))
+        return store
@@ -0,0 +1,186 @@
+import asyncio
+import datetime
+import inspect
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Union
+
+from ..config import opendart_config
+from .archive_store import atomic_write
+from .query_planner import format_date, parse_date
+
+logger = logging.getLogger("mcp-opendart")
+
+PAGE_COUNT = 100
+
+# 이 횟수마다 한 번은 조회 기간의 모든 페이지를 확인합니다 (취하된 공시로 건수 비교가 어긋나는 경우 대비)
+FULL_SCAN_EVERY = 10
+
+# 새 공시 목록을 받는 구독자 (동기/비동기 함수 모두 가능)
+Subscriber = Callable[[List[Dict[str, Any]]], Union[None, Awaitable[None]]]
+
+
+class DisclosurePoller:
+    """
+    신규 공시 폴러
+
+    interval초마다 전일~당일 공시를 최신순으로 조회하고, 이미 본 접수번호가 아닌 공시만
+    새 공시로 구독자에게 전달합니다. 기간 내 전체 건수(total_count)가 이미 본 공시와 새로 찾은 공시의 합에
+    이르면 남은 페이지에는 새 공시가 없으므로 조회를 멈춥니다.
+    접수번호는 제출 경로별 일련번호(금감원 YYYYMMDD00xxxx, 거래소 YYYYMMDD80xxxx 등)라 시간순으로
+    증가하지 않으므로 커서 하나로 비교하지 않고, 접수일별로 본 접수번호 집합(당일·전일)을 유지합니다.
+    상태는 <data_dir>/poller/seen.json에 저장되어 재시작 후에도 이어서 동작합니다.
+    """
+
+    def __init__(self, state_path: Path, interval: int):
+        self.state_path = Path(state_path)
+        self.interval = interval
+        self._ticks = 0
+        self.api: Any = None
+        self._subscribers: List[Subscriber] = []
+        self._lock = threading.Lock()
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._users = 0
+        # 접수일(YYYYMMDD) → 본 접수번호. None이면 아직 초기화 전
+        self.seen: Optional[Dict[str, Set[str]]] = self._read_state()
+
+    # ------------------------------------------------------------------
+    # 상태
+    # ------------------------------------------------------------------
+    def _read_state(self) -> Optional[Dict[str, Set[str]]]:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state: Dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return {date: set(rcept_nos) for date, rcept_nos in state.get("seen", {}).items()}
+
+    def _write_state(self, seen: Dict[str, Set[str]], today: datetime.date) -> None:
+        """당일·전일 접수번호만 남기고 저장합니다."""
+        keep = {format_date(today), format_date(today - datetime.timedelta(days=1))}
+        self.seen = {date: rcept_nos for date, rcept_nos in seen.items() if date in keep}
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            "seen": {date: sorted(rcept_nos) for date, rcept_nos in sorted(self.seen.items())},
+            "updated_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        }
+        atomic_write(self.state_path, json.dumps(state).encode("utf-8"))
+
+    def _is_seen(self, rcept_no: str) -> bool:
+        return self.seen is not None and rcept_no in self.seen.get(rcept_no[:8], ())
+
+    # ------------------------------------------------------------------
+    # 구독
+    # ------------------------------------------------------------------
+    def subscribe(self, callback: Subscriber) -> Callable[[], None]:
+        """새 공시를 받을 콜백을 등록합니다. 등록 해제 함수를 반환합니다."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    async def _publish(self, filings: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                result = callback(filings)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"신규 공시 구독자 처리 실패: {e}", exc_info=True)
+
+    # ------------------------------------------------------------------
+    # 폴링
+    # ------------------------------------------------------------------
+    def poll_once(self) -> List[Dict[str, Any]]:
+        """
+        한 번 조회하여 아직 보지 않은 공시를 접수번호 오름차순으로 반환합니다.
+
+        상태가 없으면(최초 실행) 이후 폴링과 같은 전일~당일 기간의 모든 페이지를 본 것으로만 기록하고 빈 목록을 반환합니다.
+        같은 날짜 안의 정렬 순서는 보장되지 않으므로 페이지 단위로 멈추지 않고, 기간 내 전체 건수를 모두
+        확인했거나 마지막 페이지(total_page)에 이를 때까지 조회합니다.
+        조회에 실패하면 상태를 바꾸지 않으므로 다음 폴링에서 다시 확인합니다.
+        """
+        today = datetime.date.today()
+        # 자정 직전 공시를 놓치지 않도록 전일부터 조회 (최초 실행도 같은 기간으로 초기화)
+        bgn = today - datetime.timedelta(days=1)
+        first_run = self.seen is None
+        self._ticks += 1
+        full_scan = first_run or self._ticks % FULL_SCAN_EVERY == 0
+        window = (format_date(bgn), format_date(today))
+        known = sum(len((self.seen or {}).get(date, ())) for date in window)
+
+        fresh: Dict[str, Dict[str, Any]] = {}
+        page_no = 1
+        while True:
+            page = self.api.get_disclosure_list(
+                bgn_de=window[0], end_de=window[1],
+                sort="date", sort_mth="desc", page_no=page_no, page_count=PAGE_COUNT
+            )
+            if page.get("status") == "013":
+                break
+            if page.get("status") != "000":
+                logger.warning(f"신규 공시 조회 실패: {page.get('message') or page.get('error')}")
+                return []
+            rows = [row for row in page.get("list", []) if row.get("rcept_no")]
+            fresh.update((row["rcept_no"], row) for row in rows if not self._is_seen(row["rcept_no"]))
+            if not full_scan and known + len(fresh) >= int(page.get("total_count") or 0):
+                break
+            if page_no >= int(page.get("total_page") or 1):
+                break
+            page_no += 1
+
+        if not fresh and not first_run:
+            return []
+        seen = {date: set(rcept_nos) for date, rcept_nos in (self.seen or {}).items()}
+        for rcept_no in fresh:
+            seen.setdefault(rcept_no[:8], set()).add(rcept_no)
+        self._write_state(seen, today)
+        if first_run:
+            logger.info(f"📡 신규 공시 폴러 초기화: 기존 공시 {len(fresh)}건")
+            return []
+        filings = sorted(fresh.values(), key=lambda row: row["rcept_no"])
+        logger.info(f"📡 신규 공시 {len(filings)}건")
+        return filings
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                filings = await asyncio.to_thread(self.poll_once)
+                if filings:
+                    await self._publish(filings)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"신규 공시 폴링 오류: {e}", exc_info=True)
+            await asyncio.sleep(self.interval)
+
+    def start(self, api: Any) -> None:
+        """폴링 태스크를 시작합니다. 여러 세션이 호출해도 태스크는 하나만 실행됩니다."""
+        self.api = api
+        self._users += 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(f"📡 신규 공시 폴러 시작 (주기 {self.interval}초)")
+
+    def stop(self) -> None:
+        """마지막 사용자가 종료하면 폴링 태스크를 중단합니다."""
+        self._users = max(0, self._users - 1)
+        if self._users == 0 and self._task is not None:
+            self._task.cancel()
+            self._task = None
+            logger.info("📡 신규 공시 폴러 중지")
+
+
+disclosure_poller = DisclosurePoller(
+    Path(opendart_config.data_dir) / "poller" / "seen.json",
+    opendart_config.poll_interval
+)
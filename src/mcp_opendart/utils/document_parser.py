@@ -0,0 +1,214 @@
+import asyncio
+import html
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .archive_store import atomic_write
+from .parse_pool import parse_pool
+
+logger = logging.getLogger("mcp-opendart")
+
+# 인덱스 형식이 바뀌면 올려서 기존 캐시를 무효화합니다
+INDEX_VERSION = 1
+
+# 메모리에 유지할 섹션 인덱스 수
+_MEMORY_CACHE_SIZE = 64
+
+_SECTION_OR_TITLE = re.compile(
+    rb"<(/?)SECTION-(\d+)\b[^>]*>|<TITLE\b[^>]*>(.*?)</TITLE>",
+    re.S | re.I,
+)
+_XML_ENCODING = re.compile(rb"""<\?xml[^>]*encoding=["']([\w\-]+)["']""", re.I)
+_TAG = re.compile(r"<[^>]+>")
+_BLOCK_BREAK = re.compile(r"</(P|TITLE|TR|TABLE|COVER-TITLE)>|<BR\s*/?>|<PGBRK[^>]*>", re.I)
+_CELL_BREAK = re.compile(r"</(TD|TH|TE|TU)>", re.I)
+_SPACES = re.compile(r"[ \t\r\f\v ]+")
+
+
+def detect_encoding(data: bytes) -> str:
+    """XML 선언의 encoding 값을 반환합니다. (기본값: utf-8)"""
+    match = _XML_ENCODING.search(data[:200])
+    return match.group(1).decode("ascii").lower() if match else "utf-8"
+
+
+def _clean_inline(fragment: bytes, encoding: str) -> str:
+    text = _TAG.sub("", fragment.decode(encoding, errors="replace"))
+    return _SPACES.sub(" ", html.unescape(text)).strip()
+
+
+def normalize_title(title: str) -> str:
+    """제목 비교용 정규화 (공백 제거, 소문자)"""
+    return re.sub(r"\s+", "", title).lower()
+
+
+def build_section_index(data: bytes) -> Dict[str, Any]:
+    """
+    document.xml 원문에서 SECTION-n/TITLE 계층 구조와 바이트 오프셋을 추출합니다.
+
+    DART 원문은 엄격한 XML이 아닌 경우가 많아 DOM을 만들지 않고 태그만 순차 탐색합니다.
+
+    Returns:
+        Dict[str, Any]: encoding, size, sections(id, level, title, parent, start, end)
+    """
+    encoding = detect_encoding(data)
+    sections: List[Dict[str, Any]] = []
+    stack: List[Dict[str, Any]] = []
+
+    for match in _SECTION_OR_TITLE.finditer(data):
+        closing, level, title = match.group(1), match.group(2), match.group(3)
+        if level is not None and not closing:
+            node = {
+                "id": len(sections),
+                "level": int(level),
+                "title": "",
+                "parent": stack[-1]["id"] if stack else None,
+                "start": match.start(),
+                "end": len(data),
+            }
+            sections.append(node)
+            stack.append(node)
+        elif level is not None:
+            # 짝이 맞지 않는 닫는 태그는 같은 레벨까지 정리
+            while stack:
+                node = stack.pop()
+                node["end"] = match.end()
+                if node["level"] == int(level):
+                    break
+        elif stack and not stack[-1]["title"]:
+            stack[-1]["title"] = _clean_inline(title, encoding)
+
+    return {
+        "version": INDEX_VERSION,
+        "encoding": encoding,
+        "size": len(data),
+        "sections": sections,
+    }
+
+
+def build_section_index_file(xml_path: str) -> Dict[str, Any]:
+    """파일 경로를 받아 섹션 인덱스를 생성합니다. (파싱 풀 워커용)"""
+    with open(xml_path, "rb") as f:
+        return build_section_index(f.read())
+
+
+def render_fragment(fragment: bytes, encoding: str) -> str:
+    """섹션 원문을 읽기 쉬운 텍스트로 변환합니다. (표는 셀을 ' | '로 구분)"""
+    text = fragment.decode(encoding, errors="replace")
+    text = _CELL_BREAK.sub(" | ", text)
+    text = _BLOCK_BREAK.sub("\n", text)
+    text = html.unescape(_TAG.sub("", text))
+    lines = [_SPACES.sub(" ", line).strip(" |") for line in text.split("\n")]
+    return "\n".join(line for line in lines if line)
+
+
+class SectionIndexCache:
+    """
+    rcept_no별 섹션 인덱스 캐시
+
+    인덱스는 원문 옆에 <rcept_no>.sections.json으로 저장되고 최근 사용분은 메모리에 유지됩니다.
+    """
+
+    def __init__(self, max_items: int = _MEMORY_CACHE_SIZE):
+        self.max_items = max_items
+        self._items: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _recall(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                return self._items[key]
+        return None
+
+    def _remember(self, key: str, index: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self._items[key] = index
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+        return index
+
+    def get(self, xml_path: Path) -> Dict[str, Any]:
+        index = self._recall(str(xml_path))
+        if index is not None:
+            return index
+
+        index = self._load(xml_path)
+        if index is None:
+            logger.info(f"🗂️ 섹션 인덱스 생성: {xml_path.name}")
+            index = parse_pool.run("document", build_section_index_file, str(xml_path))
+            self._save(xml_path, index)
+        return self._remember(str(xml_path), index)
+
+    async def get_async(self, xml_path: Path) -> Dict[str, Any]:
+        """get과 같으며, 파싱은 parse_pool.run_async로 기다립니다. (호출 태스크가 취소되면 대기 중인 파싱도 취소)"""
+        index = self._recall(str(xml_path))
+        if index is not None:
+            return index
+
+        index = await asyncio.to_thread(self._load, xml_path)
+        if index is None:
+            logger.info(f"🗂️ 섹션 인덱스 생성: {xml_path.name}")
+            index = await parse_pool.run_async("document", build_section_index_file, str(xml_path))
+            await asyncio.to_thread(self._save, xml_path, index)
+        return self._remember(str(xml_path), index)
+
+    @staticmethod
+    def _load(xml_path: Path) -> Optional[Dict[str, Any]]:
+        """저장된 인덱스를 읽습니다. 없거나 원문과 맞지 않으면 None"""
+        try:
+            with open(xml_path.with_suffix(".sections.json"), "r", encoding="utf-8") as f:
+                index: Dict[str, Any] = json.load(f)
+            if index.get("version") == INDEX_VERSION and index.get("size") == xml_path.stat().st_size:
+                return index
+        except (OSError, ValueError):
+            pass
+        return None
+
+    @staticmethod
+    def _save(xml_path: Path, index: Dict[str, Any]) -> None:
+        data = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        atomic_write(xml_path.with_suffix(".sections.json"), data)
+
+
+section_index_cache = SectionIndexCache()
+
+
+def table_of_contents(index: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """목차(id, level, title, 크기)를 반환합니다."""
+    return [
+        {"id": s["id"], "level": s["level"], "title": s["title"], "bytes": s["end"] - s["start"]}
+        for s in index["sections"]
+    ]
+
+
+def find_section(index: Dict[str, Any], query: str) -> Optional[Dict[str, Any]]:
+    """
+    섹션 id(숫자) 또는 제목으로 섹션을 찾습니다.
+    정규화된 제목이 일치 → 접두어 일치 → 부분 일치 순으로 검색합니다.
+    숫자이지만 해당 id의 섹션이 없으면 제목으로 다시 찾습니다.
+    """
+    sections: List[Dict[str, Any]] = index["sections"]
+    if query.strip().isdigit():
+        idx = int(query.strip())
+        if 0 <= idx < len(sections):
+            return sections[idx]
+
+    target = normalize_title(query)
+    titles = [normalize_title(s["title"]) for s in sections]
+    for matcher in (str.__eq__, str.startswith, str.__contains__):
+        for section, title in zip(sections, titles):
+            if title and matcher(title, target):
+                return section
+    return None
+
+
+def read_section(xml_path: Path, section: Dict[str, Any]) -> bytes:
+    """오프셋으로 섹션 원문만 읽어 옵니다. (전체 문서를 다시 파싱하지 않음)"""
+    with open(xml_path, "rb") as f:
+        f.seek(section["start"])
+        return f.read(section["end"] - section["start"])
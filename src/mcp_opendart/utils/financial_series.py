@@ -0,0 +1,117 @@
+import math
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .amounts import parse_amount, to_python
+
+# 보고서 코드 → 기간 표기 (같은 사업연도 안의 순서대로)
+REPORT_PERIODS = {
+    "11013": "Q1",
+    "11012": "H1",
+    "11014": "Q3",
+    "11011": "FY",
+}
+ANNUAL_REPORT = "11011"
+
+# 사업보고서는 당기·전기·전전기를 모두 연말 기준으로 담고 있어 이후 연도의 보고서로 이전 2개 연도를 채울 수 있습니다.
+# 분기·반기보고서의 전기 재무상태표는 전년 말 기준이라 같은 분기를 대신할 수 없으므로 항상 직접 조회합니다.
+ANNUAL_COMPARATIVES = (("thstrm", 0), ("frmtrm", 1), ("bfefrmtrm", 2))
+
+Period = Tuple[int, str]
+
+
+def period_label(period: Period) -> str:
+    year, reprt_code = period
+    return f"{year}.{REPORT_PERIODS[reprt_code]}"
+
+
+def period_order(period: Period) -> Tuple[int, int]:
+    return period[0], list(REPORT_PERIODS).index(period[1])
+
+
+def plan_fetches(pending: Set[Period], attempted: Set[Period]) -> List[Period]:
+    """
+    아직 채워지지 않은 기간 중 이번에 조회할 (사업연도, 보고서 코드) 목록
+
+    사업보고서는 최신 연도부터 한 건을 조회하면 이전 2개 연도가 함께 채워진다고 보고 건너뜁니다.
+    빠진 연도(미제출 등)는 다음 회차에 다시 계획됩니다.
+    """
+    plan: List[Period] = []
+    for reprt_code in REPORT_PERIODS:
+        years = sorted((year for year, code in pending if code == reprt_code and (year, code) not in attempted), reverse=True)
+        if reprt_code != ANNUAL_REPORT:
+            plan.extend((year, reprt_code) for year in years)
+            continue
+        covered_from: Optional[int] = None
+        for year in years:
+            if covered_from is not None and year >= covered_from:
+                continue
+            plan.append((year, reprt_code))
+            covered_from = year - (len(ANNUAL_COMPARATIVES) - 1)
+    return plan
+
+
+class SeriesTable:
+    """계정별 기간 값 표 (계정 키: 연결/개별, 재무제표 구분, 계정명)"""
+
+    def __init__(self, periods: List[Period]):
+        self.periods = set(periods)
+        self.values: Dict[Tuple[str, str, str], Dict[Period, Any]] = {}
+        self.sources: Dict[Period, str] = {}
+
+    @staticmethod
+    def account_key(row: Dict[str, Any]) -> Tuple[str, str, str]:
+        # 표준계정코드가 없는 계정은 account_id가 "-표준계정코드 미사용-"이므로 계정명으로 구분
+        account_id = row.get("account_id") or ""
+        if not account_id or account_id.startswith("-"):
+            account_id = row.get("account_nm", "")
+        return row.get("fs_div", ""), row.get("sj_div", ""), account_id
+
+    def merge(self, period: Period, rows: List[Dict[str, Any]]) -> Set[Period]:
+        """
+        보고서 한 건의 행을 표에 합치고 새로 채워진 기간을 반환합니다.
+
+        보고서 자신의 기간(당기) 값이 비교 기간(전기·전전기) 값보다 우선합니다.
+        열이 있어도 모든 행의 금액이 비어 있으면 해당 기간은 채우지 않습니다.
+        """
+        year, reprt_code = period
+        columns = ANNUAL_COMPARATIVES if reprt_code == ANNUAL_REPORT else ANNUAL_COMPARATIVES[:1]
+        filled: Set[Period] = set()
+        for prefix, back in columns:
+            target = (year - back, reprt_code)
+            if target not in self.periods:
+                continue
+            own = back == 0
+            if not own and target in self.sources:
+                continue
+            amounts = [
+                (row, parse_amount(row.get(f"{prefix}_amount")))
+                for row in rows if f"{prefix}_amount" in row
+            ]
+            if all(math.isnan(amount) for _, amount in amounts):
+                continue
+            for row, amount in amounts:
+                self.values.setdefault(self.account_key(row), {})[target] = {
+                    "amount": to_python(amount),
+                    "account_nm": row.get("account_nm", ""),
+                }
+            self.sources[target] = rows[0].get("rcept_no", "")
+            filled.add(target)
+        return filled
+
+    def to_dict(self) -> Dict[str, Any]:
+        periods = sorted(self.sources, key=period_order)
+        accounts = []
+        for (fs_div, sj_div, account), values in self.values.items():
+            name = next(iter(values.values()))["account_nm"]
+            accounts.append({
+                "fs_div": fs_div,
+                "sj_div": sj_div,
+                "account_nm": name,
+                **({"account_id": account} if account != name else {}),
+                "values": [values[period]["amount"] if period in values else None for period in periods],
+            })
+        return {
+            "periods": [period_label(period) for period in periods],
+            "sources": [self.sources[period] for period in periods],
+            "accounts": accounts,
+        }
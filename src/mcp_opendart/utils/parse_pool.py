@@ -0,0 +1,157 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..config import opendart_config
+
+logger = logging.getLogger("mcp-opendart")
+
+
+def _invoke(func: Callable[..., Any], args: Tuple[Any, ...], submitted_at: float) -> Tuple[float, float, bytes]:
+    """
+    워커 프로세스에서 실행되는 래퍼
+
+    결과는 공백 없는 JSON 바이트로 직렬화하여 돌려보내고, 대기/처리 시간을 함께 반환합니다.
+    """
+    started_at = time.time()
+    result = func(*args)
+    payload = json.dumps(result, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return started_at - submitted_at, time.time() - started_at, payload
+
+
+class ParsePool:
+    """
+    CPU 사용량이 큰 파싱(공시 원문, XBRL, CORPCODE)을 별도 프로세스에서 실행하는 풀
+
+    이벤트 루프와 다른 세션이 하나의 큰 파싱 때문에 멈추지 않도록 GIL 밖에서 처리합니다.
+    max_workers가 0이면 현재 프로세스에서 바로 실행합니다.
+    취소·시간 초과 시 대기 중인 작업은 실행되지 않습니다. 이미 워커에서 실행 중인 작업은 중단할 수 없어
+    끝까지 실행된 뒤 결과가 버려지며, 그동안 워커 하나를 점유합니다.
+    """
+
+    def __init__(self, max_workers: int, timeout: Optional[float] = None):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    def _stats_for(self, name: str) -> Dict[str, float]:
+        """작업 종류별 통계 (self._lock 내부에서 호출)"""
+        return self._stats.setdefault(name, {
+            "count": 0, "errors": 0, "cancelled": 0, "pending": 0,
+            "queue_wait_total": 0.0, "queue_wait_max": 0.0,
+            "parse_time_total": 0.0, "parse_time_max": 0.0,
+        })
+
+    def _record(self, name: str, queue_wait: float = 0.0, parse_time: float = 0.0, outcome: str = "ok") -> None:
+        with self._lock:
+            stats = self._stats_for(name)
+            if outcome != "ok":
+                stats[outcome] += 1
+                return
+            stats["count"] += 1
+            stats["queue_wait_total"] += queue_wait
+            stats["queue_wait_max"] = max(stats["queue_wait_max"], queue_wait)
+            stats["parse_time_total"] += parse_time
+            stats["parse_time_max"] = max(stats["parse_time_max"], parse_time)
+        logger.info(f"⚙️ 파싱 완료 [{name}] 대기 {queue_wait:.3f}s / 처리 {parse_time:.3f}s")
+
+    def _submit(self, name: str, func: Callable[..., Any], args: Tuple[Any, ...]) -> "Future[Tuple[float, float, bytes]]":
+        future = self._get_executor().submit(_invoke, func, args, time.time())
+        with self._lock:
+            self._stats_for(name)["pending"] += 1
+        future.add_done_callback(lambda _: self._finish(name))
+        return future
+
+    def _finish(self, name: str) -> None:
+        with self._lock:
+            self._stats_for(name)["pending"] -= 1
+
+    def _decode(self, name: str, future: "Future[Tuple[float, float, bytes]]") -> Any:
+        try:
+            queue_wait, parse_time, payload = future.result()
+        except Exception:
+            self._record(name, outcome="errors")
+            raise
+        self._record(name, queue_wait, parse_time)
+        return json.loads(payload)
+
+    def run(self, name: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        func(*args)를 워커 프로세스에서 실행하고 결과를 기다립니다. (동기 호출용)
+
+        func와 인자는 pickle 가능해야 하며 결과는 JSON으로 표현 가능해야 합니다.
+
+        Raises:
+            TimeoutError: timeout 안에 끝나지 않은 경우. 대기 중이면 취소되고,
+                이미 실행 중이면 워커에서 끝까지 실행된 뒤 결과가 버려집니다.
+        """
+        if self.max_workers <= 0:
+            _, parse_time, payload = _invoke(func, args, time.time())
+            self._record(name, 0.0, parse_time)
+            return json.loads(payload)
+
+        future = self._submit(name, func, args)
+        try:
+            future.exception(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            self._record(name, outcome="cancelled")
+            raise TimeoutError(f"파싱 작업 시간 초과: {name}")
+        return self._decode(name, future)
+
+    async def run_async(self, name: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        func(*args)를 워커 프로세스에서 실행합니다. (이벤트 루프용)
+
+        호출한 태스크가 취소되면 아직 시작하지 않은 작업도 함께 취소합니다.
+        이미 실행 중인 작업은 run과 마찬가지로 끝까지 실행된 뒤 결과가 버려집니다.
+        """
+        if self.max_workers <= 0:
+            return await asyncio.to_thread(self.run, name, func, *args)
+
+        future = self._submit(name, func, args)
+        try:
+            done, _ = await asyncio.wait({asyncio.wrap_future(future)}, timeout=self.timeout)
+        except asyncio.CancelledError:
+            future.cancel()
+            self._record(name, outcome="cancelled")
+            raise
+        if not done:
+            future.cancel()
+            self._record(name, outcome="cancelled")
+            raise TimeoutError(f"파싱 작업 시간 초과: {name}")
+        return self._decode(name, future)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """작업 종류별 처리 건수, 대기·실행 중인 작업 수(pending), 대기 시간, 파싱 시간 통계"""
+        with self._lock:
+            result = {}
+            for name, stats in self._stats.items():
+                count = stats["count"] or 1
+                result[name] = {
+                    **stats,
+                    "queue_wait_avg": stats["queue_wait_total"] / count,
+                    "parse_time_avg": stats["parse_time_total"] / count,
+                }
+            return result
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+parse_pool = ParsePool(opendart_config.parse_pool_workers, opendart_config.parse_timeout or None)
@@ -0,0 +1,85 @@
+import math
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from .amounts import MISSING, to_python
+from .ratio_engine import Vector
+from .statement_cube import StatementCube
+
+# 분기 → 누적 금액을 담은 보고서 (4분기 누적 = 사업보고서 연간 금액)
+QUARTER_REPORTS = (("Q1", "11013"), ("Q2", "11012"), ("Q3", "11014"), ("Q4", "11011"))
+# 시점 잔액 계정 (분기말 값을 그대로 사용)
+STOCK_STATEMENTS = ("BS",)
+
+
+def decumulate(cumulative: Vector, reported: Vector) -> Vector:
+    """
+    사업연도별 누적 금액(분기 순서, 4개씩)을 분기별 금액으로 바꿉니다.
+
+    1분기는 누적 금액 그대로, 이후 분기는 당기 누적 - 직전 분기 누적입니다. (4분기 = 연간 - 3분기 누적)
+    직전 분기 누적이 없으면 보고서의 3개월 금액(reported)으로 대신합니다.
+    """
+    result = array("d", [MISSING]) * len(cumulative)
+    for i, (total, own) in enumerate(zip(cumulative, reported)):
+        if i % 4 == 0:
+            result[i] = total
+        else:
+            value = total - cumulative[i - 1]
+            result[i] = own if math.isnan(value) else value
+    return result
+
+
+def quarterly_series(
+    cube: StatementCube,
+    corp_code: str,
+    years: List[str],
+    fs_div: str,
+    account_ids: Optional[List[str]] = None,
+    sj_div: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    큐브의 누적 재무제표로 회사 한 곳의 모든 계정을 분기별 금액 표로 만듭니다.
+
+    손익·현금흐름 계정은 누적 금액(thstrm_add_amount, 없으면 thstrm_amount)을 decumulate하고,
+    재무상태표 계정은 분기말 잔액을 그대로 씁니다.
+
+    Returns:
+        Dict[str, Any]: periods(예: "2024.Q1"), sources(분기별 접수번호), accounts
+    """
+    periods: List[Tuple[str, str]] = [(year, quarter) for year in years for quarter, _ in QUARTER_REPORTS]
+    slots = [cube.slot_of((corp_code, year, reprt_code, fs_div)) for year in years for _, reprt_code in QUARTER_REPORTS]
+    slots = [slot if slot >= 0 and cube.status[slot] == "000" else -1 for slot in slots]
+
+    if account_ids:
+        numbers = [cube.accounts.find(account_id, sj_div) for account_id in account_ids]
+        accounts = [number for number in numbers if number is not None]
+    else:
+        accounts = [number for number, key in enumerate(cube.accounts.keys) if not sj_div or key[0] == sj_div]
+
+    rows = []
+    for account in accounts:
+        statement, account_id = cube.accounts.keys[account]
+        thstrm = cube.gather("thstrm_amount", account, slots)
+        if all(math.isnan(value) for value in thstrm):
+            continue
+        if statement in STOCK_STATEMENTS:
+            kind, values = "stock", thstrm
+        else:
+            added = cube.gather("thstrm_add_amount", account, slots)
+            cumulative = array("d", (t if math.isnan(a) else a for t, a in zip(thstrm, added)))
+            # 누적 금액이 따로 있는 보고서의 thstrm_amount는 3개월 금액입니다
+            reported = array("d", (MISSING if math.isnan(a) else t for t, a in zip(thstrm, added)))
+            kind, values = "flow", decumulate(cumulative, reported)
+        rows.append({
+            "sj_div": statement,
+            "account_id": account_id,
+            "account_nm": cube.accounts.names[account],
+            "kind": kind,
+            "values": [to_python(value) for value in values],
+        })
+
+    return {
+        "periods": [f"{year}.{quarter}" for year, quarter in periods],
+        "sources": [cube.rcept_no[slot] if slot >= 0 else None for slot in slots],
+        "accounts": rows,
+    }
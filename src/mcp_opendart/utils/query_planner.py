@@ -0,0 +1,52 @@
+import datetime
+from typing import List, Tuple
+
+DATE_FORMAT = "%Y%m%d"
+
+# 고유번호 없이 공시검색할 때 허용되는 최대 기간(개월)
+MARKET_WIDE_WINDOW_MONTHS = 3
+
+
+def parse_date(value: str) -> datetime.date:
+    """YYYYMMDD 문자열을 date로 변환합니다."""
+    return datetime.datetime.strptime(value, DATE_FORMAT).date()
+
+
+def format_date(value: datetime.date) -> str:
+    return value.strftime(DATE_FORMAT)
+
+
+def add_months(value: datetime.date, months: int) -> datetime.date:
+    """월 단위 이동 (말일을 넘는 날짜는 해당 월 말일로 보정)"""
+    month_index = value.year * 12 + value.month - 1 + months
+    year, month = divmod(month_index, 12)
+    month += 1
+    next_month = datetime.date(year + (month == 12), month % 12 + 1, 1)
+    last_day = (next_month - datetime.timedelta(days=1)).day
+    return datetime.date(year, month, min(value.day, last_day))
+
+
+def split_date_range(
+    bgn_de: str,
+    end_de: str,
+    months: int = MARKET_WIDE_WINDOW_MONTHS,
+    newest_first: bool = True
+) -> List[Tuple[str, str]]:
+    """
+    조회 기간을 months개월 이하의 연속 구간으로 나눕니다.
+
+    예: 20230101~20231231 → [(20231001, 20231231), (20230701, 20230930), ...]
+
+    Raises:
+        ValueError: 날짜 형식이 잘못되었거나 시작일이 종료일보다 늦은 경우
+    """
+    start, end = parse_date(bgn_de), parse_date(end_de)
+    if start > end:
+        raise ValueError(f"시작일({bgn_de})이 종료일({end_de})보다 늦습니다.")
+
+    windows: List[Tuple[str, str]] = []
+    while start <= end:
+        window_end = min(add_months(start, months) - datetime.timedelta(days=1), end)
+        windows.append((format_date(start), format_date(window_end)))
+        start = window_end + datetime.timedelta(days=1)
+    return windows[::-1] if newest_first else windows
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+if sys.platform != "win32":
+    import fcntl
+
+from ..config import opendart_config, OpenDartConfig
+
+
+class RateLimiter:
+    """
+    토큰 버킷 방식의 호출 제한기
+
+    period초 동안 최대 limit회 호출을 허용하며, 토큰은 연속적으로 채워집니다.
+    버킷 크기가 limit이므로 짧은 순간의 동시 호출(fan-out)은 그대로 통과하고
+    장시간 누적 호출량만 제한됩니다.
+    """
+
+    def __init__(self, limit: int, period: float):
+        self.capacity = max(1, limit)
+        self.rate = self.capacity / max(period, 1e-9)
+        self._tokens = float(self.capacity)
+        self._updated = self._clock()
+        self._lock = threading.Lock()
+
+    def _clock(self) -> float:
+        return time.monotonic()
+
+    @contextmanager
+    def _bucket(self) -> Iterator[None]:
+        """버킷 상태를 읽고 바꾸는 동안의 잠금"""
+        with self._lock:
+            yield
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + max(0.0, now - self._updated) * self.rate)
+        self._updated = max(self._updated, now)
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """토큰 하나를 얻을 때까지 기다립니다. timeout 안에 얻지 못하면 False"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._bucket():
+                self._refill(self._clock())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def available(self) -> float:
+        with self._bucket():
+            self._refill(self._clock())
+            return self._tokens
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    여러 프로세스(MCP 서버, 수집 작업)가 함께 쓰는 파일 기반 토큰 버킷
+
+    버킷 상태(남은 토큰, 갱신 시각)를 path에 두고 flock으로 잠근 채 읽고 씁니다.
+    시각은 프로세스 간에 비교할 수 있도록 time.time()을 씁니다.
+    """
+
+    def __init__(self, limit: int, period: float, path: Path):
+        super().__init__(limit, period)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _clock(self) -> float:
+        return time.time()
+
+    @contextmanager
+    def _bucket(self) -> Iterator[None]:
+        with self._lock, open(self.path, "a+b") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read())
+                    self._tokens, self._updated = float(state["tokens"]), float(state["updated"])
+                except (ValueError, KeyError, TypeError):
+                    pass  # 처음 쓰거나 손상된 파일이면 이 프로세스의 상태로 다시 기록
+                yield
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps({"tokens": self._tokens, "updated": self._updated}).encode("utf-8"))
+                f.flush()
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(config: Optional[OpenDartConfig] = None) -> RateLimiter:
+    """
+    API 키별 공유 RateLimiter 인스턴스를 반환합니다. (한도는 키 단위로 적용되므로)
+
+    버킷은 <data_dir>/rate_limit/에 저장되어 같은 data_dir을 쓰는 MCP 서버와 수집 작업이 한도를 나눠 씁니다.
+    flock이 없는 Windows에서는 프로세스 안에서만 공유됩니다.
+    """
+    config = config or opendart_config
+    with _limiters_lock:
+        limiter = _limiters.get(config.api_key)
+        if limiter is None:
+            if sys.platform == "win32":
+                limiter = RateLimiter(config.api_rate_limit, config.api_rate_limit_period)
+            else:
+                digest = hashlib.sha256(config.api_key.encode("utf-8")).hexdigest()[:16]
+                path = Path(config.data_dir) / "rate_limit" / f"{digest}.json"
+                limiter = SharedRateLimiter(config.api_rate_limit, config.api_rate_limit_period, path)
+            _limiters[config.api_key] = limiter
+        return limiter
@@ -0,0 +1,207 @@
+import math
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, TypeAlias
+
+from .amounts import MISSING, to_python
+
+# 손익·현금흐름 계정의 재무제표 구분 (포괄손익계산서만 공시하는 회사가 있어 IS → CIS 순으로 찾습니다)
+FLOW_STATEMENTS = ("IS", "CIS")
+
+
+class Concept(NamedTuple):
+    """비율 계산에 쓰는 표준 계정 (account_id 후보는 ifrs-full_/ifrs_ 접두어를 뗀 형태)"""
+    name: str
+    sj_divs: Tuple[str, ...]
+    account_ids: Tuple[str, ...]
+    flow: bool
+
+
+CONCEPTS = (
+    Concept("revenue", FLOW_STATEMENTS, ("Revenue",), True),
+    Concept("cost_of_sales", FLOW_STATEMENTS, ("CostOfSales",), True),
+    Concept("gross_profit", FLOW_STATEMENTS, ("GrossProfit",), True),
+    Concept("operating_income", FLOW_STATEMENTS, ("dart_OperatingIncomeLoss",), True),
+    Concept("finance_costs", FLOW_STATEMENTS, ("FinanceCosts",), True),
+    Concept("net_income", FLOW_STATEMENTS, ("ProfitLoss",), True),
+    Concept("net_income_owners", FLOW_STATEMENTS, ("ProfitLossAttributableToOwnersOfParent",), True),
+    Concept("operating_cash_flow", ("CF",), ("CashFlowsFromUsedInOperatingActivities",), True),
+    Concept("assets", ("BS",), ("Assets",), False),
+    Concept("current_assets", ("BS",), ("CurrentAssets",), False),
+    Concept("cash", ("BS",), ("CashAndCashEquivalents",), False),
+    Concept("inventories", ("BS",), ("Inventories",), False),
+    Concept("receivables", ("BS",), ("dart_ShortTermTradeReceivable", "CurrentTradeReceivables",
+                                     "TradeAndOtherCurrentReceivables"), False),
+    Concept("liabilities", ("BS",), ("Liabilities",), False),
+    Concept("current_liabilities", ("BS",), ("CurrentLiabilities",), False),
+    Concept("equity", ("BS",), ("Equity",), False),
+    Concept("equity_owners", ("BS",), ("EquityAttributableToOwnersOfParent",), False),
+)
+
+# 누적 손익을 연 환산하는 배수 (1분기 3개월, 반기 6개월, 3분기 9개월)
+ANNUALIZE = {"11013": 4.0, "11012": 2.0, "11014": 4.0 / 3.0, "11011": 1.0}
+
+# 기간(슬롯)별 값 배열, 결측은 NaN
+Vector: TypeAlias = "array[float]"
+# 개념 이름 → (당기 배열, 전기 배열)
+ConceptMatrix = Dict[str, Tuple[Vector, Vector]]
+
+
+def normalize_account_id(account_id: str) -> str:
+    """ifrs-full_Revenue / ifrs_Revenue → Revenue (dart_ 확장계정은 그대로)"""
+    for prefix in ("ifrs-full_", "ifrs_"):
+        if account_id.startswith(prefix):
+            return account_id[len(prefix):]
+    return account_id
+
+
+# ----------------------------------------------------------------------
+# 배열 연산 (모든 연산은 길이가 같은 배열을 원소별로 계산하며 NaN이 전파됩니다)
+# ----------------------------------------------------------------------
+def _zip_map(func: Callable[..., float], *vectors: Vector) -> Vector:
+    return array("d", map(func, *vectors))
+
+
+def _divide(numerator: Vector, denominator: Vector, scale: float = 1.0) -> Vector:
+    return _zip_map(lambda n, d: n / d * scale if d else MISSING, numerator, denominator)
+
+
+def _subtract(left: Vector, right: Vector) -> Vector:
+    return _zip_map(lambda a, b: a - b, left, right)
+
+
+def _scale(vector: Vector, factors: Vector) -> Vector:
+    return _zip_map(lambda a, f: a * f, vector, factors)
+
+
+def _coalesce(*vectors: Vector) -> Vector:
+    """원소별로 NaN이 아닌 첫 값"""
+    return _zip_map(lambda *values: next((v for v in values if not math.isnan(v)), MISSING), *vectors)
+
+
+def _average(current: Vector, previous: Vector) -> Vector:
+    """기초·기말 평균 (기초 값이 없으면 기말 값)"""
+    return _zip_map(lambda c, p: c if math.isnan(p) else (c + p) / 2, current, previous)
+
+
+def _growth(current: Vector, previous: Vector) -> Vector:
+    return _zip_map(lambda c, p: (c - p) / abs(p) * 100 if p else MISSING, current, previous)
+
+
+def _zero_fill(vector: Vector) -> Vector:
+    return _zip_map(lambda v: 0.0 if math.isnan(v) else v, vector)
+
+
+class Ratio(NamedTuple):
+    name: str
+    label: str
+    category: str
+    unit: str
+    formula: Callable[[ConceptMatrix, Vector], Vector]
+
+
+def _cur(m: ConceptMatrix, name: str) -> Vector:
+    return m[name][0]
+
+
+def _prev(m: ConceptMatrix, name: str) -> Vector:
+    return m[name][1]
+
+
+def _gross_profit(m: ConceptMatrix) -> Vector:
+    return _coalesce(_cur(m, "gross_profit"), _subtract(_cur(m, "revenue"), _cur(m, "cost_of_sales")))
+
+
+def _owners_income(m: ConceptMatrix) -> Vector:
+    return _coalesce(_cur(m, "net_income_owners"), _cur(m, "net_income"))
+
+
+def _owners_equity(m: ConceptMatrix) -> Vector:
+    return _average(_coalesce(_cur(m, "equity_owners"), _cur(m, "equity")),
+                    _coalesce(_prev(m, "equity_owners"), _prev(m, "equity")))
+
+
+def _balance(m: ConceptMatrix, name: str) -> Vector:
+    return _average(_cur(m, name), _prev(m, name))
+
+
+# 수익률·회전율은 ann(연 환산 배수)을 곱해 분기·반기 누적 값을 연간 기준으로 맞춥니다
+RATIOS = (
+    # 수익성
+    Ratio("gross_margin", "매출총이익률", "수익성", "%",
+          lambda m, ann: _divide(_gross_profit(m), _cur(m, "revenue"), 100)),
+    Ratio("operating_margin", "영업이익률", "수익성", "%",
+          lambda m, ann: _divide(_cur(m, "operating_income"), _cur(m, "revenue"), 100)),
+    Ratio("net_margin", "순이익률", "수익성", "%",
+          lambda m, ann: _divide(_cur(m, "net_income"), _cur(m, "revenue"), 100)),
+    Ratio("roe", "ROE", "수익성", "%",
+          lambda m, ann: _divide(_scale(_owners_income(m), ann), _owners_equity(m), 100)),
+    Ratio("roa", "ROA", "수익성", "%",
+          lambda m, ann: _divide(_scale(_cur(m, "net_income"), ann), _balance(m, "assets"), 100)),
+    # 안정성
+    Ratio("debt_ratio", "부채비율", "안정성", "%",
+          lambda m, ann: _divide(_cur(m, "liabilities"), _cur(m, "equity"), 100)),
+    Ratio("equity_ratio", "자기자본비율", "안정성", "%",
+          lambda m, ann: _divide(_cur(m, "equity"), _cur(m, "assets"), 100)),
+    Ratio("current_ratio", "유동비율", "안정성", "%",
+          lambda m, ann: _divide(_cur(m, "current_assets"), _cur(m, "current_liabilities"), 100)),
+    Ratio("quick_ratio", "당좌비율", "안정성", "%",
+          lambda m, ann: _divide(_subtract(_cur(m, "current_assets"), _zero_fill(_cur(m, "inventories"))),
+                                 _cur(m, "current_liabilities"), 100)),
+    Ratio("interest_coverage", "이자보상배율", "안정성", "배",
+          lambda m, ann: _divide(_cur(m, "operating_income"), _cur(m, "finance_costs"))),
+    # 성장성 (전년 동기 대비, 재무상태표 항목은 직전 사업연도 말 대비)
+    Ratio("revenue_growth", "매출액증가율", "성장성", "%",
+          lambda m, ann: _growth(_cur(m, "revenue"), _prev(m, "revenue"))),
+    Ratio("operating_income_growth", "영업이익증가율", "성장성", "%",
+          lambda m, ann: _growth(_cur(m, "operating_income"), _prev(m, "operating_income"))),
+    Ratio("net_income_growth", "순이익증가율", "성장성", "%",
+          lambda m, ann: _growth(_cur(m, "net_income"), _prev(m, "net_income"))),
+    Ratio("assets_growth", "총자산증가율", "성장성", "%",
+          lambda m, ann: _growth(_cur(m, "assets"), _prev(m, "assets"))),
+    Ratio("equity_growth", "자기자본증가율", "성장성", "%",
+          lambda m, ann: _growth(_cur(m, "equity"), _prev(m, "equity"))),
+    # 활동성
+    Ratio("asset_turnover", "총자산회전율", "활동성", "회",
+          lambda m, ann: _divide(_scale(_cur(m, "revenue"), ann), _balance(m, "assets"))),
+    Ratio("receivables_turnover", "매출채권회전율", "활동성", "회",
+          lambda m, ann: _divide(_scale(_cur(m, "revenue"), ann), _balance(m, "receivables"))),
+    Ratio("inventory_turnover", "재고자산회전율", "활동성", "회",
+          lambda m, ann: _divide(_scale(_coalesce(_cur(m, "cost_of_sales"), _cur(m, "revenue")), ann),
+                                 _balance(m, "inventories"))),
+)
+
+RATIO_CATEGORIES = tuple(dict.fromkeys(ratio.category for ratio in RATIOS))
+
+
+def compute_ratios(
+    matrix: ConceptMatrix,
+    reprt_codes: List[str],
+    names: Optional[Iterable[str]] = None
+) -> Dict[str, Vector]:
+    """
+    개념 배열에서 비율 배열을 한 번에 계산합니다.
+
+    Args:
+        matrix: StatementCube.concept_matrix 결과 (재무제표 N건)
+        reprt_codes: 각 재무제표의 보고서 코드 (길이 N, 연 환산 배수 결정)
+        names: 계산할 비율 이름 (기본: 전체)
+    """
+    annualize = array("d", (ANNUALIZE.get(code, 1.0) for code in reprt_codes))
+    wanted = set(names) if names is not None else None
+    return {ratio.name: ratio.formula(matrix, annualize)
+            for ratio in RATIOS if wanted is None or ratio.name in wanted}
+
+
+def ratio_table(ratios: Dict[str, Vector], digits: int = 2) -> List[Dict[str, Any]]:
+    """비율 배열을 응답용 목록으로 바꿉니다. (소수점 digits자리, NaN·무한대 → None)"""
+    by_name = {ratio.name: ratio for ratio in RATIOS}
+    return [
+        {
+            "name": name,
+            "label": by_name[name].label,
+            "category": by_name[name].category,
+            "unit": by_name[name].unit,
+            "values": [to_python(round(value, digits)) if math.isfinite(value) else None for value in values],
+        }
+        for name, values in ratios.items()
+    ]
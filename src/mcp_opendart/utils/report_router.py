@@ -0,0 +1,155 @@
+import re
+from typing import Any, Dict, List, NamedTuple, Optional
+
+_NORMALIZE = re.compile(r"[\s·ㆍ・]")
+_CORRECTION_PREFIX = re.compile(r"^\[[^\]]*\]")
+
+
+class Route(NamedTuple):
+    pattern: str
+    api: str
+    method: str
+    endpoint: str
+    title: str
+
+
+# report_nm(정규화) 패턴 → DS005/DS006 상세 조회 메서드
+# 같은 단어를 포함하는 패턴이 있으므로 구체적인 패턴을 먼저 둡니다 (예: 유무상증자 → 유상증자)
+MAJOR_REPORT_ROUTES: List[Route] = [
+    Route("자산양수도(기타)", "ds005", "get_asset_transfer", "astInhtrfEtcPtbkOpt", "자산양수도(기타), 풋백옵션"),
+    Route("부도발생", "ds005", "get_bankruptcy", "dfOcr", "부도발생"),
+    Route("영업정지", "ds005", "get_business_suspension", "bsnSp", "영업정지"),
+    Route("회생절차개시신청", "ds005", "get_rehabilitation", "ctrcvsBgrq", "회생절차 개시신청"),
+    Route("해산사유발생", "ds005", "get_dissolution", "dsRsOcr", "해산사유 발생"),
+    Route("유무상증자결정", "ds005", "get_paid_free_capital_increase", "pifricDecsn", "유무상증자 결정"),
+    Route("유상증자결정", "ds005", "get_paid_in_capital_increase", "piicDecsn", "유상증자 결정"),
+    Route("무상증자결정", "ds005", "get_free_capital_increase", "fricDecsn", "무상증자 결정"),
+    Route("감자결정", "ds005", "get_capital_reduction", "crDecsn", "감자 결정"),
+    Route("관리절차중단", "ds005", "get_creditor_management_termination", "bnkMngtPcsp", "채권은행 등의 관리절차 중단"),
+    Route("관리절차개시", "ds005", "get_creditor_management", "bnkMngtPcbg", "채권은행 등의 관리절차 개시"),
+    Route("소송등의제기", "ds005", "get_lawsuit", "lwstLg", "소송 등의 제기"),
+    Route("상장폐지결정", "ds005", "get_foreign_delisting_decision", "ovDlstDecsn", "해외 증권시장 주권등 상장폐지 결정"),
+    Route("상장결정", "ds005", "get_foreign_listing_decision", "ovLstDecsn", "해외 증권시장 주권등 상장 결정"),
+    Route("상장폐지", "ds005", "get_foreign_delisting", "ovDlst", "해외 증권시장 주권등 상장폐지"),
+    Route("해외증권시장주권등상장", "ds005", "get_foreign_listing", "ovLst", "해외 증권시장 주권등 상장"),
+    Route("전환사채권발행결정", "ds005", "get_convertible_bond", "cvbdIsDecsn", "전환사채권 발행결정"),
+    Route("신주인수권부사채권발행결정", "ds005", "get_bond_with_warrant", "bdwtIsDecsn", "신주인수권부사채권 발행결정"),
+    Route("교환사채권발행결정", "ds005", "get_exchangeable_bond", "exbdIsDecsn", "교환사채권 발행결정"),
+    Route("조건부자본증권발행결정", "ds005", "get_write_down_bond", "wdCocobdIsDecsn", "상각형 조건부자본증권 발행결정"),
+    Route("신탁계약체결결정", "ds005", "get_treasury_stock_trust_contract", "tsstkAqTrctrCnsDecsn", "자기주식취득 신탁계약 체결 결정"),
+    Route("신탁계약해지결정", "ds005", "get_treasury_stock_trust_termination", "tsstkAqTrctrCcDecsn", "자기주식취득 신탁계약 해지 결정"),
+    Route("자기주식취득결정", "ds005", "get_treasury_stock_acquisition", "tsstkAqDecsn", "자기주식 취득 결정"),
+    Route("자기주식처분결정", "ds005", "get_treasury_stock_disposal", "tsstkDpDecsn", "자기주식 처분 결정"),
+    Route("영업양수결정", "ds005", "get_business_acquisition", "bsnInhDecsn", "영업양수 결정"),
+    Route("영업양도결정", "ds005", "get_business_transfer", "bsnTrfDecsn", "영업양도 결정"),
+    Route("유형자산양수결정", "ds005", "get_tangible_asset_acquisition", "tgastInhDecsn", "유형자산 양수 결정"),
+    Route("유형자산양도결정", "ds005", "get_tangible_asset_transfer", "tgastTrfDecsn", "유형자산 양도 결정"),
+    Route("출자증권양수결정", "ds005", "get_other_corp_stock_acquisition", "otcprStkInvscrInhDecsn", "타법인 주식 및 출자증권 양수결정"),
+    Route("출자증권양도결정", "ds005", "get_other_corp_stock_transfer", "otcprStkInvscrTrfDecsn", "타법인 주식 및 출자증권 양도결정"),
+    Route("사채권양수결정", "ds005", "get_stock_related_bond_acquisition", "stkrtbdInhDecsn", "주권 관련 사채권 양수 결정"),
+    Route("사채권양도결정", "ds005", "get_stock_related_bond_transfer", "stkrtbdTrfDecsn", "주권 관련 사채권 양도 결정"),
+    Route("회사분할합병결정", "ds005", "get_division_merger", "cmpDvmgDecsn", "회사분할합병 결정"),
+    Route("회사분할결정", "ds005", "get_division", "cmpDvDecsn", "회사분할 결정"),
+    Route("회사합병결정", "ds005", "get_merger", "cmpMgDecsn", "회사합병 결정"),
+    Route("주식교환이전결정", "ds005", "get_stock_exchange", "stkExtrDecsn", "주식교환·이전 결정"),
+]
+
+SECURITIES_FILING_ROUTES: List[Route] = [
+    Route("(지분증권)", "ds006", "get_equity", "estkRs", "지분증권"),
+    Route("(채무증권)", "ds006", "get_debt", "bdRs", "채무증권"),
+    Route("(증권예탁증권)", "ds006", "get_depository_receipt", "stkdpRs", "증권예탁증권"),
+    Route("(주식의포괄적교환이전)", "ds006", "get_stock_exchange_report", "extrRs", "주식의포괄적교환·이전"),
+    Route("(분할)", "ds006", "get_division_report", "dvRs", "분할"),
+    Route("(합병)", "ds006", "get_merger_report", "mgRs", "합병"),
+]
+
+
+def normalize_report_name(report_nm: str) -> str:
+    """라우팅용 정규화 ([기재정정] 등 접두어, 공백, 가운뎃점 제거)"""
+    return _NORMALIZE.sub("", _CORRECTION_PREFIX.sub("", report_nm.strip()))
+
+
+def route_report(report_nm: str) -> Optional[Route]:
+    """
+    보고서명에 해당하는 상세 조회 메서드를 찾습니다.
+
+    주요사항보고서는 DS005, 증권신고서는 DS006 경로만 확인하며 해당 없으면 None
+    """
+    name = normalize_report_name(report_nm)
+    if name.startswith("주요사항보고서"):
+        routes = MAJOR_REPORT_ROUTES
+    elif name.startswith("증권신고서"):
+        routes = SECURITIES_FILING_ROUTES
+    else:
+        return None
+    for route in routes:
+        if route.pattern in name:
+            return route
+    return None
+
+
+def fetch_report_detail(context: Any, route: Route, corp_code: str, rcept_no: str) -> Dict[str, Any]:
+    """
+    라우팅된 메서드 하나만 호출하여 접수번호에 해당하는 상세 정보를 반환합니다.
+
+    상세 API는 접수일자 기간으로 조회하므로 rcept_no의 접수일 하루만 조회하고 rcept_no로 거릅니다.
+    일치하는 항목이 없으면 (정정 공시 등) 그날의 응답을 그대로 두고 exact_match=False로 표시합니다.
+    """
+    rcept_dt = rcept_no[:8]
+    method = getattr(getattr(context, route.api), route.method)
+    response: Dict[str, Any] = method(corp_code, rcept_dt, rcept_dt)
+    if response.get("status") != "000":
+        return response
+    if "group" in response:
+        # 증권신고서(DS006)는 항목 그룹(일반사항, 증권의종류 등)별 목록으로 응답합니다.
+        groups = [
+            {**group, "list": [item for item in group.get("list", []) if item.get("rcept_no") == rcept_no]}
+            for group in response["group"]
+        ]
+        exact = any(group["list"] for group in groups)
+        return {**response, "group": groups if exact else response["group"], "exact_match": exact}
+
+    items = response.get("list", [])
+    matched = [item for item in items if item.get("rcept_no") == rcept_no]
+    return {**response, "list": matched or items, "exact_match": bool(matched)}
+
+
+def get_report_detail(
+    context: Any,
+    rcept_no: str,
+    corp_code: Optional[str] = None,
+    report_nm: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    공시 한 건의 보고서명으로 DS005/DS006 상세 API를 골라 한 번만 호출합니다.
+
+    corp_code와 report_nm을 함께 주면 공시 행 조회를 생략합니다.
+
+    Args:
+        context: ds001, ds005, ds006 API를 가진 OpenDartContext
+        rcept_no (str): 접수번호(14자리)
+        corp_code (str, optional): 공시대상회사의 고유번호(8자리)
+        report_nm (str, optional): 공시검색 결과의 보고서명
+    """
+    if corp_code and report_nm:
+        disclosure = {"rcept_no": rcept_no, "corp_code": corp_code, "report_nm": report_nm}
+    else:
+        found: Dict[str, Any] = context.ds001.find_disclosure(rcept_no, corp_code=corp_code)
+        if found.get("status") != "000":
+            return found
+        disclosure = found["disclosure"]
+
+    route = route_report(disclosure["report_nm"])
+    if route is None:
+        return {
+            "status": "013",
+            "message": f"'{disclosure['report_nm']}'에 해당하는 주요사항보고서/증권신고서 상세 API가 없습니다.",
+            "disclosure": disclosure
+        }
+
+    detail = fetch_report_detail(context, route, disclosure["corp_code"], rcept_no)
+    return {
+        **detail,
+        "route": {"api": route.api.upper(), "method": route.method, "endpoint": f"{route.endpoint}.json"},
+        "disclosure": disclosure
+    }
@@ -0,0 +1,75 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ..config import opendart_config, OpenDartConfig
+
+# 캐시하는 응답 상태 (000: 정상, 013: 조회된 데이터 없음 - 음성 캐시)
+CACHEABLE_STATUSES = ("000", "013")
+
+
+def cache_key(endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+    items = {k: v for k, v in (params or {}).items() if k != "crtfc_key"}
+    return f"{endpoint}?{json.dumps(items, sort_keys=True, ensure_ascii=False)}"
+
+
+class ResponseCache:
+    """
+    API 응답 메모리 캐시 (TTL + LRU)
+
+    "조회된 데이터가 없습니다"(013) 응답도 저장하여, 해당 기업·기간에 공시가 없는
+    엔드포인트를 반복 조회할 때 DART 호출을 생략합니다.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._items: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._items[key]
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, response: Dict[str, Any]) -> None:
+        if response.get("status") not in CACHEABLE_STATUSES or self.max_size <= 0:
+            return
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl_seconds, response)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._items), "hits": self.hits, "misses": self.misses}
+
+
+_caches: Dict[str, ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache(config: Optional[OpenDartConfig] = None) -> ResponseCache:
+    """설정의 API 키 기준 공유 ResponseCache 인스턴스를 반환합니다."""
+    config = config or opendart_config
+    with _caches_lock:
+        cache = _caches.get(config.api_key)
+        if cache is None:
+            cache = _caches[config.api_key] = ResponseCache(config.cache_ttl_hours * 3600, config.cache_max_size)
+        return cache
@@ -0,0 +1,153 @@
+import ast
+import math
+import operator
+from array import array
+from functools import partial
+from itertools import repeat
+from typing import Callable, Dict, Iterable, List, Set, Tuple, Union
+
+from .amounts import MISSING
+from .ratio_engine import CONCEPTS, RATIOS, Vector
+
+# 식에서 쓸 수 있는 변수 (재무비율 + 표준 계정 당기 금액)
+VARIABLES = tuple(ratio.name for ratio in RATIOS) + tuple(concept.name for concept in CONCEPTS)
+
+_COMPARISONS = {
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+}
+_ARITHMETIC = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: lambda a, b: a / b if b else MISSING,
+}
+
+Operand = Union[Vector, float]
+# (변수 → 배열, 배열 길이) → 결과
+Evaluator = Callable[[Dict[str, Vector], int], Operand]
+
+
+class ExpressionError(ValueError):
+    """지원하지 않는 스크리닝 식"""
+
+
+def _elementwise(func: Callable[..., float], operands: List[Operand], size: int) -> Vector:
+    """배열·상수가 섞인 피연산자에 func를 원소별로 적용합니다. (상수는 반복)"""
+    columns = [repeat(operand, size) if isinstance(operand, float) else operand for operand in operands]
+    return array("d", map(func, *columns))
+
+
+def _truth(value: float) -> bool:
+    return not math.isnan(value) and value != 0.0
+
+
+def _compare(comparisons: List[Callable[[float, float], bool]], *values: float) -> float:
+    """비교 결과 1.0/0.0. 피연산자에 NaN(값 없음)이 있으면 값 없음(NaN)"""
+    if any(math.isnan(value) for value in values):
+        return MISSING
+    return 1.0 if all(op(a, b) for op, a, b in zip(comparisons, values, values[1:])) else 0.0
+
+
+def _negate(value: float) -> float:
+    """not. 값 없음은 그대로 값 없음"""
+    if math.isnan(value):
+        return MISSING
+    return 0.0 if value != 0.0 else 1.0
+
+
+def _combine(conjunction: bool, *values: float) -> float:
+    """
+    and / or (3값 논리)
+
+    결과가 값 없음에 좌우되지 않으면 1.0/0.0, 그렇지 않으면 값 없음(NaN)입니다.
+    예: 값 없음 and 거짓 → 0.0, 값 없음 or 참 → 1.0, 값 없음 and 참 → NaN
+    """
+    decisive = 0.0 if conjunction else 1.0
+    missing = False
+    for value in values:
+        if math.isnan(value):
+            missing = True
+        elif (value != 0.0) != conjunction:
+            return decisive
+    return MISSING if missing else 1.0 - decisive
+
+
+def compile_expression(text: str) -> Tuple[Evaluator, Set[str]]:
+    """
+    스크리닝 식을 배열 평가 함수로 바꿉니다.
+
+    허용 문법: 변수(VARIABLES), 숫자, + - * /, 비교(연쇄 비교 포함), and / or / not, 괄호.
+    비교 결과는 1.0/0.0 배열이며 NaN(값 없음)과의 비교는 값 없음(NaN)으로 남아 not을 거쳐도 참이 되지 않습니다.
+    (and / or는 3값 논리, 필터에서 값 없음은 거짓)
+    함수 호출·속성 접근 등 그 밖의 구문은 ExpressionError입니다.
+
+    Returns:
+        (평가 함수, 사용한 변수 이름)
+    """
+    try:
+        tree = ast.parse(text.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ExpressionError(f"식을 해석할 수 없습니다: {text}") from e
+    used: Set[str] = set()
+
+    def build(node: ast.AST) -> Evaluator:
+        if isinstance(node, ast.Expression):
+            return build(node.body)
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            try:
+                value = float(node.value)
+            except OverflowError as e:
+                raise ExpressionError(f"숫자가 너무 큽니다: {str(node.value)[:20]}...") from e
+            return lambda env, size: value
+        if isinstance(node, ast.Name):
+            if node.id not in VARIABLES:
+                raise ExpressionError(f"알 수 없는 변수입니다: {node.id}")
+            used.add(node.id)
+            name = node.id
+            return lambda env, size: env[name]
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd, ast.Not)):
+            operand = build(node.operand)
+            if isinstance(node.op, ast.Not):
+                func: Callable[..., float] = _negate
+            elif isinstance(node.op, ast.USub):
+                func = operator.neg
+            else:
+                func = operator.pos
+            return lambda env, size: _elementwise(func, [operand(env, size)], size)
+        if isinstance(node, ast.BinOp) and type(node.op) in _ARITHMETIC:
+            left, right, arithmetic = build(node.left), build(node.right), _ARITHMETIC[type(node.op)]
+            return lambda env, size: _elementwise(arithmetic, [left(env, size), right(env, size)], size)
+        if isinstance(node, ast.Compare) and all(type(op) in _COMPARISONS for op in node.ops):
+            parts = [build(node.left)] + [build(comparator) for comparator in node.comparators]
+            compare = partial(_compare, [_COMPARISONS[type(op)] for op in node.ops])
+            return lambda env, size: _elementwise(compare, [part(env, size) for part in parts], size)
+        if isinstance(node, ast.BoolOp):
+            parts = [build(value) for value in node.values]
+            combine = partial(_combine, isinstance(node.op, ast.And))
+            return lambda env, size: _elementwise(combine, [part(env, size) for part in parts], size)
+        raise ExpressionError(f"지원하지 않는 구문입니다: {ast.dump(node)[:60]}")
+
+    return build(tree), used
+
+
+def evaluate_filter(evaluator: Evaluator, env: Dict[str, Vector], size: int) -> List[int]:
+    """필터 식이 참인 위치 목록"""
+    result = evaluator(env, size)
+    if isinstance(result, float):
+        return list(range(size)) if _truth(result) else []
+    return [i for i, value in enumerate(result) if _truth(value)]
+
+
+def rank(values: Operand, positions: Iterable[int], descending: bool = True) -> List[int]:
+    """정렬 기준 값으로 위치를 정렬합니다. (값이 없는 위치는 맨 뒤)"""
+    positions = list(positions)
+    if isinstance(values, float):
+        return positions
+    present = [i for i in positions if not math.isnan(values[i])]
+    absent = [i for i in positions if math.isnan(values[i])]
+    return sorted(present, key=values.__getitem__, reverse=descending) + absent
@@ -0,0 +1,331 @@
+import math
+import os
+import sys
+import threading
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..config import opendart_config, OpenDartConfig
+from .amounts import MISSING, parse_amount
+from .concurrency import bounded_map
+from .ratio_engine import CONCEPTS, ConceptMatrix, Vector, normalize_account_id
+from .statement_store import StatementFetcher, StatementKey, StatementStore, get_statement_store
+
+# 큐브에 담는 금액 열
+MEASURES = ("thstrm_amount", "thstrm_add_amount", "frmtrm_amount", "frmtrm_add_amount")
+# 자본변동표는 구성요소별로 같은 계정이 반복되어 계정 하나의 값으로 볼 수 없으므로 제외합니다
+SKIPPED_STATEMENTS = ("SCE",)
+# 계정 검색 순서 (sj_div를 지정하지 않은 경우)
+STATEMENT_ORDER = ("BS", "IS", "CIS", "CF")
+
+AccountKey = Tuple[str, str]
+
+# 비율 계산에 쓰는 표준 계정은 슬롯 순서의 배열로, 나머지 계정은 재무제표별 dict로 저장합니다
+DENSE_ACCOUNTS = frozenset(
+    (sj_div, account_id) for concept in CONCEPTS for sj_div in concept.sj_divs for account_id in concept.account_ids
+)
+
+
+class AccountTable:
+    """(재무제표 구분, 표준계정코드) → 정수 번호 (문자열은 intern하여 한 번만 보관)"""
+
+    def __init__(self) -> None:
+        self.index: Dict[AccountKey, int] = {}
+        self.keys: List[AccountKey] = []
+        self.names: List[str] = []
+        self.dense: List[bool] = []
+
+    def intern(self, sj_div: str, account_id: str, account_nm: str) -> int:
+        key = (sys.intern(sj_div), sys.intern(normalize_account_id(account_id)))
+        number = self.index.get(key)
+        if number is None:
+            number = self.index[key] = len(self.keys)
+            self.keys.append(key)
+            self.names.append(account_nm)
+            self.dense.append(key in DENSE_ACCOUNTS)
+        return number
+
+    def find(self, account_id: str, sj_div: Optional[str] = None) -> Optional[int]:
+        """계정 번호 (sj_div가 없으면 STATEMENT_ORDER 순으로 찾음)"""
+        account_id = normalize_account_id(account_id)
+        for statement in (sj_div,) if sj_div else STATEMENT_ORDER:
+            number = self.index.get((statement, account_id))
+            if number is not None:
+                return number
+        return None
+
+
+class StatementCube:
+    """
+    저장된 전체 재무제표의 열 단위 메모리 큐브 (재무제표 × 계정)
+
+    재무제표 한 건(고유번호, 사업연도, 보고서 코드, 개별/연결구분)은 슬롯 번호를, 계정은 AccountTable 번호를 받습니다.
+    비율 계산에 쓰는 표준 계정(DENSE_ACCOUNTS)의 금액은 (금액 열, 계정)마다 슬롯 순서의 array('d') 하나에 저장되어
+    여러 회사의 같은 계정을 슬롯 번호 목록으로 한 번에 읽습니다. 나머지 계정은 회사마다 달라 배열로 두면
+    대부분 NaN이므로 (금액 열, 슬롯)마다 계정 → 금액 dict에 있는 값만 저장합니다.
+    표준계정코드가 없는 회사별 계정("-표준계정코드 미사용-")은 회사 간 비교가 불가능하므로 담지 않습니다.
+    """
+
+    def __init__(self) -> None:
+        self.accounts = AccountTable()
+        self.slot_index: Dict[StatementKey, int] = {}
+        self.slots: List[StatementKey] = []
+        self.status: List[str] = []
+        self.rcept_no: List[str] = []
+        self.fetched_at: List[Optional[str]] = []
+        self._mtimes: List[float] = []
+        self._counts: List[int] = []
+        self._dir_mtimes: Dict[str, float] = {}
+        self.columns: Dict[str, Dict[int, Vector]] = {measure: {} for measure in MEASURES}
+        self.sparse: Dict[str, List[Dict[int, float]]] = {measure: [] for measure in MEASURES}
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # 적재
+    # ------------------------------------------------------------------
+    def _slot(self, key: StatementKey) -> int:
+        slot = self.slot_index.get(key)
+        if slot is None:
+            slot = self.slot_index[key] = len(self.slots)
+            self.slots.append(key)
+            self.status.append("")
+            self.rcept_no.append("")
+            self.fetched_at.append(None)
+            self._mtimes.append(0.0)
+            self._counts.append(0)
+            for values in self.sparse.values():
+                values.append({})
+        return slot
+
+    def _clear(self, slot: int) -> None:
+        for columns in self.columns.values():
+            for column in columns.values():
+                if slot < len(column):
+                    column[slot] = MISSING
+        for values in self.sparse.values():
+            values[slot] = {}
+
+    def _set(self, measure: str, account: int, slot: int, value: float) -> None:
+        if not self.accounts.dense[account]:
+            self.sparse[measure][slot][account] = value
+            return
+        column = self.columns[measure].get(account)
+        if column is None:
+            column = self.columns[measure][account] = array("d")
+        if len(column) <= slot:
+            column.extend(array("d", [MISSING]) * (len(self.slots) - len(column)))
+        column[slot] = value
+
+    def add_entry(self, key: StatementKey, entry: Dict[str, Any], mtime: float = 0.0) -> int:
+        """StatementStore 항목 하나를 큐브에 넣습니다. (같은 키가 있으면 교체)"""
+        with self._lock:
+            slot = self._slot(key)
+            if self._counts[slot]:
+                self._clear(slot)
+            self.status[slot] = entry.get("status") or ""
+            self.rcept_no[slot] = entry.get("rcept_no") or ""
+            self.fetched_at[slot] = entry.get("fetched_at")
+            self._mtimes[slot] = mtime
+
+            data = entry.get("data", {})
+            count = entry.get("count", 0) if self.status[slot] == "000" else 0
+            sj_divs = data.get("sj_div", [""] * count)
+            account_ids = data.get("account_id", [""] * count)
+            account_nms = data.get("account_nm", [""] * count)
+            measures = [(measure, data[measure]) for measure in MEASURES if measure in data]
+            seen = set()
+            for i in range(count):
+                account_id = account_ids[i]
+                if not account_id or account_id.startswith("-") or sj_divs[i] in SKIPPED_STATEMENTS:
+                    continue
+                account = self.accounts.intern(sj_divs[i], account_id, account_nms[i])
+                # 같은 재무제표 안에서 반복되는 계정은 처음 나온 행을 씁니다
+                if account in seen:
+                    continue
+                seen.add(account)
+                for measure, values in measures:
+                    value = parse_amount(values[i]) if values[i] not in ("", "-") else MISSING
+                    if not math.isnan(value):
+                        self._set(measure, account, slot, value)
+            self._counts[slot] = len(seen)
+            return slot
+
+    def sync(
+        self,
+        store: StatementStore,
+        keys: Optional[Iterable[StatementKey]] = None,
+        fetch: Optional[StatementFetcher] = None,
+        max_workers: int = 1
+    ) -> Dict[str, Any]:
+        """
+        저장소와 큐브를 맞춥니다. 파일 수정 시각이 바뀐 재무제표만 다시 읽습니다.
+
+        fetch가 주어지면 저장되지 않았거나 만료된 재무제표를 동시에 조회해 저장한 뒤 넣습니다.
+        keys가 없으면 저장소의 모든 재무제표가 대상이며, 수정 시각이 바뀐 회사 디렉터리만 다시 살펴봅니다.
+
+        Returns:
+            Dict[str, Any]: fetched_count(DART 조회 수), failed(적재하지 못한 키 → 실패 응답 또는 저장되지 않음 표시)
+        """
+        pending: List[StatementKey] = []
+        with self._lock:
+            keys = list(self._changed_keys(store) if keys is None else keys)
+            for key in keys:
+                try:
+                    mtime = os.stat(store.path(key)).st_mtime
+                except OSError:
+                    pending.append(key)
+                    continue
+                slot = self.slot_index.get(key)
+                if slot is not None and self._mtimes[slot] == mtime:
+                    cached = {"status": self.status[slot], "fetched_ts": mtime, "rcept_no": self.rcept_no[slot]}
+                    if fetch is None or store.is_fresh(cached):
+                        continue
+                entry = store.read(key)
+                if entry is None or (fetch is not None and not store.is_fresh(entry)):
+                    pending.append(key)
+                    continue
+                self.add_entry(key, entry, mtime)
+
+        if fetch is None:
+            return {"fetched_count": 0, "failed": {
+                key: {"status": "013", "message": "저장된 재무제표가 없습니다.", "stored": False} for key in pending
+            }}
+
+        def load(key: StatementKey) -> Dict[str, Any]:
+            response = fetch(key)
+            if response.get("status") not in ("000", "013"):
+                return response
+            entry = store.write(key, response)
+            self.add_entry(key, entry, os.stat(store.path(key)).st_mtime)
+            return entry
+
+        results = bounded_map(load, pending, max_workers)
+        failed = {key: result for key, result in zip(pending, results) if result.get("version") is None}
+        return {"fetched_count": len(pending), "failed": failed}
+
+    def _changed_keys(self, store: StatementStore) -> List[StatementKey]:
+        """파일이 추가·교체된(디렉터리 수정 시각이 바뀐) 회사의 재무제표 키"""
+        keys: List[StatementKey] = []
+        try:
+            directories = list(os.scandir(store.root))
+        except OSError:
+            return keys
+        for directory in directories:
+            if not directory.is_dir():
+                continue
+            mtime = directory.stat().st_mtime
+            if self._dir_mtimes.get(directory.name) == mtime:
+                continue
+            self._dir_mtimes[directory.name] = mtime
+            keys.extend(store.keys(directory.name))
+        return keys
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def slot_of(self, key: StatementKey) -> int:
+        """재무제표의 슬롯 번호 (없으면 -1)"""
+        return self.slot_index.get(key, -1)
+
+    def find_slots(
+        self,
+        bsns_year: Optional[str] = None,
+        reprt_code: Optional[str] = None,
+        fs_div: Optional[str] = None,
+        corp_codes: Optional[Iterable[str]] = None
+    ) -> List[int]:
+        """조건에 맞고 데이터가 있는(000) 재무제표의 슬롯 번호 목록 (고유번호·기간 순)"""
+        corps = set(corp_codes) if corp_codes is not None else None
+        with self._lock:
+            slots = [
+                slot for slot, (corp, year, code, div) in enumerate(self.slots)
+                if self.status[slot] == "000"
+                and (bsns_year is None or year == bsns_year)
+                and (reprt_code is None or code == reprt_code)
+                and (fs_div is None or div == fs_div)
+                and (corps is None or corp in corps)
+            ]
+            return sorted(slots, key=self.slots.__getitem__)
+
+    def gather(self, measure: str, account: Optional[int], slots: List[int]) -> Vector:
+        """계정 하나의 금액을 슬롯 목록 순서대로 모읍니다. (슬롯 -1이나 값이 없으면 NaN)"""
+        if account is not None and not self.accounts.dense[account]:
+            values = self.sparse[measure]
+            return array("d", (values[slot].get(account, MISSING) if slot >= 0 else MISSING for slot in slots))
+        column = self.columns[measure].get(account) if account is not None else None
+        if column is None:
+            return array("d", [MISSING]) * len(slots)
+        size = len(column)
+        return array("d", (column[slot] if 0 <= slot < size else MISSING for slot in slots))
+
+    def value(
+        self,
+        key: StatementKey,
+        account_id: str,
+        sj_div: Optional[str] = None,
+        measure: str = "thstrm_amount"
+    ) -> float:
+        """재무제표 한 건의 계정 금액 (없으면 NaN)"""
+        return self.gather(measure, self.accounts.find(account_id, sj_div), [self.slot_of(key)])[0]
+
+    def cross_section(
+        self,
+        account_id: str,
+        slots: List[int],
+        sj_div: Optional[str] = None,
+        measure: str = "thstrm_amount"
+    ) -> Vector:
+        """여러 재무제표의 같은 계정 금액 (예: 2023년 사업보고서 300개사의 매출액)"""
+        return self.gather(measure, self.accounts.find(account_id, sj_div), slots)
+
+    def _concept_vector(self, concept: Any, slots: List[int], current: bool) -> Vector:
+        # 손익·현금흐름은 누적 금액을 우선하고, 후보 계정은 앞선 것부터 채웁니다
+        measures: Tuple[str, ...]
+        if concept.flow:
+            measures = ("thstrm_add_amount", "thstrm_amount") if current else ("frmtrm_add_amount", "frmtrm_amount")
+        else:
+            measures = ("thstrm_amount",) if current else ("frmtrm_amount",)
+        result = array("d", [MISSING]) * len(slots)
+        for sj_div in concept.sj_divs:
+            for account_id in concept.account_ids:
+                account = self.accounts.index.get((sj_div, account_id))
+                if account is None:
+                    continue
+                for measure in measures:
+                    if account not in self.columns[measure]:
+                        continue
+                    values = self.gather(measure, account, slots)
+                    result = array("d", (r if not math.isnan(r) else v for r, v in zip(result, values)))
+        return result
+
+    def concept_matrix(self, slots: List[int]) -> ConceptMatrix:
+        """비율 엔진용 표준 계정 배열 (ratio_engine.CONCEPTS, 슬롯 목록 순서)"""
+        with self._lock:
+            return {
+                concept.name: (self._concept_vector(concept, slots, True), self._concept_vector(concept, slots, False))
+                for concept in CONCEPTS
+            }
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "statements": len(self.slots),
+                "accounts": len(self.accounts.keys),
+                "columns": sum(len(columns) for columns in self.columns.values()),
+                "sparse_values": sum(len(values) for slots in self.sparse.values() for values in slots),
+            }
+
+
+_cubes: Dict[str, StatementCube] = {}
+_cubes_lock = threading.Lock()
+
+
+def get_statement_cube(config: Optional[OpenDartConfig] = None) -> StatementCube:
+    """설정의 data_dir 기준 공유 StatementCube 인스턴스를 반환합니다. (저장소와의 동기화는 sync로)"""
+    config = config or opendart_config
+    root = str(get_statement_store(config).root)
+    with _cubes_lock:
+        cube = _cubes.get(root)
+        if cube is None:
+            cube = _cubes[root] = StatementCube()
+        return cube
@@ -0,0 +1,171 @@
+import datetime
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .archive_store import atomic_write
+from .concurrency import bounded_map
+from .rate_limiter import RateLimiter
+from .statement_store import StatementFetcher, StatementKey, StatementStore
+
+logger = logging.getLogger("mcp-opendart")
+
+# 계속 호출해도 소용없는 응답 (키 오류, 접근 불가 IP, 일일 한도 초과, 시스템 점검 등) → 작업 중단
+STOP_STATUSES = ("010", "011", "012", "020", "800", "901")
+
+# 실패 목록은 체크포인트에 최근 것만 보관합니다
+MAX_FAILED_RECORDS = 100
+
+
+def plan_statements(
+    store: StatementStore,
+    corp_codes: Iterable[str],
+    years: Iterable[str],
+    reprt_codes: Iterable[str],
+    fs_divs: Iterable[str]
+) -> List[StatementKey]:
+    """
+    수집할 (고유번호, 사업연도, 보고서 코드, 개별/연결구분) 목록. 이미 저장된 재무제표는 뺍니다.
+
+    데이터 없음(013)으로 저장된 항목도 건너뛰며, 미제출 보고서는 이후 개별 조회에서 만료 시 다시 확인됩니다.
+    최근 연도부터 회사 순으로 정렬되어 중단 후 다시 실행해도 같은 순서로 이어집니다.
+    """
+    years = sorted(set(years), reverse=True)
+    return [
+        (corp_code, year, reprt_code, fs_div)
+        for year in years
+        for reprt_code in reprt_codes
+        for corp_code in corp_codes
+        for fs_div in fs_divs
+        if not store.path((corp_code, year, reprt_code, fs_div)).exists()
+    ]
+
+
+def background_limiter(limiter: RateLimiter, reserve: float) -> RateLimiter:
+    """
+    수집 작업 전용 제한기: 공유 한도 속도의 (1 - reserve)만큼만, 버스트 없이 한 건씩 허용합니다.
+
+    모든 작업자가 이 제한기를 함께 거치므로 max_workers와 관계없이 나머지 reserve 비율은 대화형 호출 몫으로 남습니다.
+    """
+    return RateLimiter(1, 1 / (limiter.rate * max(1.0 - reserve, 0.05)))
+
+
+class IngestProgress:
+    """처리량(건/초)과 남은 시간 추정"""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.done = 0
+        self.stored = 0
+        self.empty = 0
+        self.failed = 0
+        self.started = time.monotonic()
+
+    def record(self, status: Optional[str]) -> None:
+        self.done += 1
+        if status == "000":
+            self.stored += 1
+        elif status == "013":
+            self.empty += 1
+        else:
+            self.failed += 1
+
+    def rate(self) -> float:
+        elapsed = time.monotonic() - self.started
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def eta_seconds(self) -> Optional[float]:
+        rate = self.rate()
+        return (self.total - self.done) / rate if rate > 0 else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        eta = self.eta_seconds()
+        return {
+            "total": self.total,
+            "done": self.done,
+            "stored": self.stored,
+            "empty": self.empty,
+            "failed": self.failed,
+            "rate_per_second": round(self.rate(), 3),
+            "eta_seconds": round(eta) if eta is not None else None,
+        }
+
+
+def read_checkpoint(store: StatementStore) -> Dict[str, Any]:
+    try:
+        with open(store.root / "checkpoint.json", "r", encoding="utf-8") as f:
+            checkpoint: Dict[str, Any] = json.load(f)
+            return checkpoint
+    except (OSError, ValueError):
+        return {}
+
+
+def write_checkpoint(store: StatementStore, checkpoint: Dict[str, Any]) -> None:
+    store.root.mkdir(parents=True, exist_ok=True)
+    atomic_write(store.root / "checkpoint.json", json.dumps(checkpoint, ensure_ascii=False).encode("utf-8"))
+
+
+def ingest_statements(
+    store: StatementStore,
+    keys: List[StatementKey],
+    fetch: StatementFetcher,
+    limiter: RateLimiter,
+    max_workers: int = 1,
+    reserve: float = 0.5,
+    params: Optional[Dict[str, Any]] = None,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """
+    계획된 재무제표를 묶음 단위로 수집하여 저장소에 저장합니다.
+
+    호출은 background_limiter로 공유 한도 속도의 (1 - reserve) 이하로 늦추고, 실제 호출은 공유 한도(limiter)도 거칩니다.
+    같은 data_dir을 쓰는 MCP 서버와는 파일 기반 버킷(SharedRateLimiter)으로 한도를 나눠 쓰므로 대화형 호출 몫이 유지됩니다.
+    재무제표는 받는 즉시 저장되고 묶음마다 체크포인트를 기록하므로, 중단 후 다시 실행하면
+    plan_statements가 저장된 것을 빼고 남은 것부터 이어갑니다.
+    일일 한도 초과 등 STOP_STATUSES 응답을 받으면 그 묶음까지 기록하고 멈춥니다.
+    """
+    progress = IngestProgress(len(keys))
+    failed: List[Dict[str, Any]] = []
+    stop: Optional[Dict[str, Any]] = None
+    checkpoint = {
+        "params": params or {},
+        "started_at": datetime.datetime.now().isoformat(timespec="seconds"),
+    }
+
+    throttle = background_limiter(limiter, reserve)
+
+    def load(key: StatementKey) -> Dict[str, Any]:
+        throttle.acquire()
+        return store.get(key, fetch)
+
+    batch_size = max(1, max_workers) * 4
+    for start in range(0, len(keys), batch_size):
+        batch = keys[start:start + batch_size]
+        for key, response in zip(batch, bounded_map(load, batch, max_workers)):
+            status = response.get("status")
+            progress.record(status)
+            if status in ("000", "013"):
+                continue
+            failed.append({"key": list(key), "status": status, "message": response.get("message") or response.get("error")})
+            if status in STOP_STATUSES and stop is None:
+                stop = response
+
+        write_checkpoint(store, {
+            **checkpoint,
+            "updated_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "progress": progress.to_dict(),
+            "failed": failed[-MAX_FAILED_RECORDS:],
+            "last_key": list(batch[-1]),
+        })
+        if on_progress:
+            on_progress(progress.to_dict())
+        if stop is not None:
+            logger.error(f"재무제표 수집 중단: {stop.get('message') or stop.get('error')}")
+            return {"status": stop.get("status") or "500", "message": stop.get("message") or stop.get("error"),
+                    **progress.to_dict(), "failed_keys": failed[-MAX_FAILED_RECORDS:]}
+
+    result: Dict[str, Any] = {"status": "000", "message": "정상", **progress.to_dict()}
+    if failed:
+        result["failed_keys"] = failed[-MAX_FAILED_RECORDS:]
+    return result
@@ -0,0 +1,167 @@
+import datetime
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..config import opendart_config, OpenDartConfig
+from .archive_store import atomic_write
+from .concurrency import bounded_map
+
+# 저장 형식이 바뀌면 올려서 기존 파일을 다시 받도록 합니다
+STORE_VERSION = 1
+
+# "조회된 데이터가 없습니다"(013) 응답은 보고서가 나중에 제출될 수 있으므로 이 시간이 지나면 다시 조회합니다
+NEGATIVE_TTL_SECONDS = 24 * 3600
+# 정상(000) 응답도 정정 공시로 바뀔 수 있으므로 이 시간이 지나면 다시 조회합니다
+STATEMENT_TTL_SECONDS = 30 * 24 * 3600
+
+# (고유번호, 사업연도, 보고서 코드, 개별/연결구분)
+StatementKey = Tuple[str, str, str, str]
+
+# 키 → fnlttSinglAcntAll 응답
+StatementFetcher = Callable[[StatementKey], Dict[str, Any]]
+
+# 접수번호 → 이후 정정 공시로 대체되었는지
+SupersededCheck = Callable[[str], bool]
+
+
+def statement_params(key: StatementKey) -> Dict[str, str]:
+    corp_code, bsns_year, reprt_code, fs_div = key
+    return {"corp_code": corp_code, "bsns_year": bsns_year, "reprt_code": reprt_code, "fs_div": fs_div}
+
+
+class StatementStore:
+    """
+    단일회사 전체 재무제표(fnlttSinglAcntAll) 로컬 저장소
+
+    보고서 한 건을 <data_dir>/statements/<고유번호>/<사업연도>_<보고서 코드>_<구분>.json에 열 단위로 저장합니다.
+    정상(000) 응답은 STATEMENT_TTL_SECONDS 동안, 데이터 없음(013)은 NEGATIVE_TTL_SECONDS 동안 재사용합니다.
+    superseded가 주어지면 저장된 접수번호가 정정 공시로 대체된 항목은 기한 전이라도 다시 조회합니다.
+    """
+
+    def __init__(self, root: Path, superseded: Optional[SupersededCheck] = None):
+        self.root = Path(root)
+        self.superseded = superseded
+
+    def path(self, key: StatementKey) -> Path:
+        corp_code, bsns_year, reprt_code, fs_div = key
+        return self.root / corp_code / f"{bsns_year}_{reprt_code}_{fs_div}.json"
+
+    def read(self, key: StatementKey) -> Optional[Dict[str, Any]]:
+        """저장된 항목을 읽습니다. 없거나 형식이 다르면 None"""
+        try:
+            with open(self.path(key), "r", encoding="utf-8") as f:
+                entry: Dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get("version") == STORE_VERSION else None
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        age = time.time() - float(entry.get("fetched_ts", 0))
+        if entry.get("status") != "000":
+            return age < NEGATIVE_TTL_SECONDS
+        if age >= STATEMENT_TTL_SECONDS:
+            return False
+        rcept_no = entry.get("rcept_no")
+        return not (self.superseded is not None and rcept_no and self.superseded(rcept_no))
+
+    def write(self, key: StatementKey, response: Dict[str, Any]) -> Dict[str, Any]:
+        """정상(000)·데이터 없음(013) 응답을 저장하고 저장 항목을 반환합니다."""
+        status = response.get("status")
+        rows = response.get("list", []) if status == "000" else []
+        columns = list(dict.fromkeys(name for row in rows for name in row))
+        now = time.time()
+        entry = {
+            "version": STORE_VERSION,
+            "key": list(key),
+            "status": status,
+            "fetched_ts": now,
+            "fetched_at": datetime.datetime.fromtimestamp(now).isoformat(timespec="seconds"),
+            "rcept_no": rows[0].get("rcept_no", "") if rows else "",
+            "count": len(rows),
+            "columns": columns,
+            "data": {column: [row.get(column, "") for row in rows] for column in columns},
+        }
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        return entry
+
+    @staticmethod
+    def rows(entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+        columns = entry.get("columns", [])
+        data = entry.get("data", {})
+        return [dict(zip(columns, values)) for values in zip(*(data[column] for column in columns))]
+
+    @classmethod
+    def to_response(cls, entry: Dict[str, Any], source: str) -> Dict[str, Any]:
+        """저장 항목을 DART 응답 형식으로 바꿉니다. (source: store 또는 api)"""
+        if entry.get("status") != "000":
+            return {"status": "013", "message": "조회된 데이터가 없습니다.",
+                    "fetched_at": entry.get("fetched_at"), "source": source}
+        return {"status": "000", "message": "정상", "fetched_at": entry.get("fetched_at"),
+                "source": source, "list": cls.rows(entry)}
+
+    def get(self, key: StatementKey, fetch: Optional[StatementFetcher] = None) -> Dict[str, Any]:
+        """
+        저장된 재무제표를 반환하고, 없거나 만료된 경우 fetch로 조회하여 저장합니다.
+
+        fetch가 없으면 저장된 항목만 보며, 없을 때는 status "013"과 함께 stored=False를 돌려줍니다.
+        """
+        entry = self.read(key)
+        if entry is not None and self.is_fresh(entry):
+            return self.to_response(entry, "store")
+        if fetch is None:
+            return {"status": "013", "message": "저장된 재무제표가 없습니다.", "stored": False}
+        response = fetch(key)
+        if response.get("status") not in ("000", "013"):
+            return response
+        return self.to_response(self.write(key, response), "api")
+
+    def get_many(
+        self,
+        keys: List[StatementKey],
+        fetch: Optional[StatementFetcher] = None,
+        max_workers: int = 1
+    ) -> Dict[StatementKey, Dict[str, Any]]:
+        """여러 재무제표를 한 번에 읽습니다. 저장되지 않은 항목만 동시에 조회합니다."""
+        results = bounded_map(lambda key: self.get(key, fetch), keys, max_workers)
+        return dict(zip(keys, results))
+
+    def keys(self, corp_code: Optional[str] = None) -> Iterator[StatementKey]:
+        """저장된 재무제표 키 (corp_code를 주면 해당 회사만)"""
+        directories = [self.root / corp_code] if corp_code else sorted(self.root.glob("*"))
+        for directory in directories:
+            for path in sorted(directory.glob("*.json")):
+                parts = path.stem.split("_")
+                if len(parts) == 3:
+                    yield (directory.name, parts[0], parts[1], parts[2])
+
+
+_stores: Dict[str, StatementStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_statement_store(config: Optional[OpenDartConfig] = None) -> StatementStore:
+    """설정의 data_dir 기준 공유 StatementStore 인스턴스를 반환합니다."""
+    config = config or opendart_config
+    root = str(Path(config.data_dir) / "statements")
+    with _stores_lock:
+        store = _stores.get(root)
+        if store is None:
+            store = _stores[root] = StatementStore(Path(root), lambda rcept_no: _superseded(config, rcept_no))
+        return store
+
+
+def _superseded(config: OpenDartConfig, rcept_no: str) -> bool:
+    """로컬 공시 색인 기준으로 접수번호 이후 본문 정정 공시가 있는지 (색인에 없으면 False)"""
+    from .amendment_index import has_later_amendment
+    from .title_index import get_title_index
+
+    index = get_title_index(config)
+    row = index.lookup(rcept_no)
+    if row is None or not has_later_amendment(row):
+        return False
+    return bool(index.amendment_chain(rcept_no)["effective"] != rcept_no)
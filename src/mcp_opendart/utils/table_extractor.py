@@ -0,0 +1,179 @@
+import html
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+_TABLE = re.compile(rb"<TABLE\b[^>]*>(.*?)</TABLE>", re.S | re.I)
+_ROW = re.compile(r"<TR\b[^>]*>(.*?)</TR>", re.S | re.I)
+_CELL = re.compile(r"<(TD|TH|TE|TU)\b([^>]*)>(.*?)</\1>", re.S | re.I)
+_SPAN_ATTR = re.compile(r"(COLSPAN|ROWSPAN)\s*=\s*[\"']?(\d+)", re.I)
+_TAG = re.compile(r"<[^>]+>")
+_SPACES = re.compile(r"\s+")
+_UNIT = re.compile(r"단위\s*[:：]\s*([^\)\]\n|]+)")
+_NUMBER = re.compile(r"^[+\-]?\d+(\.\d+)?$")
+
+# 공시 본문에서 쓰이는 단위와 배수
+UNIT_MULTIPLIERS: Dict[str, int] = {
+    "원": 1,
+    "천원": 1_000,
+    "백만원": 1_000_000,
+    "억원": 100_000_000,
+    "십억원": 1_000_000_000,
+    "조원": 1_000_000_000_000,
+    "주": 1,
+    "천주": 1_000,
+    "백만주": 1_000_000,
+}
+
+# 본문 앞부분에서 단위를 찾을 범위(바이트)
+_UNIT_LOOKBEHIND = 400
+
+HEADER_TAGS = {"TH", "TU"}
+
+
+def _cell_text(fragment: str) -> str:
+    return _SPACES.sub(" ", html.unescape(_TAG.sub(" ", fragment))).strip()
+
+
+def parse_number(text: str) -> Optional[Union[int, float]]:
+    """
+    공시 표의 숫자 셀을 해석합니다.
+
+    '1,234' → 1234, '(1,234)'·'△1,234' → -1234, '9.5%' → 9.5, '-'·빈 값 → None
+    숫자가 아니면 None을 반환합니다.
+    """
+    value = text.strip().replace(",", "").replace(" ", "")
+    if value in ("", "-", "–", "—"):
+        return None
+    negative = False
+    if value.startswith("(") and value.endswith(")"):
+        negative, value = True, value[1:-1]
+    if value[:1] in ("△", "▽", "▲"):
+        negative, value = value[0] != "▲", value[1:]
+    value = value.rstrip("%")
+    if not _NUMBER.match(value):
+        return None
+    number: Union[int, float] = float(value) if "." in value else int(value)
+    return -number if negative else number
+
+
+def detect_unit(text: str) -> Tuple[Optional[str], Optional[int]]:
+    """'(단위 : 백만원)' 형태의 표기에서 단위와 배수를 추출합니다."""
+    matches = _UNIT.findall(text)
+    if not matches:
+        return None, None
+    unit = matches[-1].split(",")[0].strip()
+    return unit, UNIT_MULTIPLIERS.get(unit.replace(" ", ""))
+
+
+def _grid(table_html: str) -> Tuple[List[List[str]], int]:
+    """COLSPAN/ROWSPAN을 펼친 셀 격자와 머리글 행 수를 반환합니다."""
+    grid: List[List[str]] = []
+    pending: Dict[Tuple[int, int], str] = {}  # rowspan으로 내려오는 셀
+    header_rows = 0
+    header_done = False
+
+    for r, row_match in enumerate(_ROW.finditer(table_html)):
+        row: List[str] = []
+        col = 0
+        all_header = True
+        for tag, attrs, body in _CELL.findall(row_match.group(1)):
+            while (r, col) in pending:
+                row.append(pending.pop((r, col)))
+                col += 1
+            spans = {k.upper(): int(v) for k, v in _SPAN_ATTR.findall(attrs)}
+            text = _cell_text(body)
+            for c in range(spans.get("COLSPAN", 1)):
+                row.append(text)
+                for dr in range(1, spans.get("ROWSPAN", 1)):
+                    pending[(r + dr, col + c)] = text
+            col += spans.get("COLSPAN", 1)
+            all_header = all_header and tag.upper() in HEADER_TAGS
+        while (r, col) in pending:
+            row.append(pending.pop((r, col)))
+            col += 1
+        if not row:
+            continue
+        if not header_done and all_header:
+            header_rows += 1
+        else:
+            header_done = True
+        grid.append(row)
+
+    return grid, header_rows
+
+
+def _column_names(header: List[List[str]], width: int) -> List[str]:
+    names: List[str] = []
+    for c in range(width):
+        parts: List[str] = []
+        for row in header:
+            text = row[c] if c < len(row) else ""
+            if text and (not parts or parts[-1] != text):
+                parts.append(text)
+        name = " / ".join(parts) or f"col{c}"
+        base, n = name, 2
+        while name in names:
+            name, n = f"{base} ({n})", n + 1
+        names.append(name)
+    return names
+
+
+def to_columnar(table_html: str, context: str = "") -> Dict[str, Any]:
+    """
+    표 하나를 열 단위 레코드로 변환합니다.
+
+    숫자 열(빈 값이 아닌 셀의 절반 이상이 숫자)은 int/float/None 배열로 한 번만 변환해 둡니다.
+    """
+    grid, header_rows = _grid(table_html)
+    if header_rows == 0 and len(grid) > 1:
+        header_rows = 1
+    header, body = grid[:header_rows], grid[header_rows:]
+    width = max((len(row) for row in grid), default=0)
+    names = _column_names(header, width)
+
+    unit, multiplier = detect_unit(context + " " + " ".join(" ".join(row) for row in header))
+    columns: List[Dict[str, Any]] = []
+    data: Dict[str, List[Any]] = {}
+    for c, name in enumerate(names):
+        raw = [row[c] if c < len(row) else "" for row in body]
+        parsed = [parse_number(v) for v in raw]
+        filled = [v for v in raw if v.strip() not in ("", "-")]
+        numeric = bool(filled) and sum(p is not None for p in parsed) * 2 >= len(filled)
+        if numeric and any("%" in v for v in filled):
+            columns.append({"name": name, "type": "number", "unit": "%"})
+        else:
+            columns.append({"name": name, "type": "number" if numeric else "text"})
+        data[name] = parsed if numeric else raw
+
+    return {
+        "unit": unit,
+        "multiplier": multiplier,
+        "rows": len(body),
+        "columns": columns,
+        "data": data,
+    }
+
+
+def iter_tables(fragment: bytes, encoding: str) -> Iterator[Tuple[int, str, str]]:
+    """
+    섹션 원문에서 표를 순서대로 꺼냅니다. (번호, 표 원문, 직전 본문)
+
+    필요한 표까지만 읽고 멈출 수 있도록 제너레이터로 동작합니다.
+    """
+    prev_end = 0
+    for n, match in enumerate(_TABLE.finditer(fragment)):
+        before = fragment[max(prev_end, match.start() - _UNIT_LOOKBEHIND):match.start()]
+        context = _cell_text(before.decode(encoding, errors="ignore"))
+        yield n, match.group(1).decode(encoding, errors="replace"), context
+        prev_end = match.end()
+
+
+def table_summary(table_no: int, table_html: str, context: str) -> Dict[str, Any]:
+    """표 목록용 요약 (번호, 단위, 크기, 열 이름)"""
+    table = to_columnar(table_html, context)
+    return {
+        "table_no": table_no,
+        "unit": table["unit"],
+        "rows": table["rows"],
+        "columns": [col["name"] for col in table["columns"]],
+    }
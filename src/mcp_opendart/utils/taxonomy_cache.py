@@ -0,0 +1,234 @@
+import datetime
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..config import opendart_config, OpenDartConfig
+from .archive_store import atomic_write
+from .ratio_engine import normalize_account_id
+
+# 저장 형식이 바뀌면 올려서 기존 파일을 다시 받도록 합니다
+CACHE_VERSION = 1
+
+# 택사노미 양식은 적용 기준일이 바뀔 때만 달라지므로 오래 재사용합니다
+TAXONOMY_TTL_SECONDS = 30 * 24 * 3600
+
+COLUMNS = ("sj_div", "account_id", "account_nm", "bsns_de", "label_kor", "label_eng", "data_tp", "ifrs_ref")
+
+# 양식 구분(BS1, CIS2, DCIS3 …) → 재무제표 구분(BS, CIS …)
+_STATEMENT = re.compile(r"^([A-Z]+)")
+_INDENT = re.compile(r"^[\s　]*")
+_SPACES = re.compile(r"[\s　]+")
+
+# sj_div → xbrlTaxonomy 응답
+TaxonomyFetcher = Callable[[str], Dict[str, Any]]
+
+
+def statement_of(sj_div: str) -> str:
+    """양식 구분의 재무제표 구분 (BS1 → BS)"""
+    match = _STATEMENT.match(sj_div or "")
+    return match.group(1) if match else sj_div
+
+
+def normalize_label(label: str) -> str:
+    return _SPACES.sub("", label or "")
+
+
+def build_template(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    택사노미 목록을 양식 순서대로 열 단위로 정리하고 계층(depth, parent)을 계산합니다.
+
+    순서는 ord가 있으면 ord, 없으면 응답 순서입니다. 응답에 상위 계정이 따로 없으므로
+    한글 출력명 앞의 들여쓰기(공백·전각 공백) 폭을 깊이로 보고, 제목 행(data_tp "text block") 아래는 한 단계 깊게 봅니다.
+    상위 계정은 앞선 행 중 더 얕은 가장 가까운 행입니다.
+    """
+    numbered = sorted(enumerate(rows), key=lambda item: (_int(item[1].get("ord"), item[0]), item[0]))
+    ordered = [row for _, row in numbered]
+
+    depths: List[int] = []
+    parents: List[int] = []
+    stack: List[Tuple[int, int]] = []  # (깊이, 위치)
+    heading = False
+    for position, row in enumerate(ordered):
+        match = _INDENT.match(row.get("label_kor") or "")
+        indent = len(match.group(0)) if match else 0
+        depth = indent + (1 if heading and indent == 0 else 0)
+        is_heading = "text block" in (row.get("data_tp") or "").lower()
+        if is_heading:
+            depth, heading = 0, True
+        while stack and stack[-1][0] >= depth:
+            stack.pop()
+        depths.append(depth)
+        parents.append(stack[-1][1] if stack else -1)
+        stack.append((depth, position))
+
+    return {
+        "count": len(ordered),
+        "columns": list(COLUMNS),
+        "data": {column: [(row.get(column) or "").strip() for row in ordered] for column in COLUMNS},
+        "depth": depths,
+        "parent": parents,
+    }
+
+
+def _int(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class TaxonomyIndex:
+    """
+    저장된 택사노미 양식 전체의 계정 색인
+
+    계정(ifrs-full_/ifrs_ 접두어를 뗀 account_id) → 양식별 위치, 한글/영문 출력명 → 계정을 바로 찾습니다.
+    """
+
+    def __init__(self, templates: Dict[str, Dict[str, Any]]):
+        self.templates = templates
+        self.accounts: Dict[str, List[Tuple[str, int]]] = {}
+        self.labels: Dict[str, List[str]] = {}
+        for sj_div, template in sorted(templates.items()):
+            data = template["data"]
+            for position in range(template["count"]):
+                account_id = normalize_account_id(data["account_id"][position])
+                self.accounts.setdefault(account_id, []).append((sj_div, position))
+                for label in (data["label_kor"][position], data["account_nm"][position], data["label_eng"][position]):
+                    key = normalize_label(label).lower()
+                    if key and account_id not in self.labels.get(key, []):
+                        self.labels.setdefault(key, []).append(account_id)
+
+    def describe(self, account_id: str, statement: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """계정의 출력명·순서·깊이·상위 계정 (statement를 주면 해당 재무제표 양식에서)"""
+        for sj_div, position in self.accounts.get(normalize_account_id(account_id), []):
+            if statement and statement_of(sj_div) != statement:
+                continue
+            template = self.templates[sj_div]
+            data = template["data"]
+            parent = template["parent"][position]
+            return {
+                "sj_div": sj_div,
+                "account_id": data["account_id"][position],
+                "label_kor": data["label_kor"][position],
+                "label_eng": data["label_eng"][position],
+                "order": position,
+                "depth": template["depth"][position],
+                "parent_account_id": data["account_id"][parent] if parent >= 0 else None,
+            }
+        return None
+
+    def find_by_label(self, label: str) -> List[str]:
+        """출력명(한글·영문, 공백 무시)이 같은 계정 목록"""
+        return list(self.labels.get(normalize_label(label).lower(), []))
+
+    def order_key(self, statement: str, account_id: str) -> Tuple[int, int]:
+        """재무제표 안의 양식 순서 (양식에 없는 계정은 뒤로)"""
+        for sj_div, position in self.accounts.get(normalize_account_id(account_id), []):
+            if statement_of(sj_div) == statement:
+                return 0, position
+        return 1, 0
+
+
+class TaxonomyCache:
+    """
+    XBRL 택사노미 재무제표 양식(xbrlTaxonomy) 로컬 저장소
+
+    양식 구분(sj_div)별로 <data_dir>/taxonomy/<sj_div>.json에 열 단위 목록과 계층 정보를 저장하고,
+    TAXONOMY_TTL_SECONDS가 지나면 다시 조회합니다. 적용 기준일(bsns_de)이 저장 항목의 버전입니다.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._index: Optional[TaxonomyIndex] = None
+        self._signature: Optional[List[Tuple[str, float]]] = None
+        self._lock = threading.Lock()
+
+    def path(self, sj_div: str) -> Path:
+        return self.root / f"{sj_div}.json"
+
+    def read(self, sj_div: str) -> Optional[Dict[str, Any]]:
+        """저장된 양식을 읽습니다. 없거나 형식이 다르면 None"""
+        try:
+            with open(self.path(sj_div), "r", encoding="utf-8") as f:
+                entry: Dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get("version") == CACHE_VERSION else None
+
+    def write(self, sj_div: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        now = time.time()
+        template = build_template(rows)
+        entry = {
+            "version": CACHE_VERSION,
+            "sj_div": sj_div,
+            "bsns_de": max(template["data"]["bsns_de"], default=""),
+            "fetched_ts": now,
+            "fetched_at": datetime.datetime.fromtimestamp(now).isoformat(timespec="seconds"),
+            **template,
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        atomic_write(self.path(sj_div), json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        return entry
+
+    def get(self, sj_div: str, fetch: TaxonomyFetcher) -> Dict[str, Any]:
+        """
+        저장된 양식을 반환하고, 없거나 만료된 경우 fetch로 조회하여 저장합니다.
+
+        다시 조회하지 못하면 만료된 양식이라도 그대로 돌려줍니다. 정상 응답이 아니면 그 응답을 반환합니다.
+        """
+        entry = self.read(sj_div)
+        if entry is not None and time.time() - entry.get("fetched_ts", 0) < TAXONOMY_TTL_SECONDS:
+            return {**entry, "source": "cache"}
+        response = fetch(sj_div)
+        if response.get("status") != "000":
+            return {**entry, "source": "cache", "stale": True} if entry is not None else response
+        return {**self.write(sj_div, response.get("list", [])), "source": "api"}
+
+    @staticmethod
+    def to_rows(entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """저장 항목을 응답 행 목록으로 바꿉니다. (ord, depth, parent_account_id 추가)"""
+        data = entry["data"]
+        rows = []
+        for position in range(entry["count"]):
+            parent = entry["parent"][position]
+            rows.append({
+                **{column: data[column][position] for column in entry["columns"]},
+                "ord": position,
+                "depth": entry["depth"][position],
+                "parent_account_id": data["account_id"][parent] if parent >= 0 else None,
+            })
+        return rows
+
+    def index(self) -> TaxonomyIndex:
+        """저장된 모든 양식의 색인 (파일이 바뀐 경우에만 다시 만듦, DART 호출 없음)"""
+        paths = sorted(self.root.glob("*.json"))
+        signature = [(str(path), path.stat().st_mtime) for path in paths]
+        with self._lock:
+            if self._index is None or signature != self._signature:
+                templates = {}
+                for path in paths:
+                    entry = self.read(path.stem)
+                    if entry is not None:
+                        templates[entry["sj_div"]] = entry
+                self._index = TaxonomyIndex(templates)
+                self._signature = signature
+            return self._index
+
+
+_caches: Dict[str, TaxonomyCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_taxonomy_cache(config: Optional[OpenDartConfig] = None) -> TaxonomyCache:
+    """설정의 data_dir 기준 공유 TaxonomyCache 인스턴스를 반환합니다."""
+    config = config or opendart_config
+    root = str(Path(config.data_dir) / "taxonomy")
+    with _caches_lock:
+        cache = _caches.get(root)
+        if cache is None:
+            cache = _caches[root] = TaxonomyCache(Path(root))
+        return cache
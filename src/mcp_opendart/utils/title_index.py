@@ -0,0 +1,281 @@
+import bisect
+import json
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..config import opendart_config, OpenDartConfig
+from .amendment_index import effective_version, link_amendments
+
+logger = logging.getLogger("mcp-opendart")
+
+# 색인에 보관하는 열
+INDEX_COLUMNS = ("rcept_no", "rcept_dt", "corp_code", "corp_name", "stock_code", "corp_cls", "pblntf_ty", "report_nm", "flr_nm", "rm")
+
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_title(title: str) -> str:
+    """검색용 정규화 (공백 제거, 소문자)"""
+    return _SPACES.sub("", title).lower()
+
+
+def bigrams(text: str) -> List[str]:
+    """문자 2-gram (한 글자면 그 글자 자체)"""
+    if len(text) < 2:
+        return [text] if text else []
+    return [text[i:i + 2] for i in range(len(text) - 1)]
+
+
+def _read_partition(path: Path) -> Dict[str, Dict[str, Any]]:
+    """출처 파일 하나의 행 (접수번호 → 행). 일별 파티션은 열 단위, 기업별 이력은 행 단위입니다."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            source = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if "data" in source:
+        data = source["data"]
+        rows = ({column: data[column][i] for column in source["columns"]} for i in range(source.get("count", 0)))
+    else:
+        rows = iter(source.get("rows", []))
+    return {row["rcept_no"]: row for row in rows if row.get("rcept_no")}
+
+
+def _order(doc: Dict[str, str]) -> Tuple[str, str]:
+    return doc["rcept_dt"], doc["rcept_no"]
+
+
+class DisclosureTitleIndex:
+    """
+    공시 제목(report_nm) 역색인
+
+    일별 공시 파티션(daily/YYYY/MM/DD.json)과 기업별 공시 이력(history/<corp_code>.json)을 출처로 하며,
+    출처 파일(파티션) 단위로 색인합니다. 조회 때마다 출처 디렉토리의 mtime만 확인하고(파일은 rename으로
+    기록되므로 디렉토리 mtime이 바뀜), 바뀐 디렉토리 안에서도 크기·mtime이 바뀐 파일만 다시 읽어
+    해당 접수번호의 색인만 고칩니다.
+    같은 접수번호가 여러 출처에 있으면 공시유형이 있는 행(일별 파티션)을 우선합니다.
+    """
+
+    def __init__(self, data_dir: Path):
+        self.data_dir = Path(data_dir)
+        self._lock = threading.RLock()
+        self._dir_mtimes: Dict[str, int] = {}
+        self._file_signatures: Dict[str, Tuple[int, int]] = {}
+        # 파티션 경로 → 접수번호 → 행, 접수번호 → 그 행이 있는 파티션
+        self._partitions: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._holders: Dict[str, List[str]] = {}
+        # 접수번호 → 색인된 행(INDEX_COLUMNS), 2-gram → 접수번호, 고유번호 → 접수번호
+        self._docs: Dict[str, Dict[str, str]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._by_corp: Dict[str, Set[str]] = {}
+        # 전체 스캔용 접수일 순 목록·접수일 배열과 회사별 최근 공시 (바뀌면 다시 계산)
+        self._ordered: Optional[Tuple[List[Dict[str, str]], List[str]]] = None
+        self._corporations: Optional[Dict[str, Dict[str, str]]] = None
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def _source_dirs(self) -> List[Path]:
+        daily = sorted(path for path in (self.data_dir / "daily").glob("*/*") if path.is_dir())
+        return daily + [self.data_dir / "history"]
+
+    def refresh(self) -> int:
+        """바뀐 출처 파일만 다시 읽어 색인에 반영하고, 반영한 파일 수를 반환합니다."""
+        with self._lock:
+            changed = 0
+            present = set()
+            for directory in self._source_dirs():
+                key = str(directory)
+                try:
+                    mtime = directory.stat().st_mtime_ns
+                except FileNotFoundError:
+                    continue
+                present.add(key)
+                if self._dir_mtimes.get(key) != mtime:
+                    self._dir_mtimes[key] = mtime
+                    changed += self._refresh_directory(directory)
+            for key in [key for key in self._dir_mtimes if key not in present]:
+                del self._dir_mtimes[key]
+                for path in [path for path in self._partitions if str(Path(path).parent) == key]:
+                    self._replace_partition(path, {})
+                    changed += 1
+            if changed:
+                self._ordered = None
+                self._corporations = None
+                logger.info(f"🔎 공시 제목 색인 갱신: 출처 파일 {changed}개, 전체 {len(self._docs)}건")
+            return changed
+
+    def _refresh_directory(self, directory: Path) -> int:
+        changed = 0
+        current = set()
+        for path in directory.glob("*.json"):
+            key = str(path)
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            current.add(key)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if self._file_signatures.get(key) != signature:
+                self._file_signatures[key] = signature
+                self._replace_partition(key, _read_partition(path))
+                changed += 1
+        for key in [key for key in self._partitions if str(Path(key).parent) == str(directory) and key not in current]:
+            self._file_signatures.pop(key, None)
+            self._replace_partition(key, {})
+            changed += 1
+        return changed
+
+    def _replace_partition(self, path: str, rows: Dict[str, Dict[str, Any]]) -> None:
+        old = self._partitions.pop(path, {})
+        if rows:
+            self._partitions[path] = rows
+        for rcept_no in old:
+            self._holders[rcept_no].remove(path)
+        for rcept_no in rows:
+            self._holders.setdefault(rcept_no, []).append(path)
+        for rcept_no in set(old) | set(rows):
+            self._choose(rcept_no)
+
+    def _choose(self, rcept_no: str) -> None:
+        """접수번호의 색인 행을 출처 중에서 다시 고릅니다."""
+        holders = self._holders.get(rcept_no)
+        if not holders:
+            self._holders.pop(rcept_no, None)
+            self._unindex(rcept_no)
+            return
+        candidates = [self._partitions[path][rcept_no] for path in holders]
+        row = next((candidate for candidate in candidates if candidate.get("pblntf_ty")), candidates[0])
+        doc = {column: row.get(column) or "" for column in INDEX_COLUMNS}
+        if self._docs.get(rcept_no) == doc:
+            return
+        self._unindex(rcept_no)
+        self._docs[rcept_no] = doc
+        for token in set(bigrams(normalize_title(doc["report_nm"]))):
+            self._postings.setdefault(token, set()).add(rcept_no)
+        self._by_corp.setdefault(doc["corp_code"], set()).add(rcept_no)
+
+    def _unindex(self, rcept_no: str) -> None:
+        doc = self._docs.pop(rcept_no, None)
+        if doc is None:
+            return
+        for token in set(bigrams(normalize_title(doc["report_nm"]))):
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.discard(rcept_no)
+                if not posting:
+                    del self._postings[token]
+        corp_docs = self._by_corp.get(doc["corp_code"])
+        if corp_docs is not None:
+            corp_docs.discard(rcept_no)
+            if not corp_docs:
+                del self._by_corp[doc["corp_code"]]
+
+    def _ordered_docs(self) -> Tuple[List[Dict[str, str]], List[str]]:
+        if self._ordered is None:
+            ordered = sorted(self._docs.values(), key=_order)
+            self._ordered = ordered, [doc["rcept_dt"] for doc in ordered]
+        return self._ordered
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def search(
+        self,
+        query: str,
+        bgn_de: Optional[str] = None,
+        end_de: Optional[str] = None,
+        corp_cls: Optional[str] = None,
+        pblntf_ty: Optional[str] = None,
+        limit: int = 100
+    ) -> Dict[str, Any]:
+        """
+        제목에 검색어가 모두 포함된 공시를 최신순으로 찾습니다.
+
+        검색어는 공백으로 나누어 AND 조건으로 처리하며, 2-gram 후보를 원문 부분 일치로 한 번 더 확인합니다.
+        한 글자 검색어는 2-gram 색인으로 찾을 수 없으므로 (다른 검색어의 후보 또는 기간 내 전체를) 훑어서 확인합니다.
+        """
+        terms = [normalize_title(term) for term in query.split() if term.strip()]
+        with self._lock:
+            self.refresh()
+            posting_sets = [self._postings.get(token, set())
+                            for term in terms if len(term) >= 2 for token in set(bigrams(term))]
+            if posting_sets:
+                posting_sets.sort(key=len)
+                docs = [self._docs[rcept_no] for rcept_no in posting_sets[0]
+                        if all(rcept_no in other for other in posting_sets[1:])]
+                docs = [doc for doc in docs
+                        if (not bgn_de or doc["rcept_dt"] >= bgn_de) and (not end_de or doc["rcept_dt"] <= end_de)]
+                docs.sort(key=_order)
+            else:
+                ordered, dates = self._ordered_docs()
+                lo = bisect.bisect_left(dates, bgn_de) if bgn_de else 0
+                hi = bisect.bisect_right(dates, end_de) if end_de else len(ordered)
+                docs = ordered[lo:hi]
+            indexed_count = len(self._docs)
+
+        total = 0
+        rows: List[Dict[str, Any]] = []
+        for doc in reversed(docs):
+            title = normalize_title(doc["report_nm"])
+            if not all(term in title for term in terms):
+                continue
+            if corp_cls and doc["corp_cls"] != corp_cls:
+                continue
+            if pblntf_ty and doc["pblntf_ty"] != pblntf_ty:
+                continue
+            total += 1
+            if len(rows) < limit:
+                rows.append(dict(doc))
+
+        return {"indexed_count": indexed_count, "total_count": total, "rows": rows}
+
+    def lookup(self, rcept_no: str) -> Optional[Dict[str, Any]]:
+        """접수번호로 로컬에 저장된 공시 행을 찾습니다."""
+        with self._lock:
+            self.refresh()
+            doc = self._docs.get(rcept_no)
+            return dict(doc) if doc is not None else None
+
+    def amendment_chain(self, rcept_no: str) -> Dict[str, Any]:
+        """접수번호가 속한 원문·정정 묶음 (로컬 기준, 정정이 없으면 자기 자신만)"""
+        with self._lock:
+            self.refresh()
+            doc = self._docs.get(rcept_no)
+            corp_docs = [self._docs[other] for other in self._by_corp.get(doc["corp_code"], ())] if doc else []
+        for chain in link_amendments(sorted(corp_docs, key=_order)):
+            versions = [row["rcept_no"] for row in chain]
+            if rcept_no in versions:
+                return {"versions": versions, "effective": effective_version(chain)["rcept_no"]}
+        return {"versions": [rcept_no], "effective": rcept_no}
+
+    def corporations(self) -> Dict[str, Dict[str, str]]:
+        """고유번호 → 가장 최근 공시 기준 회사명·종목코드·법인구분 (로컬에 공시가 있는 회사만)"""
+        with self._lock:
+            self.refresh()
+            if self._corporations is None:
+                corporations = {}
+                for corp_code, rcept_nos in self._by_corp.items():
+                    if not corp_code:
+                        continue
+                    latest = max((self._docs[rcept_no] for rcept_no in rcept_nos), key=_order)
+                    corporations[corp_code] = {column: latest[column] for column in ("corp_name", "stock_code", "corp_cls")}
+                self._corporations = corporations
+            return self._corporations
+
+
+_indexes: Dict[str, DisclosureTitleIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_title_index(config: Optional[OpenDartConfig] = None) -> DisclosureTitleIndex:
+    """설정의 data_dir 기준 공유 DisclosureTitleIndex 인스턴스를 반환합니다."""
+    config = config or opendart_config
+    with _indexes_lock:
+        index = _indexes.get(config.data_dir)
+        if index is None:
+            index = _indexes[config.data_dir] = DisclosureTitleIndex(Path(config.data_dir))
+        return index
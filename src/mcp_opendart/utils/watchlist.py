@@ -0,0 +1,174 @@
+import itertools
+import logging
+import threading
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from pydantic import AnyUrl
+
+from .disclosure_poller import disclosure_poller
+
+logger = logging.getLogger("mcp-opendart")
+
+# 구독별로 보관하는 최근 일치 공시 수 (리소스 조회용)
+RECENT_FILINGS = 100
+
+WATCHLIST_URI = "opendart://watchlist/{subscription_id}"
+
+
+@dataclass
+class Subscription:
+    """세션 하나의 관심 기업 구독"""
+
+    id: str
+    session: Any
+    corp_codes: Set[str]
+    report_keywords: List[str] = field(default_factory=list)
+    recent: Deque[Dict[str, Any]] = field(default_factory=lambda: deque(maxlen=RECENT_FILINGS))
+
+    @property
+    def uri(self) -> str:
+        return WATCHLIST_URI.format(subscription_id=self.id)
+
+    def matches_report(self, report_nm: str) -> bool:
+        return not self.report_keywords or any(keyword in report_nm for keyword in self.report_keywords)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "subscription_id": self.id,
+            "uri": self.uri,
+            "corp_codes": sorted(self.corp_codes),
+            "report_keywords": self.report_keywords,
+            "recent_count": len(self.recent),
+        }
+
+
+class Watchlist:
+    """
+    관심 기업 구독 목록
+
+    모든 구독은 하나의 신규 공시 폴러 스트림을 공유하며, corp_code → 구독 역색인으로
+    공시 한 건당 해당 기업을 구독한 세션만 찾아 알림을 보냅니다.
+    알림은 MCP 로그 메시지(notifications/message)와 구독 리소스 변경(notifications/resources/updated)으로 전달됩니다.
+    세션이 닫히면 그 세션의 구독은 모두 해제됩니다.
+    """
+
+    def __init__(self, poller: Any):
+        self.poller = poller
+        self._subscriptions: Dict[str, Subscription] = {}
+        self._by_corp: Dict[str, Set[str]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._unsubscribe_poller: Optional[Any] = None
+        self._sessions: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+    def add(self, session: Any, corp_codes: List[str], report_keywords: Optional[List[str]], api: Any) -> Subscription:
+        """구독을 등록합니다. 첫 구독이면 폴러를 시작합니다."""
+        with self._lock:
+            subscription = Subscription(
+                id=f"w{next(self._ids)}",
+                session=session,
+                corp_codes=set(corp_codes),
+                report_keywords=report_keywords or [],
+            )
+            self._subscriptions[subscription.id] = subscription
+            for corp_code in subscription.corp_codes:
+                self._by_corp.setdefault(corp_code, set()).add(subscription.id)
+            first = len(self._subscriptions) == 1
+
+        self._watch_session(session)
+        if first:
+            self._unsubscribe_poller = self.poller.subscribe(self.on_filings)
+            self.poller.start(api)
+        logger.info(f"👀 관심 기업 구독 등록 [{subscription.id}] {len(subscription.corp_codes)}개 기업")
+        return subscription
+
+    def remove(self, subscription_id: str) -> bool:
+        """구독을 해제합니다. 마지막 구독이면 폴러 사용을 끝냅니다."""
+        with self._lock:
+            subscription = self._subscriptions.pop(subscription_id, None)
+            if subscription is None:
+                return False
+            for corp_code in subscription.corp_codes:
+                ids = self._by_corp.get(corp_code)
+                if ids is not None:
+                    ids.discard(subscription_id)
+                    if not ids:
+                        del self._by_corp[corp_code]
+            last = not self._subscriptions
+
+        if last and self._unsubscribe_poller is not None:
+            self._unsubscribe_poller()
+            self._unsubscribe_poller = None
+            self.poller.stop()
+        logger.info(f"👀 관심 기업 구독 해제 [{subscription_id}]")
+        return True
+
+    def remove_session(self, session: Any) -> int:
+        """세션의 구독을 모두 해제하고 해제한 수를 반환합니다."""
+        subscriptions = self.for_session(session)
+        for subscription in subscriptions:
+            self.remove(subscription.id)
+        return len(subscriptions)
+
+    def _watch_session(self, session: Any) -> None:
+        """
+        세션이 닫힐 때 구독을 정리하도록 등록합니다.
+
+        MCP 세션은 종료 시 내부 AsyncExitStack을 닫으므로 여기에 정리 콜백을 붙입니다.
+        종료 스택이 없는 세션은 기존처럼 알림 전송이 실패할 때 정리됩니다.
+        """
+        exit_stack = getattr(session, "_exit_stack", None)
+        with self._lock:
+            if exit_stack is None or session in self._sessions:
+                return
+            self._sessions.add(session)
+
+        async def cleanup() -> None:
+            removed = self.remove_session(session)
+            if removed:
+                logger.info(f"👀 세션 종료로 관심 기업 구독 {removed}건 해제")
+
+        exit_stack.push_async_callback(cleanup)
+
+    def get(self, subscription_id: str) -> Optional[Subscription]:
+        with self._lock:
+            return self._subscriptions.get(subscription_id)
+
+    def for_session(self, session: Any) -> List[Subscription]:
+        with self._lock:
+            return [s for s in self._subscriptions.values() if s.session is session]
+
+    def match(self, filings: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """공시 목록을 구독별로 분류합니다. (corp_code 역색인 사용)"""
+        matched: Dict[str, List[Dict[str, Any]]] = {}
+        with self._lock:
+            for filing in filings:
+                for subscription_id in self._by_corp.get(filing.get("corp_code", ""), ()):
+                    if self._subscriptions[subscription_id].matches_report(filing.get("report_nm", "")):
+                        matched.setdefault(subscription_id, []).append(filing)
+        return matched
+
+    async def on_filings(self, filings: List[Dict[str, Any]]) -> None:
+        """폴러 구독자: 일치하는 세션에 새 공시를 전달합니다."""
+        for subscription_id, matched in self.match(filings).items():
+            subscription = self.get(subscription_id)
+            if subscription is None:
+                continue
+            subscription.recent.extend(matched)
+            try:
+                await subscription.session.send_log_message(
+                    level="info",
+                    data={"event": "new_disclosures", "subscription_id": subscription_id, "filings": matched},
+                    logger="opendart.watchlist",
+                )
+                await subscription.session.send_resource_updated(AnyUrl(subscription.uri))
+            except Exception as e:
+                # 세션이 끊긴 경우 구독 정리
+                logger.warning(f"관심 기업 알림 전송 실패 [{subscription_id}], 구독을 해제합니다: {e}")
+                self.remove(subscription_id)
+
+
+watchlist = Watchlist(disclosure_poller)
@@ -0,0 +1,287 @@
+import asyncio
+import json
+import logging
+import threading
+import xml.etree.ElementTree as ET
+import zipfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+from .archive_store import atomic_write
+from .parse_pool import parse_pool
+
+logger = logging.getLogger("mcp-opendart")
+
+# 팩트 테이블 형식이 바뀌면 올려서 기존 캐시를 무효화합니다
+FACT_TABLE_VERSION = 1
+
+# 텍스트 블록(주석 HTML 등)은 이 길이까지만 보관합니다
+MAX_VALUE_CHARS = 500
+
+_MEMORY_CACHE_SIZE = 8
+
+XBRLI = "{http://www.xbrl.org/2003/instance}"
+XBRLDI = "{http://xbrl.org/2006/xbrldi}"
+
+
+def _qname(tag: str, prefixes: Dict[str, str]) -> str:
+    """'{uri}Local' → 'prefix:Local'"""
+    if tag.startswith("{"):
+        uri, local = tag[1:].split("}", 1)
+        prefix = prefixes.get(uri)
+        return f"{prefix}:{local}" if prefix else local
+    return tag
+
+
+class _Interner:
+    """문자열 → 정수 id (사전 인코딩)"""
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def id(self, value: str) -> int:
+        idx = self._ids.get(value)
+        if idx is None:
+            idx = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+
+def _parse_context(elem: ET.Element) -> Tuple[str, str]:
+    instant = elem.findtext(f"{XBRLI}period/{XBRLI}instant")
+    if instant:
+        period = instant.strip()
+    else:
+        start = (elem.findtext(f"{XBRLI}period/{XBRLI}startDate") or "").strip()
+        end = (elem.findtext(f"{XBRLI}period/{XBRLI}endDate") or "").strip()
+        period = f"{start}~{end}" if start else end
+    dims = [
+        f"{member.get('dimension')}={(member.text or '').strip()}"
+        for member in elem.iter(f"{XBRLDI}explicitMember")
+    ]
+    return period, ";".join(dims)
+
+
+def _parse_unit(elem: ET.Element) -> str:
+    def measures(path: str) -> str:
+        return "*".join((m.text or "").strip().split(":")[-1] for m in elem.iterfind(path))
+
+    divide = elem.find(f"{XBRLI}divide")
+    if divide is not None:
+        return f"{measures(f'{XBRLI}divide/{XBRLI}unitNumerator/{XBRLI}measure')}/" \
+               f"{measures(f'{XBRLI}divide/{XBRLI}unitDenominator/{XBRLI}measure')}"
+    return measures(f"{XBRLI}measure")
+
+
+def parse_xbrl_instance(source: IO[bytes]) -> Dict[str, Any]:
+    """
+    XBRL 인스턴스 문서를 iterparse로 순차 처리하여 평면 팩트 테이블을 만듭니다.
+
+    최상위 자식 요소는 처리 직후 제거하므로 문서 크기와 무관하게 메모리 사용량이 일정합니다.
+    개념·단위 이름은 사전 인코딩하고, 팩트는 열 단위 배열로 보관합니다.
+
+    Returns:
+        Dict[str, Any]: concepts, units, contexts(id, period, dims), facts(열 배열)
+    """
+    prefixes: Dict[str, str] = {}
+    concepts, units = _Interner(), _Interner()
+    contexts: Dict[str, int] = {}
+    context_rows: List[List[str]] = []
+    unit_ids: Dict[str, int] = {}
+    facts: Dict[str, List[Any]] = {"concept": [], "context": [], "unit": [], "decimals": [], "value": []}
+
+    def add_fact(elem: ET.Element) -> None:
+        context_ref = elem.get("contextRef")
+        if context_ref is None:
+            for child in elem:  # tuple
+                add_fact(child)
+            return
+        value = (elem.text or "").strip()
+        if len(value) > MAX_VALUE_CHARS:
+            value = value[:MAX_VALUE_CHARS] + "…"
+        facts["concept"].append(concepts.id(_qname(elem.tag, prefixes)))
+        facts["context"].append(context_ref)
+        facts["unit"].append(elem.get("unitRef"))
+        facts["decimals"].append(elem.get("decimals"))
+        facts["value"].append(value)
+
+    depth = 0
+    root: Optional[ET.Element] = None
+    for event, item in ET.iterparse(source, events=("start-ns", "start", "end")):
+        if event == "start-ns":
+            prefix, uri = item  # type: ignore[misc]
+            prefixes.setdefault(uri, prefix)
+            continue
+        elem: ET.Element = item  # type: ignore[assignment]
+        if event == "start":
+            if root is None:
+                root = elem
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth != 1:
+            continue
+        if elem.tag == f"{XBRLI}context":
+            contexts[elem.get("id", "")] = len(context_rows)
+            context_rows.append([elem.get("id", ""), *_parse_context(elem)])
+        elif elem.tag == f"{XBRLI}unit":
+            unit_ids[elem.get("id", "")] = units.id(_parse_unit(elem))
+        elif elem.get("contextRef") is not None or len(elem):
+            add_fact(elem)
+        if root is not None:
+            root.clear()
+
+    # contextRef/unitRef를 정수 id로 변환 (context가 팩트 뒤에 나오는 문서도 처리)
+    facts["context"] = [contexts.get(ref, -1) for ref in facts["context"]]
+    facts["unit"] = [unit_ids.get(ref, -1) if ref else -1 for ref in facts["unit"]]
+
+    return {
+        "version": FACT_TABLE_VERSION,
+        "concepts": concepts.values,
+        "units": units.values,
+        "contexts": context_rows,
+        "facts": facts,
+    }
+
+
+def find_instance_member(zip_file: zipfile.ZipFile) -> Optional[str]:
+    """XBRL 압축파일에서 인스턴스 문서(.xbrl) 이름을 찾습니다."""
+    members = [name for name in zip_file.namelist() if name.lower().endswith(".xbrl")]
+    return max(members, key=lambda name: zip_file.getinfo(name).file_size) if members else None
+
+
+def parse_xbrl_zip(zip_path: str) -> Dict[str, Any]:
+    """XBRL 압축파일의 인스턴스 문서를 풀지 않고 바로 스트리밍 파싱합니다."""
+    with zipfile.ZipFile(zip_path) as zip_file:
+        member = find_instance_member(zip_file)
+        if member is None:
+            raise ValueError("XBRL 인스턴스 문서(.xbrl)를 찾을 수 없습니다.")
+        with zip_file.open(member) as source:
+            return parse_xbrl_instance(source)
+
+
+class FactTableCache:
+    """
+    rcept_no별 팩트 테이블 캐시
+
+    파싱 결과는 <data_dir>/xbrl/<rcept_no>_<reprt_code>.facts.json에 저장되고
+    최근 사용분은 메모리에 유지됩니다.
+    """
+
+    def __init__(self, max_items: int = _MEMORY_CACHE_SIZE):
+        self.max_items = max_items
+        self._items: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _recall(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                return self._items[key]
+        return None
+
+    def _remember(self, key: str, table: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self._items[key] = table
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+        return table
+
+    def get(self, cache_path: Path, zip_path: str) -> Dict[str, Any]:
+        table = self._recall(str(cache_path))
+        if table is not None:
+            return table
+
+        table = self._load(cache_path)
+        if table is None:
+            logger.info(f"🧾 XBRL 팩트 테이블 생성: {cache_path.name}")
+            table = parse_pool.run("xbrl", parse_xbrl_zip, zip_path)
+            self._save(cache_path, table)
+        return self._remember(str(cache_path), table)
+
+    async def get_async(self, cache_path: Path, zip_path: str) -> Dict[str, Any]:
+        """get과 같으며, 파싱은 parse_pool.run_async로 기다립니다. (호출 태스크가 취소되면 대기 중인 파싱도 취소)"""
+        table = self._recall(str(cache_path))
+        if table is not None:
+            return table
+
+        table = await asyncio.to_thread(self._load, cache_path)
+        if table is None:
+            logger.info(f"🧾 XBRL 팩트 테이블 생성: {cache_path.name}")
+            table = await parse_pool.run_async("xbrl", parse_xbrl_zip, zip_path)
+            await asyncio.to_thread(self._save, cache_path, table)
+        return self._remember(str(cache_path), table)
+
+    @staticmethod
+    def _load(cache_path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                table: Dict[str, Any] = json.load(f)
+            if table.get("version") == FACT_TABLE_VERSION:
+                return table
+        except (OSError, ValueError):
+            pass
+        return None
+
+    @staticmethod
+    def _save(cache_path: Path, table: Dict[str, Any]) -> None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(cache_path, json.dumps(table, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+fact_table_cache = FactTableCache()
+
+
+def query_facts(
+    table: Dict[str, Any],
+    concept: Optional[str] = None,
+    period: Optional[str] = None,
+    include_dimensions: bool = False,
+    limit: int = 200
+) -> Dict[str, Any]:
+    """
+    팩트 테이블에서 개념명(부분 일치)·기간(접두어 일치)으로 팩트를 찾습니다.
+
+    Args:
+        concept: 개념명 일부 (예: "Revenue", "ifrs-full:Assets")
+        period: 기간 접두어 (예: "2023", "2023-12-31", "2023-01-01~2023-12-31")
+        include_dimensions: 차원(세그먼트 등)이 있는 팩트 포함 여부
+        limit: 최대 반환 건수
+    """
+    concepts, units, contexts = table["concepts"], table["units"], table["contexts"]
+    facts = table["facts"]
+
+    # 개념·기간 조건은 사전(고유값) 단위로 먼저 평가
+    wanted = concept.lower() if concept else None
+    concept_ok = [wanted is None or wanted in name.lower() for name in concepts]
+    context_ok = [
+        (period is None or ctx[1].startswith(period) or ctx[1].split("~")[-1].startswith(period))
+        and (include_dimensions or not ctx[2])
+        for ctx in contexts
+    ]
+
+    rows: List[Dict[str, Any]] = []
+    total = 0
+    for c, ctx, unit, decimals, value in zip(
+        facts["concept"], facts["context"], facts["unit"], facts["decimals"], facts["value"]
+    ):
+        if not concept_ok[c] or ctx < 0 or not context_ok[ctx]:
+            continue
+        total += 1
+        if len(rows) >= limit:
+            continue
+        row = {
+            "concept": concepts[c],
+            "period": contexts[ctx][1],
+            "unit": units[unit] if unit >= 0 else None,
+            "decimals": decimals,
+            "value": value,
+        }
+        if contexts[ctx][2]:
+            row["dims"] = contexts[ctx][2]
+        rows.append(row)
+
+    return {"total": total, "facts": rows}
@@ -0,0 +1,4 @@
+import os
+
+# 패키지 import 시 서버 설정을 읽으므로 테스트용 API 키를 지정합니다
+os.environ.setdefault("OPENDART_API_KEY", "test")
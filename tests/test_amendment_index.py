@@ -0,0 +1,55 @@
+from mcp_opendart.utils.amendment_index import latest_versions, link_amendments
+
+
+def _row(rcept_no, report_nm, flr_nm, rm=""):
+    return {"rcept_no": rcept_no, "corp_code": "00126380", "report_nm": report_nm, "flr_nm": flr_nm, "rm": rm}
+
+
+def _chains(rows):
+    return sorted([row["rcept_no"] for row in chain] for chain in link_amendments(rows))
+
+
+def test_amendment_links_to_original_of_same_filer():
+    rows = [
+        _row("20240102000001", "임원ㆍ주요주주특정증권등소유상황보고서", "홍길동", rm="정"),
+        _row("20240105000001", "임원ㆍ주요주주특정증권등소유상황보고서", "김철수"),
+        _row("20240110000001", "[기재정정]임원ㆍ주요주주특정증권등소유상황보고서", "홍길동"),
+    ]
+
+    assert _chains(rows) == [["20240102000001", "20240110000001"], ["20240105000001"]]
+    latest = latest_versions(rows)
+    assert [row["rcept_no"] for row in latest] == ["20240105000001", "20240110000001"]
+    assert latest[1]["versions"] == ["20240102000001", "20240110000001"]
+
+
+def test_ambiguous_amendment_is_not_linked():
+    rows = [
+        _row("20240102000001", "주요사항보고서(자기주식취득결정)", "삼성전자"),
+        _row("20240105000001", "주요사항보고서(자기주식취득결정)", "삼성전자"),
+        _row("20240110000001", "[기재정정]주요사항보고서(자기주식취득결정)", "삼성전자"),
+    ]
+
+    assert _chains(rows) == [["20240102000001"], ["20240105000001"], ["20240110000001"]]
+    assert len(latest_versions(rows)) == 3
+
+
+def test_amendment_marker_disambiguates_recurring_reports():
+    rows = [
+        _row("20240102000001", "주요사항보고서(자기주식취득결정)", "삼성전자", rm="정"),
+        _row("20240105000001", "주요사항보고서(자기주식취득결정)", "삼성전자"),
+        _row("20240110000001", "[기재정정]주요사항보고서(자기주식취득결정)", "삼성전자"),
+    ]
+
+    assert _chains(rows) == [["20240102000001", "20240110000001"], ["20240105000001"]]
+
+
+def test_attachment_amendment_keeps_body_version():
+    rows = [
+        _row("20240102000001", "사업보고서 (2023.12)", "삼성전자", rm="정"),
+        _row("20240110000001", "[기재정정]사업보고서 (2023.12)", "삼성전자", rm="정"),
+        _row("20240115000001", "[첨부추가]사업보고서 (2023.12)", "삼성전자"),
+    ]
+
+    latest = latest_versions(rows)
+    assert [row["rcept_no"] for row in latest] == ["20240110000001"]
+    assert latest[0]["versions"] == ["20240102000001", "20240110000001", "20240115000001"]